@@ -0,0 +1,75 @@
+"""Benchmark of the validation with the ifc instances validated on several threads
+
+    Validates the rules file on the ifc file with each count of threads
+    and reports the best time of the repetitions and the speedup to one thread.
+    On standard CPython builds the threads only run concurrently while the GIL is released,
+    like in C++ calls of ifcopenshell releasing it, on free-threaded builds they always do.
+
+    Usage::
+
+        python benchmarks/threads_benchmark.py "rulesfiles/fzk haus rules.yml" \\
+            ifcfiles/FZK-Haus.ifc --threads 1 2 4 8
+"""
+import argparse
+import os
+import platform
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+import yaml
+
+from ifc_data_checker import rules
+from ifc_data_checker.validation import ReportLevel
+from ifc_data_checker.validation import ValidationOptions
+
+
+def is_gil_enabled() -> bool:
+    """Checks if the GIL is enabled, always on builds before free-threaded CPython"""
+    is_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_enabled is None else is_enabled()
+
+
+def benchmark(rules_definition: List[dict], ifc_file: str, threads: int, repeat: int,
+              model_backend: str) -> float:
+    """Validates the rules `repeat` times on `threads` threads, returns the best time"""
+    validation_options = ValidationOptions(report_level=ReportLevel.SUMMARY,
+                                           model_backend=model_backend, threads=threads)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rules.validate(rules_definition, ifc_file, validation_options)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    """Runs the benchmark for each count of threads"""
+    parser = argparse.ArgumentParser(prog="threads_benchmark")
+    parser.add_argument("rules", help="The path to the rules file.")
+    parser.add_argument("ifc", help="The path to the ifc file.")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8], metavar="N",
+                        help="The counts of threads to benchmark.")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="The count of validations per count of threads.")
+    parser.add_argument("--model-backend", choices=["ifcopenshell", "lazy"],
+                        default="ifcopenshell", help="The backend to open the ifc file.")
+    args = parser.parse_args()
+    with open(args.rules) as rules_file:
+        rules_definition = yaml.safe_load(rules_file)["rules"]
+    print(f"{platform.python_implementation()} {platform.python_version()}, "
+          f"GIL {'enabled' if is_gil_enabled() else 'disabled'}, {os.cpu_count()} cpus")
+    print(f"{'threads':>7} {'time (s)':>9} {'speedup':>8}")
+    baseline = None
+    for threads in args.threads:
+        best_time = benchmark(rules_definition, args.ifc, threads, args.repeat,
+                              args.model_backend)
+        baseline = baseline or best_time
+        print(f"{threads:>7} {best_time:>9.3f} {baseline / best_time:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,31 @@
 """init ifc_data_checker"""
 import argparse
+import functools
 import json
+import os
+import sys
+from typing import Iterable, Iterator, List
+
 import jsonschema
 import yaml
 
+from ifc_data_checker import backends
+from ifc_data_checker import definitions
 from ifc_data_checker import rules
 from ifc_data_checker import report
+from ifc_data_checker.sampling import Sampling
+from ifc_data_checker.validation import ReportLevel
+from ifc_data_checker.validation import ValidationOptions
+from ifc_data_checker.validation import ValidationResult
 
 
 def get_json_rules(rules_file: str):
-    """Get the yaml by filename"""
+    """Get the yaml by filename, with the paths of the allowed values files
+    relative to the rules file"""
     with open(rules_file) as yaml_file:
-        return yaml.safe_load(yaml_file)
+        rules_json = yaml.safe_load(yaml_file)
+    return definitions.resolve_allowed_values_files(
+        rules_json, os.path.dirname(rules_file))
 
 
 def get_json_rules_schema(rules_schema_file: str):
@@ -26,33 +40,164 @@ def print_help():
     print(help_file.read())
 
 
-def check(rules_file, ifc_file, report_file, no_rulesfile_validation):
-    """execute ifc data checker"""
-    if report_file:
-        report_strategy = report.create_validation_report_file
-    else:
-        report_strategy = report.create_validation_report_console
+report_strategies = {
+    ("text", False): report.create_validation_report_console,
+    ("text", True): report.create_validation_report_file,
+    ("json", False): report.create_validation_report_json_console,
+    ("json", True): report.create_validation_report_json_file,
+    ("columnar", False): report.create_validation_report_columnar_file,
+    ("columnar", True): report.create_validation_report_columnar_file,
+    ("junit", False): report.create_validation_report_junit_console,
+    ("junit", True): report.create_validation_report_junit_file,
+}
+
+
+def track_invalid_rules(validated_rules: Iterable[rules.Rule],
+                        invalid_rules: List[rules.Rule]) -> Iterator[rules.Rule]:
+    """Passes on the validated rules and collects the not valid rules into `invalid_rules`"""
+    for validated_rule in validated_rules:
+        if validated_rule.validation_information.validation_result != ValidationResult.VALID:
+            invalid_rules.append(validated_rule)
+        yield validated_rule
+
+
+def check(rules_file, ifc_file, report_file, no_rulesfile_validation, report_format="text",
+          junit_failing_instances=False, report_level="full", max_failures_per_rule=None,
+          fail_fast=False, sampling=None, model_backend="ifcopenshell",
+          snapshot_directory=None, threads=1, processes=1, profile_file=None,
+          report_directory=None) -> int:
+    """execute ifc data checker
+
+        The `rules_file` is the path of one rules file or a list of paths of rules files.
+        The ifc file is opened once for all the rules files and
+        a validation report is created per rules file.
+        The validation report files are written to the `report_directory`,
+        if None to the working directory.
+
+        Returns:
+            int:
+                The count of the not valid rules.
+    """
+    report_strategy = report_strategies[(report_format, bool(report_file))]
+    if report_format == "junit":
+        report_strategy = functools.partial(report_strategy,
+                                            failing_instances=junit_failing_instances)
+    if report_directory is not None:
+        report_strategy = functools.partial(report_strategy, report_directory=report_directory)
 
-    rules_json = get_json_rules(rules_file)
+    rules_files = [rules_file] if isinstance(rules_file, str) else list(rules_file)
+    rules_jsons = [get_json_rules(rules_file) for rules_file in rules_files]
     if not no_rulesfile_validation:
-        rules_schema = get_json_rules_schema("ifc_data_checker/rules.schema.json")
-        jsonschema.validate(instance=rules_json, schema=rules_schema)
+        rules_schema = get_json_rules_schema(
+            os.path.join(os.path.dirname(__file__), "rules.schema.json"))
+        for rules_json in rules_jsons:
+            jsonschema.validate(instance=rules_json, schema=rules_schema)
 
-    validated_rules = rules.validate(rules_json["rules"], ifc_file)
-    report_strategy(validated_rules, rules_file, ifc_file)
+    invalid_rules = []
+    validation_options = ValidationOptions(report_level=ReportLevel(report_level),
+                                           max_failures_per_rule=max_failures_per_rule,
+                                           fail_fast=fail_fast,
+                                           sampling=sampling,
+                                           model_backend=model_backend,
+                                           snapshot_directory=snapshot_directory,
+                                           threads=threads,
+                                           processes=processes,
+                                           profile_file=profile_file)
+    validated_rules_files = rules.iter_validate_files(
+        [rules_json["rules"] for rules_json in rules_jsons], ifc_file, validation_options)
+    for rules_file, validated_rules in zip(rules_files, validated_rules_files):
+        report_strategy(track_invalid_rules(validated_rules, invalid_rules), rules_file, ifc_file)
+    return len(invalid_rules)
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(prog='ifc_data_checker')
     parser.add_argument(
-        "rules", help="The path to the rules file.")
+        "rules", nargs="+",
+        help="The path to the rules file. With several rules files, the ifc file "
+             "is opened once and a validation report is created per rules file.")
     parser.add_argument(
         "ifc", help="The path to the ifc file.")
     parser.add_argument("--report-file", action="store_true",
                         help="Create a validation report file, "
                              "instead of showing the validation report on the console.")
+    parser.add_argument("--report-dir", metavar="DIR",
+                        help="Create the validation report file in DIR, "
+                             "instead of the working directory. Requires --report-file.")
     parser.add_argument("--no-rulesfile-validation", action="store_true",
                         help="Disable validation of the rules file.")
+    parser.add_argument("--report-format", choices=["text", "json", "columnar", "junit"],
+                        default="text",
+                        help="The format of the validation report. "
+                             "json writes one JSON record per line "
+                             "for each rule, instance and constraint. "
+                             "columnar writes the records into a compact columnar "
+                             "report file. junit writes a JUnit XML testsuite per rule.")
+    parser.add_argument("--junit-failing-instances", action="store_true",
+                        help="Add a testcase per failing instance to the JUnit XML report.")
+    parser.add_argument("--exit-code", action="store_true",
+                        help="Exit with code 1, if a rule is not valid.")
+    parser.add_argument("--report-level", choices=[level.value for level in ReportLevel],
+                        default=ReportLevel.FULL.value,
+                        help="What to report. summary reports the rules only, "
+                             "failures the failing instances with their failing constraints "
+                             "and full everything.")
+    parser.add_argument("--max-failures-per-rule", type=int, metavar="N",
+                        help="Stop the validation of a rule after N failed instances.")
+    parser.add_argument("--fail-fast", action="store_true",
+                        help="Stop the validation of a rule after the first failed instance "
+                             "and stop the validation after the first not valid rule.")
+    parser.add_argument("--sample", metavar="N|P%",
+                        help="Validate a random sample of N instances or P percent "
+                             "of the instances of each rule.")
+    parser.add_argument("--sample-seed", type=int, default=0,
+                        help="The seed of the random sample.")
+    parser.add_argument("--sample-type-objects", action="store_true",
+                        help="Cover each type object of the instances by the sample. "
+                             "Requires --sample.")
+    parser.add_argument("--model-backend", choices=list(backends.model_backends),
+                        default="ifcopenshell",
+                        help="The backend to open the ifc file. lazy memory-maps the ifc file "
+                             "and decodes the instances on demand.")
+    parser.add_argument("--snapshot-dir", metavar="DIR",
+                        help="Open the ifc file from its snapshot in DIR and write the snapshot "
+                             "after the validation. Requires --model-backend lazy.")
+    parser.add_argument("--threads", type=int, default=1, metavar="N",
+                        help="Validate the instances of each rule on N threads.")
+    parser.add_argument("--processes", type=int, default=1, metavar="N",
+                        help="Validate the instances of each rule on N worker processes "
+                             "sharing the scanned ifc file. Requires --model-backend lazy.")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="Validate the instances with the longest validation times "
+                             "in FILE first on the threads or processes and write "
+                             "the validation times of the instances to FILE.")
     args = parser.parse_args()
-    check(args.rules, args.ifc, args.report_file,
-          args.no_rulesfile_validation)
+    if args.threads < 1:
+        parser.error("--threads needs at least 1 thread")
+    if args.max_failures_per_rule is not None and args.max_failures_per_rule < 1:
+        parser.error("--max-failures-per-rule needs at least 1 failed instance")
+    if args.processes < 1:
+        parser.error("--processes needs at least 1 process")
+    if args.processes > 1 and args.threads > 1:
+        parser.error("--processes can not be combined with --threads")
+    if args.processes > 1 and args.model_backend != "lazy":
+        parser.error("--processes requires --model-backend lazy")
+    if args.snapshot_dir is not None and args.model_backend != "lazy":
+        parser.error("--snapshot-dir requires --model-backend lazy")
+    if args.report_dir is not None and not args.report_file:
+        parser.error("--report-dir requires --report-file")
+    if args.sample_type_objects and not args.sample:
+        parser.error("--sample-type-objects requires --sample")
+    try:
+        args_sampling = Sampling(args.sample, args.sample_seed,
+                                 args.sample_type_objects) if args.sample else None
+    except ValueError as error:
+        parser.error(str(error))
+    invalid_rules_count = check(args.rules, args.ifc, args.report_file,
+                                args.no_rulesfile_validation, args.report_format,
+                                args.junit_failing_instances, args.report_level,
+                                args.max_failures_per_rule, args.fail_fast, args_sampling,
+                                args.model_backend, args.snapshot_dir, args.threads,
+                                args.processes, args.profile, args.report_dir)
+    if args.exit_code and invalid_rules_count:
+        sys.exit(1)
@@ -0,0 +1,184 @@
+"""Model backends to access the ifc models and their ifc instances"""
+import abc
+from typing import Any, List, Optional, Tuple
+
+import ifcopenshell
+from ifcopenshell import ifcopenshell_wrapper
+
+from ifc_data_checker import snapshot
+from ifc_data_checker import step
+
+_active_backend = None
+
+
+class ModelBackend(abc.ABC):
+    """The model backend base class.
+
+        The rules, the path operators and the constraint checks access the ifc models
+        and their ifc instances through the active model backend only, so the validation
+        is not tied to the entity instances of ifcopenshell.
+        Every model backend implementation need to inherit from this class
+        :class:`ModelBackend`. By default, the ifc instances are accessed
+        by the interface of the entity instances of ifcopenshell.
+    """
+
+    @abc.abstractmethod
+    def open(self, ifc_file: str):
+        """Opens the ifc file.
+
+            Args:
+                ifc_file (str):
+                    The ifc file path.
+
+            Returns:
+                The ifc model of the ifc file.
+        """
+
+    def finish(self, ifc_model):
+        """Called after all the rules are validated on the ifc model"""
+
+    def close(self, ifc_model):
+        """Called after the validation of the ifc model, even if the validation failed"""
+
+    def by_type(self, ifc_model, ifc_class: str) -> List[Any]:
+        """Gets the ifc instances of the `ifc_class`, including its subtypes"""
+        return list(ifc_model.by_type(ifc_class))
+
+    def get_attribute(self, ifc_instance, attribute_name: str) -> Any:
+        """Gets the value of the attribute or the inverse attribute of the ifc instance
+
+            Raises:
+                AttributeError:
+                    If the ifc instance has no attribute `attribute_name`.
+        """
+        return getattr(ifc_instance, attribute_name)
+
+    def has_attribute(self, ifc_instance, attribute_name: str) -> bool:
+        """Checks if the ifc instance has the attribute `attribute_name`"""
+        return hasattr(ifc_instance, attribute_name)
+
+    def inverse_reference(self, ifc_model, ifc_class: str,
+                          attribute_name: str) -> Optional[Tuple[str, str]]:
+        """Gets the entity reference and the attribute reference of the inverse attribute
+            `attribute_name` of the `ifc_class`, to build inverse tables over the ifc model.
+
+            Returns:
+                Optional[Tuple[str, str]]:
+                    The referencing ifc class and its referencing attribute,
+                    None if the attribute is no inverse attribute or the backend
+                    resolves the inverse attributes on its own.
+        """
+        # pylint: disable=unused-argument
+        return None
+
+    def is_entity(self, value) -> bool:
+        """Checks if the value is an ifc instance"""
+        return hasattr(value, "is_a")
+
+    def is_a(self, ifc_instance, ifc_class: str = None):
+        """Gets the ifc class or checks if the ifc instance is of the `ifc_class`,
+            including its subtypes"""
+        if ifc_class is None:
+            return ifc_instance.is_a()
+        return ifc_instance.is_a(ifc_class)
+
+    def id(self, ifc_instance) -> int:
+        """Gets the id of the ifc instance in its ifc model"""
+        # pylint: disable=invalid-name
+        return ifc_instance.id()
+
+
+class IfcOpenShellBackend(ModelBackend):
+    """The model backend of the ifc models of ifcopenshell, the default model backend"""
+
+    def open(self, ifc_file: str):
+        """Opens the ifc file with ifcopenshell"""
+        return ifcopenshell.open(ifc_file)
+
+    def inverse_reference(self, ifc_model, ifc_class: str,
+                          attribute_name: str) -> Optional[Tuple[str, str]]:
+        """Gets the references of the inverse attribute from the ifc schema of the ifc model"""
+        try:
+            declaration = ifcopenshell_wrapper.schema_by_name(
+                ifc_model.schema).declaration_by_name(ifc_class).as_entity()
+        except (AttributeError, RuntimeError, IndexError):
+            return None
+        if declaration is None:
+            return None
+        for inverse_attribute in declaration.all_inverse_attributes():
+            if inverse_attribute.name() == attribute_name:
+                return (inverse_attribute.entity_reference().name(),
+                        inverse_attribute.attribute_reference().name())
+        return None
+
+
+class LazyStepBackend(ModelBackend):
+    """The model backend of the memory-mapped :class:`ifc_data_checker.step.LazyStepModel`
+
+        The lazy model builds the inverse tables on its own.
+    """
+
+    def open(self, ifc_file: str) -> step.LazyStepModel:
+        """Opens the ifc file as memory-mapped model with lazily decoded ifc instances"""
+        return step.open_model(ifc_file)
+
+    def close(self, ifc_model: step.LazyStepModel):
+        """Closes the memory map of the ifc file"""
+        ifc_model.close()
+
+
+class SnapshotBackend(LazyStepBackend):
+    """The model backend of the :class:`ifc_data_checker.snapshot.SnapshotStepModel`,
+        the lazy model backend with snapshots of the scanned ifc files"""
+
+    def __init__(self, snapshot_directory: str):
+        """Constructor
+
+            Args:
+                snapshot_directory (str):
+                    The directory of the snapshot files.
+        """
+        self.snapshot_directory = snapshot_directory
+
+    def open(self, ifc_file: str) -> snapshot.SnapshotStepModel:
+        """Opens the ifc file from its snapshot, if the ifc file did not change"""
+        return snapshot.SnapshotStepModel(ifc_file, self.snapshot_directory)
+
+    def finish(self, ifc_model: snapshot.SnapshotStepModel):
+        """Writes the snapshot of the ifc model with the inverse tables built while validating"""
+        ifc_model.save()
+
+
+model_backends = {
+    "ifcopenshell": IfcOpenShellBackend(),
+    "lazy": LazyStepBackend()
+}
+"""The model backends by their name"""
+
+DEFAULT_BACKEND = model_backends["ifcopenshell"]
+
+
+def get_backend(name: str) -> ModelBackend:
+    """Gets the model backend by its name.
+
+        Raises:
+            ValueError:
+                If there is no model backend with the `name`.
+    """
+    if name not in model_backends:
+        raise ValueError(f"model backend {name} does not exist")
+    return model_backends[name]
+
+
+def activate(backend: Optional[ModelBackend]):
+    """Activates the model `backend` for the validation of the rules.
+
+        Deactivated with ``None``, then the default model backend is active.
+    """
+    global _active_backend  # pylint: disable=global-statement
+    _active_backend = backend
+
+
+def get_active_backend() -> ModelBackend:
+    """Gets the active model backend, the default model backend if no model backend is active"""
+    return _active_backend or DEFAULT_BACKEND
@@ -0,0 +1,364 @@
+"""Batch validation of many ifc files within a memory budget
+
+    Each ifc file is a job, validated on the rules files by the IFC Data Checker
+    in a subprocess of its own. The memory a job takes is estimated from the size
+    of its ifc file, calibrated by the peak memory of the jobs of the former runs.
+    The jobs are started smallest ifc file first for a quick feedback, as long as
+    the estimated memory of the running jobs stays within the memory budget.
+    The state of the queue is written to the state file after each started and
+    finished job, so an interrupted batch resumes with its unfinished jobs.
+
+    State file layout (JSON)::
+
+        {"version": 1, "command": [<options of the jobs>, ...],
+         "ifc_files": [<sorted absolute paths of the ifc files>, ...],
+         "jobs": [{"ifc_file": <path>, "size": <bytes>, "status": <job status>,
+                   "returncode": <exit code>, "peak_memory": <bytes>, "seconds": <seconds>},
+                  ...],
+         "calibration": {<model backend>: [[<size>, <peak memory>], ...], ...}}
+
+    The peak memory of a job is measured by `os.wait4`, which is available on Unix only.
+"""
+import argparse
+import json
+import os
+import signal
+import subprocess  # nosec
+import sys
+import time
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from ifc_data_checker import backends
+from ifc_data_checker.validation import ReportLevel
+
+STATE_VERSION = 1
+
+MEMORY_BASE = 128 * 1024 ** 2
+"""The bytes of memory a job takes besides its ifc file"""
+
+DEFAULT_MEMORY_RATIOS = {"ifcopenshell": 10.0, "lazy": 3.0}
+"""The bytes of memory per byte of the ifc file by the model backend, without calibration"""
+
+CALIBRATION_SAMPLES = 20
+"""The count of the latest finished jobs calibrating the memory estimate"""
+
+_POLL_INTERVAL = 0.1
+"""The seconds to wait before checking again if a running job finished"""
+
+_MEMORY_UNITS = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+class JobStatus(Enum):
+    """The status of a job of the batch"""
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class BatchQueue:
+    """The queue of the jobs of a batch, persisted in the state file"""
+
+    def __init__(self, state_file: str, ifc_files: List[str], command: List[str],
+                 model_backend: str = "ifcopenshell"):
+        """Constructor
+
+            Resumes the batch of the state file, if it has the same command
+            and the same ifc files and not all its jobs are done.
+            Else a new batch of the `ifc_files` is started.
+            The calibration of the memory estimate is kept either way.
+            Jobs running or failed in the state file are pending again.
+
+            Args:
+                state_file (str):
+                    The file path of the state file.
+                ifc_files (List[str]):
+                    The file paths of the ifc files of a new batch.
+                command (List[str]):
+                    The options and the rules files of the jobs, followed by the ifc file.
+                model_backend (str):
+                    The model backend of the jobs, the calibration is per model backend.
+
+            Raises:
+                ValueError:
+                    If the state file is not a batch state file or two ifc files
+                    have the same file name, so their validation reports would
+                    overwrite each other.
+        """
+        ifc_files = sorted(os.path.abspath(ifc_file) for ifc_file in ifc_files)
+        file_names = {}
+        for ifc_file in ifc_files:
+            file_name = os.path.normcase(os.path.basename(ifc_file))
+            if file_name in file_names:
+                raise ValueError(f"{file_names[file_name]} and {ifc_file} have the same "
+                                 f"file name, their validation reports would overwrite "
+                                 f"each other")
+            file_names[file_name] = ifc_file
+        self.state_file = state_file
+        self.command = command
+        self.ifc_files = ifc_files
+        self.model_backend = model_backend
+        self.calibration: Dict[str, List[List[int]]] = {}
+        self.jobs: List[dict] = []
+        state = self._load()
+        if state is not None:
+            self.calibration = state["calibration"]
+            if state["command"] == command and state.get("ifc_files") == ifc_files and any(
+                    job["status"] != JobStatus.DONE.value for job in state["jobs"]):
+                self.jobs = state["jobs"]
+        for job in self.jobs:
+            if job["status"] in (JobStatus.RUNNING.value, JobStatus.FAILED.value):
+                job["status"] = JobStatus.PENDING.value
+        if not self.jobs:
+            self.jobs = [{"ifc_file": ifc_file,
+                          "size": os.path.getsize(ifc_file),
+                          "status": JobStatus.PENDING.value,
+                          "returncode": None, "peak_memory": None, "seconds": None}
+                         for ifc_file in ifc_files]
+        self.save()
+
+    def _load(self) -> Optional[dict]:
+        """Reads the state file, None if it does not exist"""
+        if not os.path.exists(self.state_file):
+            return None
+        with open(self.state_file, encoding="utf-8") as state_file:
+            try:
+                state = json.load(state_file)
+            except ValueError as error:
+                raise ValueError(f"{self.state_file} is not a batch state file") from error
+        if not isinstance(state, dict) or state.get("version") != STATE_VERSION or \
+                not isinstance(state.get("jobs"), list) or \
+                not isinstance(state.get("calibration"), dict):
+            raise ValueError(f"{self.state_file} is not a batch state file")
+        return state
+
+    def save(self):
+        """Writes the state file, to a temporary file first and then renamed"""
+        temporary_file_name = f"{self.state_file}.{os.getpid()}.tmp"
+        with open(temporary_file_name, "w", encoding="utf-8") as state_file:
+            json.dump({"version": STATE_VERSION, "command": self.command,
+                       "ifc_files": self.ifc_files, "jobs": self.jobs,
+                       "calibration": self.calibration}, state_file, indent=1)
+        os.replace(temporary_file_name, self.state_file)
+
+    def estimate_memory(self, size: int) -> int:
+        """Estimates the bytes of memory of a job on an ifc file of `size` bytes.
+
+            The memory per byte of the ifc file is the largest one of the latest
+            finished jobs of the model backend, whose peak memory is more than twice
+            the memory base. The memory of the jobs on small ifc files is mostly
+            the memory base and tells nothing about the memory per byte.
+        """
+        ratios = [(peak_memory - MEMORY_BASE) / sample_size
+                  for sample_size, peak_memory in self.calibration.get(self.model_backend, [])
+                  if sample_size > 0 and peak_memory > 2 * MEMORY_BASE]
+        ratio = max(ratios) if ratios else DEFAULT_MEMORY_RATIOS.get(self.model_backend, 10.0)
+        return MEMORY_BASE + int(ratio * size)
+
+    def next_job(self, reserved_memory: int, memory_budget: int) -> Optional[dict]:
+        """Gets the pending job on the smallest ifc file,
+            if it fits into the memory budget besides the running jobs.
+
+            Without running jobs, the job is started even if it exceeds the memory budget.
+
+            Args:
+                reserved_memory (int):
+                    The estimated bytes of memory of the running jobs.
+                memory_budget (int):
+                    The bytes of memory of all running jobs.
+
+            Returns:
+                Optional[dict]:
+                    The job to start, None if no pending job fits.
+        """
+        pending_jobs = [job for job in self.jobs if job["status"] == JobStatus.PENDING.value]
+        if not pending_jobs:
+            return None
+        job = min(pending_jobs, key=lambda pending_job: pending_job["size"])
+        if reserved_memory and reserved_memory + self.estimate_memory(job["size"]) > \
+                memory_budget:
+            return None
+        return job
+
+    def start(self, job: dict):
+        """Marks the job as running"""
+        job["status"] = JobStatus.RUNNING.value
+        self.save()
+
+    def finish(self, job: dict, returncode: int, peak_memory: int, seconds: float):
+        """Marks the job as done or failed and calibrates the memory estimate by its peak memory"""
+        job["status"] = JobStatus.DONE.value if returncode == 0 else JobStatus.FAILED.value
+        job["returncode"] = returncode
+        job["peak_memory"] = peak_memory
+        job["seconds"] = round(seconds, 3)
+        if returncode == 0:
+            samples = self.calibration.setdefault(self.model_backend, [])
+            samples.append([job["size"], peak_memory])
+            del samples[:-CALIBRATION_SAMPLES]
+        self.save()
+
+    def unfinished(self) -> bool:
+        """Whether a job is pending or running"""
+        return any(job["status"] in (JobStatus.PENDING.value, JobStatus.RUNNING.value)
+                   for job in self.jobs)
+
+
+def parse_memory(memory: str) -> int:
+    """Parses bytes of memory with an optional unit K, M, G or T, like `8G`
+
+        Raises:
+            ValueError:
+                If `memory` is not bytes of memory.
+    """
+    unit = _MEMORY_UNITS.get(memory[-1:].upper())
+    try:
+        value = float(memory[:-1] if unit else memory) * (unit or 1)
+    except ValueError as error:
+        raise ValueError(f"{memory} is not bytes of memory") from error
+    if value <= 0:
+        raise ValueError(f"{memory} is not bytes of memory")
+    return int(value)
+
+
+def physical_memory() -> int:
+    """Gets the bytes of physical memory of the machine"""
+    return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+
+
+def _returncode(wait_status: int) -> int:
+    """Gets the exit code of a wait status, the negative signal number if killed"""
+    if os.WIFSIGNALED(wait_status):
+        return -os.WTERMSIG(wait_status)
+    return os.WEXITSTATUS(wait_status)
+
+
+def _wait_job(pids: List[int]) -> Tuple[int, int, Any]:
+    """Waits until one of the subprocesses of the `pids` exits,
+        other child processes of this process are not reaped
+
+        Returns:
+            Tuple[int, int, resource.struct_rusage]:
+                The pid, the wait status and the resource usage of the subprocess,
+                like `os.wait4`.
+    """
+    while True:
+        for pid in pids:
+            finished_pid, wait_status, resource_usage = os.wait4(pid, os.WNOHANG)
+            if finished_pid:
+                return pid, wait_status, resource_usage
+        time.sleep(_POLL_INTERVAL)
+
+
+def run_batch(batch_queue: BatchQueue, memory_budget: int, max_jobs: int = 1,
+              report_directory: str = None) -> int:
+    """Runs the jobs of the batch queue in subprocesses until all are finished.
+
+        If interrupted, the running jobs are terminated and pending again,
+        so the batch resumes with them.
+
+        Args:
+            batch_queue (BatchQueue):
+                The queue of the jobs.
+            memory_budget (int):
+                The bytes of memory of all running jobs.
+            max_jobs (int):
+                The maximum count of running jobs.
+            report_directory (str):
+                The directory of the validation reports. If None, the working directory.
+                The jobs run in the working directory, so the relative paths
+                of their rules and allowed values files are resolved as usual.
+
+        Returns:
+            int:
+                The count of the failed jobs.
+    """
+    report_options = [] if report_directory is None else \
+        ["--report-dir", os.path.abspath(report_directory)]
+    running = {}
+    try:
+        while batch_queue.unfinished():
+            reserved_memory = sum(estimate for _, _, estimate, _ in running.values())
+            job = batch_queue.next_job(reserved_memory, memory_budget) \
+                if len(running) < max_jobs else None
+            if job is not None:
+                process = subprocess.Popen(  # nosec
+                    [sys.executable, "-m", "ifc_data_checker", "--report-file"] +
+                    report_options + batch_queue.command + [job["ifc_file"]],
+                    env=_job_environment())
+                running[process.pid] = (process, job, batch_queue.estimate_memory(job["size"]),
+                                        time.monotonic())
+                batch_queue.start(job)
+                continue
+            pid, wait_status, resource_usage = _wait_job(list(running))
+            process, job, _, start_time = running.pop(pid)
+            process.returncode = _returncode(wait_status)
+            batch_queue.finish(job, process.returncode, resource_usage.ru_maxrss * 1024,
+                               time.monotonic() - start_time)
+    finally:
+        for process, job, _, _ in running.values():
+            process.terminate()
+            process.wait()
+            job["status"] = JobStatus.PENDING.value
+        batch_queue.save()
+    return sum(job["status"] == JobStatus.FAILED.value for job in batch_queue.jobs)
+
+
+def _job_environment() -> Dict[str, str]:
+    """Gets the environment of the jobs, which import this ifc_data_checker package"""
+    package_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    python_path = os.environ.get("PYTHONPATH")
+    return dict(os.environ, PYTHONPATH=package_directory if not python_path
+                else os.pathsep.join([package_directory, python_path]))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog='ifc_data_checker.batch')
+    parser.add_argument(
+        "--rules", action="append", required=True, metavar="RULES",
+        help="The path to a rules file, repeated for several rules files. "
+             "Each ifc file is validated on all the rules files.")
+    parser.add_argument(
+        "ifc", nargs="+", help="The paths to the ifc files of the batch.")
+    parser.add_argument("--state", metavar="FILE", default="batch state.json",
+                        help="The state file of the batch, an interrupted batch "
+                             "resumes from it.")
+    parser.add_argument("--memory-budget", metavar="BYTES",
+                        help="The memory of all running jobs, with an optional unit "
+                             "K, M, G or T. By default 80 percent of the physical memory.")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, metavar="N",
+                        help="Run at most N jobs at the same time.")
+    parser.add_argument("--report-dir", metavar="DIR",
+                        help="The directory of the validation report files.")
+    parser.add_argument("--no-rulesfile-validation", action="store_true",
+                        help="Disable validation of the rules files.")
+    parser.add_argument("--report-format", choices=["text", "json", "columnar", "junit"],
+                        default="text", help="The format of the validation reports.")
+    parser.add_argument("--report-level", choices=[level.value for level in ReportLevel],
+                        default=ReportLevel.FULL.value, help="What to report.")
+    parser.add_argument("--model-backend", choices=list(backends.model_backends),
+                        default="ifcopenshell", help="The backend to open the ifc files.")
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs needs at least 1 job")
+    try:
+        args_memory_budget = parse_memory(args.memory_budget) if args.memory_budget \
+            else int(physical_memory() * 0.8)
+    except ValueError as error:
+        parser.error(str(error))
+    args_command = ["--report-format", args.report_format, "--report-level", args.report_level,
+                    "--model-backend", args.model_backend]
+    if args.no_rulesfile_validation:
+        args_command.append("--no-rulesfile-validation")
+    args_command += [os.path.abspath(rules_file) for rules_file in args.rules]
+    try:
+        args_queue = BatchQueue(args.state, args.ifc, args_command, args.model_backend)
+    except ValueError as error:
+        parser.error(str(error))
+    signal.signal(signal.SIGTERM, lambda signal_number, frame: sys.exit(128 + signal_number))
+    try:
+        failed_jobs = run_batch(args_queue, args_memory_budget, args.jobs, args.report_dir)
+    except KeyboardInterrupt:
+        sys.exit(130)
+    if failed_jobs:
+        sys.exit(1)
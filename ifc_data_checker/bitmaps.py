@@ -0,0 +1,86 @@
+"""Result bitmaps of validated constraints"""
+from typing import List
+
+from ifc_data_checker.validation import ValidationResult
+
+_VALID_MASK_TABLE = bytes(1 if code == ValidationResult.VALID.value else 0
+                          for code in range(256))
+_GROUP_RESULT_TABLE = bytes([ValidationResult.FAILED.value, ValidationResult.VALID.value]) + \
+    bytes(254)
+
+
+class ResultBitmap:
+    """The validation results of a constraint on all the ifc instances of a rule.
+
+        The validation result of each ifc instance is stored as one byte,
+        the value of its :class:`ValidationResult`. Counting the validation results
+        and combining the bitmaps of constraint groups are done on the whole bitmap
+        instead of ifc instance by ifc instance.
+    """
+
+    __slots__ = ("results",)
+
+    def __init__(self, results: bytearray = None):
+        """Constructor
+
+            Args:
+                results (bytearray):
+                    The values of the validation results by the index of the ifc instance.
+        """
+        self.results = bytearray() if results is None else results
+
+    def __len__(self) -> int:
+        """Gets the count of the ifc instances"""
+        return len(self.results)
+
+    def append(self, validation_result: ValidationResult):
+        """Appends the validation result of the next ifc instance"""
+        self.results.append(validation_result.value)
+
+    def head(self, size: int) -> "ResultBitmap":
+        """Gets the bitmap of the first `size` ifc instances"""
+        return ResultBitmap(self.results[:size])
+
+    def result(self, index: int) -> ValidationResult:
+        """Gets the validation result of the ifc instance at `index`"""
+        return ValidationResult(self.results[index])
+
+    def is_valid(self, index: int) -> bool:
+        """Returns True, if the ifc instance at `index` is valid, otherwise False"""
+        return self.results[index] == ValidationResult.VALID.value
+
+    def count(self, validation_result: ValidationResult) -> int:
+        """Counts the ifc instances with the `validation_result`"""
+        return self.results.count(validation_result.value)
+
+    def valid_count(self) -> int:
+        """Counts the valid ifc instances"""
+        return self.count(ValidationResult.VALID)
+
+    def valid_mask(self) -> int:
+        """Gets the valid ifc instances as mask with one byte set to 1 per valid ifc instance"""
+        return int.from_bytes(self.results.translate(_VALID_MASK_TABLE), "little")
+
+    @classmethod
+    def from_valid_mask(cls, valid_mask: int, size: int) -> "ResultBitmap":
+        """Creates the bitmap of a constraint group from its valid mask.
+
+            Each ifc instance is either valid or failed.
+        """
+        return cls(bytearray(valid_mask.to_bytes(size, "little").translate(_GROUP_RESULT_TABLE)))
+
+    @classmethod
+    def all_valid(cls, bitmaps: List["ResultBitmap"], size: int) -> "ResultBitmap":
+        """Combines the `bitmaps` into valid, where each bitmap is valid, otherwise failed"""
+        valid_mask = int.from_bytes(b"\x01" * size, "little")
+        for bitmap in bitmaps:
+            valid_mask &= bitmap.valid_mask()
+        return cls.from_valid_mask(valid_mask, size)
+
+    @classmethod
+    def any_valid(cls, bitmaps: List["ResultBitmap"], size: int) -> "ResultBitmap":
+        """Combines the `bitmaps` into valid, where one bitmap is valid, otherwise failed"""
+        valid_mask = 0
+        for bitmap in bitmaps:
+            valid_mask |= bitmap.valid_mask()
+        return cls.from_valid_mask(valid_mask, size)
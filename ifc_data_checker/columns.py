@@ -0,0 +1,333 @@
+"""Column-oriented evaluation of simple constraints"""
+from typing import Any, List, Optional, Union
+
+from ifc_data_checker import backends
+from ifc_data_checker import config
+from ifc_data_checker.bitmaps import ResultBitmap
+from ifc_data_checker.constraint_checks import compile_allowed_values
+from ifc_data_checker.constraint_checks import load_allowed_values
+from ifc_data_checker.constraints import AndGroup
+from ifc_data_checker.constraints import OrGroup
+from ifc_data_checker.constraints import SetGroup
+from ifc_data_checker.validation import ValidationInformation
+from ifc_data_checker.validation import ValidationResult
+
+VALID = ValidationResult.VALID.value
+FAILED = ValidationResult.FAILED.value
+ERROR = ValidationResult.ERROR.value
+
+_columnar_check_keys = ("equals", "in", "in_file", "exists", "type")
+_group_classes = {"set": SetGroup, "and": AndGroup, "or": OrGroup}
+
+
+def is_columnar(constraint_definition: dict) -> bool:
+    """Checks if the constraint component can be evaluated column-oriented.
+
+        A constraint is columnar, if its path consists of attribute path operators only
+        and its check is an `equals`, `in`, `in_file`, `exists` or `type` check,
+        optionally negated by `not`.
+        A constraint group is columnar, if all its constraint components are columnar.
+
+        Args:
+            constraint_definition (dict):
+                The constraint component definition from the rules file.
+
+        Returns:
+            bool:
+                True, if the constraint component can be evaluated column-oriented,
+                otherwise False.
+    """
+    if not isinstance(constraint_definition, dict):
+        return False
+    if len(constraint_definition) == 1:
+        group_key, group_definition = next(iter(constraint_definition.items()))
+        return (group_key in _group_classes and isinstance(group_definition, list) and
+                all(is_columnar(definition) for definition in group_definition))
+    if set(constraint_definition.keys()) != {"path", "check"}:
+        return False
+    path = constraint_definition["path"]
+    if path and not (isinstance(path, list) and all(
+            isinstance(path_operator, dict) and
+            tuple(path_operator.keys()) == ("attribute",) and
+            path_operator["attribute"] for path_operator in path)):
+        return False
+    return _is_columnar_check(constraint_definition["check"])
+
+
+def _is_columnar_check(check_definition) -> bool:
+    """Checks if the constraint check can be evaluated column-oriented"""
+    if not isinstance(check_definition, dict) or len(check_definition) != 1:
+        return False
+    key, value = next(iter(check_definition.items()))
+    if not value:
+        return False
+    if key == "not":
+        return _is_columnar_check(value)
+    return key in _columnar_check_keys
+
+
+def _evaluate_check(check_definition: dict, values: List[Any]) -> bytearray:
+    """Evaluates the constraint check on all the `values` in one pass.
+
+        Raises:
+            ValueError:
+                Raised if the allowed values of an `in_file` check can not be loaded.
+    """
+    key, expected = next(iter(check_definition.items()))
+    backend = backends.get_active_backend()
+    if key == "equals":
+        return bytearray(VALID if value == expected else FAILED for value in values)
+    if key in ("in", "in_file"):
+        if key == "in":
+            allowed_values = compile_allowed_values(expected)
+        else:
+            allowed_values = load_allowed_values(expected)
+        return bytearray(VALID if value in allowed_values else FAILED for value in values)
+    if key == "exists":
+        return bytearray(VALID if backend.has_attribute(value, expected) else FAILED
+                         for value in values)
+    if key == "type":
+        return bytearray((VALID if backend.is_a(value, expected) else FAILED)
+                         if backend.is_entity(value) else ERROR for value in values)
+    return bytearray(FAILED if result == VALID else VALID
+                     for result in _evaluate_check(expected, values))
+
+
+def create_column(constraint_definition: dict,
+                  ifc_instances: tuple) -> Union["ConstraintColumn", "GroupColumn"]:
+    """Creates the column of the columnar constraint component.
+
+        Args:
+            constraint_definition (dict):
+                The columnar constraint component definition from the rules file.
+            ifc_instances (tuple):
+                The ifc instances to validate the constraint component.
+
+        Returns:
+            Union[ConstraintColumn, GroupColumn]:
+                The column ready to evaluate.
+    """
+    if len(constraint_definition) == 1:
+        return GroupColumn(constraint_definition, ifc_instances)
+    return ConstraintColumn(constraint_definition, ifc_instances)
+
+
+class ConstraintColumn:
+    """A constraint evaluated column-oriented on all the ifc instances of a rule.
+
+        The path is applied on all ifc instances at once into a column of path results,
+        then the check is evaluated on the whole column into the result bitmap `results`.
+        The validation messages are only created on reporting.
+    """
+
+    def __init__(self, constraint_definition: dict, ifc_instances: tuple):
+        """Constructor
+
+            Args:
+                constraint_definition (dict):
+                    The columnar constraint definition from the rules file.
+                ifc_instances (tuple):
+                    The ifc instances to validate the constraint.
+
+            Raises:
+                ValueError:
+                    If the constraint definition is not columnar.
+        """
+        if not is_columnar(constraint_definition) or len(constraint_definition) == 1:
+            raise ValueError(
+                f"The constraint {constraint_definition} can not be evaluated column-oriented")
+        self.definition = constraint_definition
+        self.ifc_instances = ifc_instances
+        self.values = []
+        self.errors = {}
+        self.results = ResultBitmap()
+
+    def evaluate(self):
+        """Evaluates the constraint on all the ifc instances"""
+        attribute_names = [path_operator["attribute"]
+                           for path_operator in self.definition["path"] or []]
+        checked_indexes = []
+        checked_values = []
+        backend = backends.get_active_backend()
+        for index, ifc_instance in enumerate(self.ifc_instances):
+            value = ifc_instance
+            try:
+                for attribute_name in attribute_names:
+                    value = backend.get_attribute(value, attribute_name)
+            except AttributeError as error:
+                self.errors[index] = str(error)
+                value = None
+            else:
+                if not value:
+                    self.errors[index] = "path_result is None"
+                else:
+                    checked_indexes.append(index)
+                    checked_values.append(value)
+            self.values.append(value)
+        results = bytearray([ERROR]) * len(self.ifc_instances)
+        try:
+            checked_results = _evaluate_check(self.definition["check"], checked_values)
+        except ValueError as error:
+            for index in checked_indexes:
+                self.errors[index] = str(error)
+            checked_results = bytearray()
+        for index, result in zip(checked_indexes, checked_results):
+            results[index] = result
+        self.results = ResultBitmap(results)
+
+    def is_valid(self, index: int) -> bool:
+        """Returns True, if the constraint is valid on the ifc instance at `index`"""
+        return self.results.is_valid(index)
+
+    def validation_information(self, index: int) -> ValidationInformation:
+        """Creates the validation information of the ifc instance at `index`.
+
+            The message is created by the constraint check itself,
+            so it is the same as validating the ifc instance on its own.
+        """
+        validation_information = ValidationInformation()
+        if index in self.errors:
+            validation_information.set_error(self.errors[index])
+            return validation_information
+        try:
+            check = config.get_constraint_check(
+                self.definition["check"], self.values[index], self.ifc_instances[index])
+            return check.validate()
+        except (ValueError, IndexError, AttributeError) as error:
+            validation_information.set_error(str(error))
+            return validation_information
+
+    def constraint(self, index: int) -> "ColumnConstraint":
+        """Gets the validated constraint of the ifc instance at `index`"""
+        return ColumnConstraint(self, index)
+
+
+class ColumnConstraint:
+    """The validated constraint of one ifc instance from a :class:`ConstraintColumn`.
+
+        Provides the interface of a validated
+        :class:`ifc_data_checker.constraints.Constraint` for reporting.
+    """
+
+    __slots__ = ("column", "index", "_validation_information")
+
+    def __init__(self, column: ConstraintColumn, index: int):
+        """Constructor"""
+        self.column = column
+        self.index = index
+        self._validation_information: Optional[ValidationInformation] = None
+
+    @property
+    def definition(self) -> dict:
+        """The constraint definition"""
+        return self.column.definition
+
+    @property
+    def ifc_instance(self):
+        """The validated ifc instance"""
+        return self.column.ifc_instances[self.index]
+
+    @property
+    def path_result(self):
+        """The value after applying the path on the ifc instance"""
+        return self.column.values[self.index]
+
+    @property
+    def validation_information(self) -> ValidationInformation:
+        """The validation information, created on first access"""
+        if self._validation_information is None:
+            self._validation_information = self.column.validation_information(self.index)
+        return self._validation_information
+
+    def validate(self):
+        """Already validated by the column"""
+
+    def is_valid(self) -> bool:
+        """Returns True, if the validation result is ValidationResult.VALID, otherwise False"""
+        return self.column.is_valid(self.index)
+
+    def report(self) -> List[str]:
+        """Reports the validated constraint"""
+        return [str(self.validation_information)]
+
+
+class GroupColumn:
+    """A constraint group evaluated column-oriented on all the ifc instances of a rule.
+
+        The result bitmap of the group is combined from the result bitmaps
+        of its columnar constraint components with bitwise operations.
+    """
+
+    def __init__(self, group_definition: dict, ifc_instances: tuple):
+        """Constructor
+
+            Args:
+                group_definition (dict):
+                    The columnar constraint group definition from the rules file.
+                ifc_instances (tuple):
+                    The ifc instances to validate the constraint group.
+
+            Raises:
+                ValueError:
+                    If the constraint group definition is not columnar.
+        """
+        if not is_columnar(group_definition) or len(group_definition) != 1:
+            raise ValueError(
+                f"The constraint group {group_definition} can not be evaluated column-oriented")
+        self.definition = group_definition
+        self.group_key = next(iter(group_definition.keys()))
+        self.group_class = _group_classes[self.group_key]
+        self.ifc_instances = ifc_instances
+        self.columns = [create_column(definition, ifc_instances)
+                        for definition in group_definition[self.group_key]]
+        self.results = ResultBitmap()
+
+    def evaluate(self):
+        """Evaluates the constraint group on all the ifc instances"""
+        for column in self.columns:
+            column.evaluate()
+        bitmaps = [column.results for column in self.columns]
+        if self.group_key == "or":
+            self.results = ResultBitmap.any_valid(bitmaps, len(self.ifc_instances))
+        else:
+            self.results = ResultBitmap.all_valid(bitmaps, len(self.ifc_instances))
+
+    def is_valid(self, index: int) -> bool:
+        """Returns True, if the constraint group is valid on the ifc instance at `index`"""
+        return self.results.is_valid(index)
+
+    def validation_information(self, index: int) -> ValidationInformation:
+        """Creates the validation information of the ifc instance at `index`"""
+        valid_constraints_count = sum(column.is_valid(index) for column in self.columns)
+        return self.group_class.create_validation_information(
+            valid_constraints_count, len(self.columns))
+
+    def constraint(self, index: int) -> "ColumnGroup":
+        """Gets the validated constraint group of the ifc instance at `index`"""
+        return ColumnGroup(self, index)
+
+
+class ColumnGroup(ColumnConstraint):
+    """The validated constraint group of one ifc instance from a :class:`GroupColumn`.
+
+        Provides the interface of a validated constraint group for reporting.
+    """
+
+    __slots__ = ()
+
+    @property
+    def path_result(self):
+        """Constraint groups have no path result"""
+        return None
+
+    @property
+    def validated_constraints(self) -> List[ColumnConstraint]:
+        """The validated constraint components of the group"""
+        return [column.constraint(self.index) for column in self.column.columns]
+
+    def report(self) -> List[str]:
+        """Reports the validated constraint group"""
+        report = [str(self.validation_information)]
+        for validated_constraint in self.validated_constraints:
+            report += validated_constraint.report()
+        return report
@@ -10,6 +10,7 @@ import ifc_data_checker
 all_constraints = set()
 all_path_operators = set()
 all_constraint_checks = set()
+all_instance_filters = set()
 
 __location__ = os.path.realpath(os.path.join(
     os.getcwd(), os.path.dirname(__file__)))
@@ -34,6 +35,11 @@ def init():
             for config_constraint_check in config['constraint_checks']:
                 all_constraint_checks.add(
                     getattr(module, config_constraint_check))
+        if not all_instance_filters:
+            module = importlib.import_module('ifc_data_checker.instance_filters')
+            for config_instance_filter in config['instance_filters']:
+                all_instance_filters.add(
+                    getattr(module, config_instance_filter))
 
 
 init()
@@ -67,3 +73,13 @@ def get_constraint_check(constraint_check_definition: dict, path_result,
         if check.matching_yaml_keys(keys):
             return check(constraint_check_definition, path_result, ifc_instance)
     raise ValueError(f"No appropriate constraint check with keys {keys}")
+
+
+def get_instance_filter(instance_filter_definition: dict,
+                        model_index) -> ifc_data_checker.instance_filters.InstanceFilter:
+    """Gets the instance filter by the given definition"""
+    keys = tuple(instance_filter_definition.keys())
+    for instance_filter in all_instance_filters:
+        if instance_filter.matching_yaml_keys(keys):
+            return instance_filter(instance_filter_definition, model_index)
+    raise ValueError(f"No appropriate instance filter with keys {keys}")
@@ -1,7 +1,12 @@
 """Constraint Checks"""
 import abc
+import csv
+import os
+from typing import Any, Iterable
 
+from ifc_data_checker import backends
 from ifc_data_checker import config
+from ifc_data_checker import indexes
 from ifc_data_checker.validation import ValidationInformation
 from ifc_data_checker.yaml_helper import YamlMatchingKeys
 
@@ -101,7 +106,7 @@ class ExistsCheck(ConstraintCheck):
     def validate(self) -> ValidationInformation:
         """Validates the `path_result` on an attribute to exists.
 
-            Using the `hasattr` method to check if an attribute exists.
+            Using the active model backend to check if an attribute exists.
 
             Returns:
                 ValidationInformation:
@@ -110,7 +115,7 @@ class ExistsCheck(ConstraintCheck):
         """
         validation_information = ValidationInformation()
         expected_attribute = self.definition['exists']
-        if hasattr(self.path_result, expected_attribute):
+        if backends.get_active_backend().has_attribute(self.path_result, expected_attribute):
             validation_information.set_valid(
                 f"attribute {str(expected_attribute)} exists as expected.")
         else:
@@ -119,6 +124,104 @@ class ExistsCheck(ConstraintCheck):
         return validation_information
 
 
+class AllowedValues:
+    """The allowed values of an in constraint check.
+
+        The allowed values are compiled once per definition into a ``frozenset``,
+        so testing a value is a hash lookup instead of a linear scan.
+        If the allowed values are not hashable, a list is used instead.
+    """
+
+    def __init__(self, values: Iterable[Any], description: str):
+        """Constructor
+
+            Args:
+                values (Iterable[Any]):
+                    The allowed values.
+                description (str):
+                    The description of the allowed values for the validation messages.
+        """
+        self.value_list = list(values)
+        try:
+            self.values = frozenset(self.value_list)
+        except TypeError:
+            self.values = self.value_list
+        self.description = description
+
+    def __contains__(self, value) -> bool:
+        """Checks if `value` is one of the allowed values"""
+        try:
+            return value in self.values
+        except TypeError:
+            return value in self.value_list
+
+    def __len__(self) -> int:
+        """Gets the count of the allowed values"""
+        return len(self.value_list)
+
+
+def compile_allowed_values(values: list) -> AllowedValues:
+    """Gets the compiled allowed values of the `values` defined in the rules file.
+
+        During a validation, the allowed values are compiled on the first call
+        per definition, and then reused for each ifc instance,
+        see :meth:`ifc_data_checker.indexes.ModelIndex.allowed_values`.
+
+        Args:
+            values (list):
+                The allowed values of the in constraint check.
+
+        Returns:
+            AllowedValues:
+                The compiled allowed values.
+    """
+    model_index = indexes.get_active_model_index()
+    if model_index is None:
+        return AllowedValues(values, str(values))
+    return model_index.allowed_values(values, lambda node: AllowedValues(node, str(values)))
+
+
+def load_allowed_values(file_name: str) -> AllowedValues:
+    """Loads the allowed values from a text or CSV file.
+
+        Each line of a text file is an allowed value.
+        Of a CSV file, the value in the first column of each row is an allowed value.
+        Empty lines are ignored. During a validation, the file is loaded on the first call
+        and then reused for each ifc instance,
+        see :meth:`ifc_data_checker.indexes.ModelIndex.loaded_allowed_values`.
+
+        Args:
+            file_name (str):
+                The path of the file, relative to the rules file when read by the command line,
+                see :func:`ifc_data_checker.definitions.resolve_allowed_values_files`.
+
+        Returns:
+            AllowedValues:
+                The allowed values from the file.
+
+        Raises:
+            ValueError:
+                Raised if the file does not exist.
+    """
+    model_index = indexes.get_active_model_index()
+    if model_index is None:
+        return _read_allowed_values(file_name)
+    return model_index.loaded_allowed_values(file_name, _read_allowed_values)
+
+
+def _read_allowed_values(file_name: str) -> AllowedValues:
+    """Reads the allowed values from a text or CSV file, see :func:`load_allowed_values`"""
+    if not os.path.isfile(file_name):
+        raise ValueError(f"The allowed values file {file_name} does not exist")
+    with open(file_name, newline='') as allowed_values_file:
+        if file_name.lower().endswith(".csv"):
+            values = (row[0].strip() for row in csv.reader(allowed_values_file) if row)
+        else:
+            values = (line.strip() for line in allowed_values_file)
+        return AllowedValues((value for value in values if value),
+                             f"values of {os.path.basename(file_name)}")
+
+
 class InCheck(ConstraintCheck):
     """The in constraint check class
 
@@ -135,6 +238,10 @@ class InCheck(ConstraintCheck):
     yaml_keys = tuple(["in"])
     """In the rules yaml the :class:`InCheck` is defined by the keyword `in`"""
 
+    def get_allowed_values(self) -> AllowedValues:
+        """Gets the compiled allowed values of the definition"""
+        return compile_allowed_values(self.definition["in"])
+
     def validate(self) -> ValidationInformation:
         """Validates the `path_result` that it it is one of the allowed values.
 
@@ -145,16 +252,38 @@ class InCheck(ConstraintCheck):
                     The validation information about the validation
                     of the constraint check on the path result.
         """
-        allowed_values = self.definition["in"]
+        allowed_values = self.get_allowed_values()
         validation_information = ValidationInformation()
         if self.path_result in allowed_values:
             validation_information.set_valid(f"{self.path_result} is allowed")
         else:
-            validation_information.set_failed(
-                f"validation in error - allowed: {allowed_values}, actual: {self.path_result}")
+            validation_information.set_failed((
+                f"validation in error - allowed: {allowed_values.description}, "
+                f"actual: {self.path_result}"))
         return validation_information
 
 
+class InFileCheck(InCheck):
+    """The in file constraint check class
+
+        The allowed values are loaded from a text file with one value per line
+        or from a CSV file with the values in the first column.
+
+        Example:
+            Defintion of a in file constraint check in the rules file::
+
+                check:
+                    in_file: ./path/to/allowed-values.csv
+    """
+
+    yaml_keys = tuple(["in_file"])
+    """In the rules yaml the :class:`InFileCheck` is defined by the keyword `in_file`"""
+
+    def get_allowed_values(self) -> AllowedValues:
+        """Gets the allowed values loaded from the file of the definition"""
+        return load_allowed_values(self.definition["in_file"])
+
+
 class NotCheck(ConstraintCheck):
     """The not constraint check class
 
@@ -209,7 +338,7 @@ class TypeCheck(ConstraintCheck):
     def validate(self) -> ValidationInformation:
         """Validates the `path_result` on an expected type.
 
-            Using the `is_a` method to check the type.
+            Using the active model backend to check the type.
 
             Returns:
                 ValidationInformation:
@@ -218,14 +347,16 @@ class TypeCheck(ConstraintCheck):
         """
         validation_information = ValidationInformation()
         expected_type = self.definition['type']
-        if not hasattr(self.path_result, 'is_a'):
+        backend = backends.get_active_backend()
+        if not backend.is_entity(self.path_result):
             validation_information.set_error((f"path_result {str(self.path_result)} is "
                                               f"not of type entity_instance of ifcopenshell"))
-        elif self.path_result.is_a(expected_type):
+        elif backend.is_a(self.path_result, expected_type):
             validation_information.set_valid((f"type of {str(self.path_result)} "
                                               f"as expected {str(expected_type)}."))
         else:
+            actual_type = backend.is_a(self.path_result)
             validation_information.set_failed((f"{str(self.path_result)} is "
                                                f"not of type {str(expected_type)}, "
-                                               f"it is of type {str(self.path_result.is_a())}."))
+                                               f"it is of type {str(actual_type)}."))
         return validation_information
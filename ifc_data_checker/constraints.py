@@ -1,8 +1,9 @@
 """Constraint Component Module"""
 import abc
-from typing import List
+from typing import Any, List
 
 from ifc_data_checker import config
+from ifc_data_checker import indexes
 from ifc_data_checker.validation import ValidationInformation
 from ifc_data_checker.validation import ValidationResult
 from ifc_data_checker.yaml_helper import YamlMatchingKeys
@@ -68,7 +69,8 @@ class Constraint(ConstraintComponent):
 
             This method can be called by an implementation of :class:`ConstraintGroup`.
             It applies the path on the given ifc instance and validates the path result
-            on the constraint check.
+            on the constraint check. If a model index is active, the validation informations
+            of the constraint check are memoised by the model index.
 
             Raises:
                 IndexError:
@@ -80,9 +82,12 @@ class Constraint(ConstraintComponent):
         """
         try:
             self.path_result = self._apply_path()
-            check = config.get_constraint_check(
-                self.get_check(), self.path_result, self.ifc_instance)
-            self.validation_information = check.validate()
+            model_index = indexes.get_active_model_index()
+            if model_index is None:
+                self.validation_information = self._validate_check()
+            else:
+                self.validation_information = model_index.check_result(
+                    self.get_check(), self.path_result, self._validate_check)
         except (ValueError, IndexError, AttributeError) as error:
             self.validation_information.set_error(str(error))
 
@@ -90,10 +95,18 @@ class Constraint(ConstraintComponent):
         """Reports the validated constraint"""
         return [str(self.validation_information)]
 
+    def _validate_check(self) -> ValidationInformation:
+        """Validates the constraint check on the path result"""
+        check = config.get_constraint_check(
+            self.get_check(), self.path_result, self.ifc_instance)
+        return check.validate()
+
     def _apply_path(self):
         """Applies the path on the ifc_instance
 
             If `path` is not defined, then return the `ifc_instance`.
+            If the path prefix is shared by the rules validated together,
+            the path results of the path prefix are memoised by the model index.
 
             Raises:
                 IndexError:
@@ -103,18 +116,20 @@ class Constraint(ConstraintComponent):
                     Raised if the path definition expect an attribute or a list,
                     which not exist in the ifc model.
         """
-        path_results = [self.ifc_instance]
-        if not self.get_path():
+        path = self.get_path()
+        if not path:
             return self.ifc_instance
 
-        for path_operator_definition in self.get_path():
-            operator = config.get_path_operator(
-                path_operator_definition, path_results)
-            path_results = operator.apply()
-            if not path_results:
-                raise IndexError("On traversing the path definition on the "
-                                 "ifc instance ends in nowhere. "
-                                 "There are none selected values.")
+        model_index = indexes.get_active_model_index()
+        prefix = None if model_index is None else model_index.shared_prefix(path)
+        if prefix is None:
+            path_results = _apply_path_operators(path, [self.ifc_instance])
+        else:
+            path_results = model_index.prefix_path_results(
+                self.ifc_instance, prefix,
+                lambda: _apply_path_operators(prefix, [self.ifc_instance]))
+            if len(prefix) < len(path):
+                path_results = _apply_path_operators(path, path_results, len(prefix))
         if len(path_results) != 1:
             raise IndexError(
                 "Per instance it is only allowed to have one path result")
@@ -138,6 +153,43 @@ class Constraint(ConstraintComponent):
                 self.path_result == other.path_result)
 
 
+def _apply_path_operators(path: List[dict], path_results: List[Any], start: int = 0) -> List[Any]:
+    """Applies the path operators of the `path` from position `start` on the `path_results`.
+
+        If a model index is active and the path passes a single shared instance,
+        like a type object, the rest of the path is memoised per shared instance
+        by the model index, as many instances share the same type object.
+
+        Raises:
+            IndexError:
+                Raised if the path definition ends in nowhere.
+            AttributeError:
+                Raised if the path definition expect an attribute or a list,
+                which not exist in the ifc model.
+    """
+    model_index = indexes.get_active_model_index()
+    for position in range(start, len(path)):
+        if (position > start and model_index is not None and len(path_results) == 1 and
+                model_index.is_shared(path_results[0])):
+            return _apply_shared_path(model_index, path, path_results, position)
+        operator = config.get_path_operator(path[position], path_results)
+        path_results = operator.apply()
+        if not path_results:
+            raise IndexError("On traversing the path definition on the "
+                             "ifc instance ends in nowhere. "
+                             "There are none selected values.")
+    return path_results
+
+
+def _apply_shared_path(model_index: indexes.ModelIndex, path: List[dict],
+                       path_results: List[Any], position: int) -> List[Any]:
+    """Applies the path from `position` on the single shared instance of the `path_results`,
+        memoised by the `model_index`"""
+    return model_index.shared_path_results(
+        path_results[0], path, position,
+        lambda: _apply_path_operators(path, path_results, position))
+
+
 class SetGroup(ConstraintComponent):
     """The set constraint group class
 
@@ -172,16 +224,25 @@ class SetGroup(ConstraintComponent):
             if constraint.is_valid():
                 valid_constraints_count += 1
             self.validated_constraints.append(constraint)
-        if valid_constraints_count == len(self.validated_constraints):
-            self.validation_information.set_valid(
+        self.validation_information = self.create_validation_information(
+            valid_constraints_count, len(self.validated_constraints))
+
+    @staticmethod
+    def create_validation_information(valid_constraints_count: int,
+                                      constraints_count: int) -> ValidationInformation:
+        """Creates the validation information of the set group by its valid constraints count"""
+        validation_information = ValidationInformation()
+        if valid_constraints_count == constraints_count:
+            validation_information.set_valid(
                 (f"set group: {ValidationResult.VALID}: "
                  f"{str(valid_constraints_count)} of "
-                 f"{len(self.validated_constraints)} constraints are valid."))
+                 f"{constraints_count} constraints are valid."))
         else:
-            self.validation_information.set_failed(
+            validation_information.set_failed(
                 (f"set group: {ValidationResult.FAILED}: "
                  f"{str(valid_constraints_count)} of "
-                 f"{len(self.validated_constraints)} constraints are valid."))
+                 f"{constraints_count} constraints are valid."))
+        return validation_information
 
     def report(self) -> List[str]:
         """Reports the validated constraint"""
@@ -226,7 +287,6 @@ class OrGroup(ConstraintComponent):
                     Raised on an invalid input parameter of
                     `ifc_instances` or `constraint_group`.
         """
-        or_validation_result = False
         valid_constraints_count = 0
         for constraint_definition in self.definition["or"]:
             constraint = config.get_constraint(
@@ -234,19 +294,26 @@ class OrGroup(ConstraintComponent):
             constraint.validate()
             if constraint.is_valid():
                 valid_constraints_count += 1
-            or_validation_result = or_validation_result or constraint.is_valid()
             self.validated_constraints.append(constraint)
-
-        if or_validation_result:
-            self.validation_information.set_valid(
+        self.validation_information = self.create_validation_information(
+            valid_constraints_count, len(self.validated_constraints))
+
+    @staticmethod
+    def create_validation_information(valid_constraints_count: int,
+                                      constraints_count: int) -> ValidationInformation:
+        """Creates the validation information of the or group by its valid constraints count"""
+        validation_information = ValidationInformation()
+        if valid_constraints_count > 0:
+            validation_information.set_valid(
                 (f"or group: {ValidationResult.VALID}: "
                  f"{valid_constraints_count} of "
-                 f"{len(self.validated_constraints)} constraints are valid."))
+                 f"{constraints_count} constraints are valid."))
         else:
-            self.validation_information.set_failed(
+            validation_information.set_failed(
                 (f"or group: {ValidationResult.FAILED}: "
                  f"No one of "
-                 f"{len(self.validated_constraints)} constraints are valid."))
+                 f"{constraints_count} constraints are valid."))
+        return validation_information
 
     def report(self) -> List[str]:
         """Reports the validated constraint"""
@@ -291,7 +358,6 @@ class AndGroup(ConstraintComponent):
                     Raised on an invalid input parameter of
                     `ifc_instances` or `constraint_group`.
         """
-        and_validation_result = True
         valid_constraints_count = 0
         for constraint_definition in self.definition["and"]:
             constraint = config.get_constraint(
@@ -299,18 +365,25 @@ class AndGroup(ConstraintComponent):
             constraint.validate()
             if constraint.is_valid():
                 valid_constraints_count += 1
-            and_validation_result = and_validation_result and constraint.is_valid()
             self.validated_constraints.append(constraint)
-
-        if and_validation_result:
-            self.validation_information.set_valid(
+        self.validation_information = self.create_validation_information(
+            valid_constraints_count, len(self.validated_constraints))
+
+    @staticmethod
+    def create_validation_information(valid_constraints_count: int,
+                                      constraints_count: int) -> ValidationInformation:
+        """Creates the validation information of the and group by its valid constraints count"""
+        validation_information = ValidationInformation()
+        if valid_constraints_count == constraints_count:
+            validation_information.set_valid(
                 (f"and group: {ValidationResult.VALID}: "
-                 f"Each of {len(self.validated_constraints)} constraints are valid."))
+                 f"Each of {constraints_count} constraints are valid."))
         else:
-            self.validation_information.set_failed(
+            validation_information.set_failed(
                 (f"and group: {ValidationResult.FAILED}: "
                  f"{valid_constraints_count} of "
-                 f"{len(self.validated_constraints)} constraints are valid."))
+                 f"{constraints_count} constraints are valid."))
+        return validation_information
 
     def report(self) -> List[str]:
         """Reports the validated constraint"""
@@ -0,0 +1,130 @@
+"""Interned, hashable and immutable rule definitions
+
+    The rules definitions read from the rules file are plain dicts and lists.
+    They are canonicalised into :class:`FrozenDict` and :class:`FrozenList` nodes,
+    which behave like dicts and lists, but are immutable and hashable.
+    Equal nodes are interned into one node, so equal constraint definitions
+    of all the rules share one node and one slot in the caches keyed by definition.
+    The paths in the rules definitions are resolved relative to their rules file.
+"""
+import os
+from typing import Any, Dict, Hashable, Tuple
+
+
+def _immutable(self, *args, **kwargs):
+    """Refuses to change the immutable definition"""
+    raise TypeError(f"{type(self).__name__} is immutable")
+
+
+class FrozenDict(dict):
+    """An immutable and hashable dict of a rule definition"""
+
+    __slots__ = ("_hash",)
+
+    def __hash__(self):
+        """Hashes the items, computed once"""
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self.items()))
+            return self._hash
+
+    __setitem__ = __delitem__ = _immutable
+    clear = pop = popitem = setdefault = update = __ior__ = _immutable
+
+    def __reduce__(self):
+        """Copies and pickles as FrozenDict"""
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """An immutable and hashable list of a rule definition"""
+
+    __slots__ = ("_hash",)
+
+    def __hash__(self):
+        """Hashes the items, computed once"""
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(tuple(self))
+            return self._hash
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+
+    def __reduce__(self):
+        """Copies and pickles as FrozenList"""
+        return (FrozenList, (list(self),))
+
+
+def intern_definition(definition: Any, interned: Dict[Hashable, Any] = None) -> Any:
+    """Canonicalises a rule definition into interned, hashable and immutable nodes.
+
+        Equal nodes are interned into one node only if their keys are in the same order
+        and their values are of the same types, so ``1`` and ``True`` or ``1.0``
+        keep their own nodes and validation messages.
+
+        Args:
+            definition:
+                The definition from the rules file, like the rules definition
+                or a constraint definition.
+            interned (Dict[Hashable, Any]):
+                The interned nodes, shared by the definitions interned together.
+                If None, the definition is interned on its own.
+
+        Returns:
+            The definition with the dicts as :class:`FrozenDict`
+            and the lists as :class:`FrozenList`, equal nodes are the same node.
+
+        Raises:
+            TypeError:
+                If a value of the definition is not hashable.
+    """
+    if interned is None:
+        interned = {}
+    return _intern(definition, interned)[0]
+
+
+def _intern(definition: Any, interned: Dict[Hashable, Any]) -> Tuple[Any, Hashable]:
+    """Interns the definition, returns the node and its signature of keys and value types"""
+    if isinstance(definition, dict):
+        items = [(key, _intern(value, interned)) for key, value in definition.items()]
+        node = FrozenDict((key, value) for key, (value, _) in items)
+        signature = tuple((key, value_signature) for key, (_, value_signature) in items)
+    elif isinstance(definition, list):
+        values = [_intern(value, interned) for value in definition]
+        node = FrozenList(value for value, _ in values)
+        signature = ("list",) + tuple(value_signature for _, value_signature in values)
+    else:
+        hash(definition)
+        return definition, type(definition).__name__
+    return interned.setdefault((node, signature), node), signature
+
+
+def resolve_allowed_values_files(definition: Any, rules_directory: str) -> Any:
+    """Resolves the paths of the allowed values files relative to the rules file.
+
+        The relative paths of the `in_file` constraint checks are joined
+        to the directory of the rules file, so they do not depend on the working directory.
+
+        Args:
+            definition:
+                The definition of the rules from the rules file.
+            rules_directory (str):
+                The directory of the rules file.
+
+        Returns:
+            The definition with the resolved paths.
+    """
+    if isinstance(definition, list):
+        return [resolve_allowed_values_files(value, rules_directory) for value in definition]
+    if not isinstance(definition, dict):
+        return definition
+    resolved = {}
+    for key, value in definition.items():
+        if key == "in_file" and isinstance(value, str):
+            resolved[key] = os.path.join(rules_directory, value)
+        else:
+            resolved[key] = resolve_allowed_values_files(value, rules_directory)
+    return resolved
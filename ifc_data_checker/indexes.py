@@ -0,0 +1,517 @@
+"""Indexes over the ifc model"""
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from ifc_data_checker import backends
+from ifc_data_checker.definitions import FrozenDict
+from ifc_data_checker.definitions import FrozenList
+from ifc_data_checker.definitions import intern_definition
+
+_active_model_index = None
+
+SHARED_CLASSES = ("IfcTypeObject",)
+"""The ifc classes of the instances shared by many instances,
+    their path results are memoised per model"""
+
+CHECK_RESULTS_SIZE = 65536
+"""The maximum count of memoised constraint check results per model"""
+
+
+class ModelIndex:
+    """Lazily built indexes over an ifc model.
+
+        Every index is built on its first usage with one scan over the model
+        and reused for all the rules validated on the same model.
+        The indexes are built and the check results are memoised under a lock,
+        so the ifc instances can be validated on several threads.
+    """
+
+    def __init__(self, ifc_model):
+        """Constructor
+
+            Args:
+                ifc_model:
+                    The ifc model to build the indexes on.
+
+            Raises:
+                ValueError:
+                    If the input parameter `ifc_model` is None.
+        """
+        if ifc_model is None:
+            raise ValueError("ifc_model is None")
+        self.ifc_model = ifc_model
+        self._attribute_indexes = {}
+        self._containment_index = None
+        self._type_index = None
+        self._inverse_references = {}
+        self._inverse_indexes = {}
+        self._shared_classes = {}
+        self._shared_path_results = {}
+        self._check_results = OrderedDict()
+        self._interned_nodes = {}
+        self._interned_definitions = {}
+        self._lock = threading.RLock()
+        self._shared_prefixes = {}
+        self._prefix_results = {}
+        self._allowed_values = {}
+        self._loaded_allowed_values = {}
+
+    def attribute_index(self, ifc_class: str, attribute_name: str) -> Dict[Any, Set[int]]:
+        """Gets the index of the attribute values of the instances of `ifc_class`.
+
+            Instances without the attribute or with an unhashable value are not indexed.
+
+            Args:
+                ifc_class (str):
+                    The ifc class of the indexed instances.
+                attribute_name (str):
+                    The name of the indexed attribute.
+
+            Returns:
+                Dict[Any, Set[int]]:
+                    The ids of the instances by their attribute value.
+        """
+        key = (ifc_class, attribute_name)
+        if key in self._attribute_indexes:
+            return self._attribute_indexes[key]
+        with self._lock:
+            if key in self._attribute_indexes:
+                return self._attribute_indexes[key]
+            index = {}
+            backend = backends.get_active_backend()
+            for ifc_instance in backend.by_type(self.ifc_model, ifc_class):
+                if not backend.has_attribute(ifc_instance, attribute_name):
+                    continue
+                try:
+                    index.setdefault(backend.get_attribute(ifc_instance, attribute_name),
+                                     set()).add(backend.id(ifc_instance))
+                except TypeError:
+                    continue
+            self._attribute_indexes[key] = index
+        return index
+
+    def filter_by_attribute(self, ifc_instances: List[Any], attribute_name: str,
+                            attribute_value) -> List[Any]:
+        """Filters the `ifc_instances` by their attribute value with the attribute indexes.
+
+            The attribute index is looked up by the ifc class of each instance.
+            Values without an id in the ifc model, like the wrapped values of
+            properties, are compared directly.
+
+            Args:
+                ifc_instances (List[Any]):
+                    The instances to filter.
+                attribute_name (str):
+                    The name of the filtered attribute.
+                attribute_value:
+                    The value of the filtered attribute.
+
+            Returns:
+                List[Any]:
+                    The instances with the attribute value.
+        """
+        selected_instances = []
+        backend = backends.get_active_backend()
+        for ifc_instance in ifc_instances:
+            if _is_indexable(ifc_instance):
+                try:
+                    ids = self.attribute_index(
+                        backend.is_a(ifc_instance), attribute_name).get(attribute_value, ())
+                except TypeError:
+                    ids = ()
+                if backend.id(ifc_instance) in ids:
+                    selected_instances.append(ifc_instance)
+            elif (backend.has_attribute(ifc_instance, attribute_name) and
+                  backend.get_attribute(ifc_instance, attribute_name) == attribute_value):
+                selected_instances.append(ifc_instance)
+        return selected_instances
+
+    def containment_index(self) -> Dict[Any, Set[int]]:
+        """Gets the ids of the contained elements by the names of the spatial structure elements.
+
+            Built on the `IfcRelContainedInSpatialStructure` relations of the model.
+            Following the spatial decomposition by the `IfcRelAggregates` relations,
+            an element contained in a spatial structure element, like a space,
+            is contained in the spatial structure elements it decomposes as well,
+            like the storey and the building of the space.
+
+            Returns:
+                Dict[Any, Set[int]]:
+                    The ids of the contained elements by the name
+                    of the spatial structure element.
+        """
+        if self._containment_index is not None:
+            return self._containment_index
+        with self._lock:
+            if self._containment_index is not None:
+                return self._containment_index
+            backend = backends.get_active_backend()
+            structures = {}
+            contained_ids = {}
+            for relation in backend.by_type(self.ifc_model, "IfcRelContainedInSpatialStructure"):
+                relating_structure = backend.get_attribute(relation, "RelatingStructure")
+                structure_id = backend.id(relating_structure)
+                structures[structure_id] = relating_structure
+                contained_ids.setdefault(structure_id, set()).update(
+                    backend.id(element)
+                    for element in backend.get_attribute(relation, "RelatedElements"))
+            decomposed_objects = {}
+            for relation in backend.by_type(self.ifc_model, "IfcRelAggregates"):
+                relating_object = backend.get_attribute(relation, "RelatingObject")
+                for related_object in backend.get_attribute(relation, "RelatedObjects"):
+                    decomposed_objects[backend.id(related_object)] = relating_object
+            index = {}
+            for structure_id, element_ids in contained_ids.items():
+                structure = structures[structure_id]
+                visited_ids = set()
+                while structure is not None and structure_id not in visited_ids:
+                    visited_ids.add(structure_id)
+                    name = backend.get_attribute(structure, "Name")
+                    index.setdefault(name, set()).update(element_ids)
+                    structure = decomposed_objects.get(structure_id)
+                    if structure is not None:
+                        structure_id = backend.id(structure)
+            self._containment_index = index
+        return index
+
+    def type_index(self) -> Dict[int, Any]:
+        """Gets the type objects by the ids of their typed occurrences.
+
+            Built on the `IfcRelDefinesByType` relations of the model.
+
+            Returns:
+                Dict[int, Any]:
+                    The type object by the id of the occurrence.
+        """
+        if self._type_index is not None:
+            return self._type_index
+        with self._lock:
+            if self._type_index is not None:
+                return self._type_index
+            index = {}
+            backend = backends.get_active_backend()
+            for relation in backend.by_type(self.ifc_model, "IfcRelDefinesByType"):
+                relating_type = backend.get_attribute(relation, "RelatingType")
+                for ifc_object in backend.get_attribute(relation, "RelatedObjects"):
+                    index[backend.id(ifc_object)] = relating_type
+            self._type_index = index
+        return index
+
+    def inverse_index(self, entity_reference: str,
+                      attribute_reference: str) -> Dict[int, List[Any]]:
+        """Gets the index of an inverse attribute.
+
+            Built with one scan over the instances of `entity_reference`,
+            in the order of the ifc model.
+
+            Args:
+                entity_reference (str):
+                    The ifc class referencing the instances, like `IfcRelDefines`.
+                attribute_reference (str):
+                    The attribute of `entity_reference` referencing the instances,
+                    like `RelatedObjects`.
+
+            Returns:
+                Dict[int, List[Any]]:
+                    The referencing instances by the id of the referenced instance.
+        """
+        key = (entity_reference, attribute_reference)
+        if key in self._inverse_indexes:
+            return self._inverse_indexes[key]
+        with self._lock:
+            if key in self._inverse_indexes:
+                return self._inverse_indexes[key]
+            index = {}
+            backend = backends.get_active_backend()
+            for relation in backend.by_type(self.ifc_model, entity_reference):
+                value = backend.get_attribute(relation, attribute_reference)
+                references = value if isinstance(value, (tuple, list)) else (value,)
+                for reference in references:
+                    if _is_indexable(reference):
+                        index.setdefault(backend.id(reference), []).append(relation)
+            self._inverse_indexes[key] = index
+        return index
+
+    def get_inverse(self, ifc_instance, attribute_name: str) -> Optional[Tuple[Any, ...]]:
+        """Gets the instances of the inverse attribute of the `ifc_instance` by the inverse index.
+
+            Args:
+                ifc_instance:
+                    The referenced instance.
+                attribute_name (str):
+                    The name of the inverse attribute, like `IsDefinedBy`.
+
+            Returns:
+                Optional[Tuple[Any, ...]]:
+                    The referencing instances, None if the attribute is no inverse attribute
+                    with an inverse index.
+        """
+        if not _is_indexable(ifc_instance):
+            return None
+        backend = backends.get_active_backend()
+        ifc_class = backend.is_a(ifc_instance)
+        key = (ifc_class, attribute_name)
+        if key not in self._inverse_references:
+            self._inverse_references[key] = backend.inverse_reference(
+                self.ifc_model, ifc_class, attribute_name)
+        inverse_reference = self._inverse_references[key]
+        if inverse_reference is None:
+            return None
+        return tuple(self.inverse_index(*inverse_reference).get(backend.id(ifc_instance), ()))
+
+    def is_shared(self, ifc_instance) -> bool:
+        """Checks if the `ifc_instance` is an instance of the `SHARED_CLASSES`"""
+        if not _is_indexable(ifc_instance):
+            return False
+        backend = backends.get_active_backend()
+        ifc_class = backend.is_a(ifc_instance)
+        if ifc_class not in self._shared_classes:
+            self._shared_classes[ifc_class] = any(
+                backend.is_a(ifc_instance, shared_class) for shared_class in SHARED_CLASSES)
+        return self._shared_classes[ifc_class]
+
+    def interned(self, definition) -> Any:
+        """Gets the interned node of a definition.
+
+            Plain dicts and lists are interned on their first usage,
+            see :func:`ifc_data_checker.definitions.intern_definition`.
+
+            Raises:
+                TypeError:
+                    If a value of the definition is not hashable.
+        """
+        if isinstance(definition, (FrozenDict, FrozenList)):
+            return definition
+        interned = self._interned_definitions.get(id(definition))
+        if interned is None or interned[0] is not definition:
+            interned = (definition, intern_definition(definition, self._interned_nodes))
+            self._interned_definitions[id(definition)] = interned
+        return interned[1]
+
+    def allowed_values(self, values: list, compile_values: Callable[[Any], Any]) -> Any:
+        """Gets the compiled allowed values of an in constraint check.
+
+            The allowed values are compiled once per interned definition
+            and kept as long as the model index.
+
+            Args:
+                values (list):
+                    The allowed values of the in constraint check from the rules file.
+                compile_values (Callable[[list], AllowedValues]):
+                    Compiles the allowed values.
+
+            Returns:
+                AllowedValues:
+                    The compiled allowed values.
+        """
+        try:
+            values = self.interned(values)
+        except TypeError:
+            return compile_values(values)
+        with self._lock:
+            compiled = self._allowed_values.get(id(values))
+            if compiled is None:
+                compiled = (values, compile_values(values))
+                self._allowed_values[id(values)] = compiled
+        return compiled[1]
+
+    def loaded_allowed_values(self, file_name: str, load_values: Callable[[str], Any]) -> Any:
+        """Gets the allowed values loaded from the file of an in file constraint check.
+
+            The file is loaded once per file name and kept as long as the model index,
+            so once per validation.
+
+            Args:
+                file_name (str):
+                    The path of the allowed values file from the rules file.
+                load_values (Callable[[str], AllowedValues]):
+                    Loads the allowed values from the file.
+
+            Returns:
+                AllowedValues:
+                    The allowed values from the file.
+        """
+        loaded = self._loaded_allowed_values.get(file_name)
+        if loaded is not None:
+            return loaded
+        with self._lock:
+            loaded = self._loaded_allowed_values.get(file_name)
+            if loaded is None:
+                loaded = load_values(file_name)
+                self._loaded_allowed_values[file_name] = loaded
+        return loaded
+
+    def shared_path_results(self, ifc_instance, path: List[dict], position: int,
+                            apply_path: Callable[[], List[Any]]) -> List[Any]:
+        """Gets the memoised path results of a path starting at the shared `ifc_instance`.
+
+            The path is applied once per shared instance and path,
+            an error of applying the path is raised again on each usage.
+
+            Args:
+                ifc_instance:
+                    The shared instance the path starts at.
+                path (List[dict]):
+                    The path definition.
+                position (int):
+                    The position of the first path operator applied on the `ifc_instance`.
+                apply_path (Callable[[], List[Any]]):
+                    Applies the path from `position` on the `ifc_instance`.
+
+            Returns:
+                List[Any]:
+                    The path results.
+        """
+        try:
+            path = self.interned(path)
+        except TypeError:
+            return apply_path()
+        key = (backends.get_active_backend().id(ifc_instance), id(path), position)
+        return _memoised_path_results(self._shared_path_results, key, path, apply_path)
+
+    def share_path_prefixes(self, shared_prefixes: Dict[int, Tuple[list, list]],
+                            prefix_results: Optional[Dict[Hashable, Any]]):
+        """Shares the path prefixes of the paths of the rules validated next.
+
+            Set by the :class:`ifc_data_checker.planner.ValidationPlan` for each group
+            of rules on the same ifc instances. Unset with an empty `shared_prefixes`.
+
+            Args:
+                shared_prefixes (Dict[int, Tuple[list, list]]):
+                    The path and its shared path prefix by the id of the path.
+                prefix_results (Optional[Dict[Hashable, Any]]):
+                    The memoised path results of the shared path prefixes,
+                    shared by the rules of the group.
+        """
+        self._shared_prefixes = shared_prefixes
+        self._prefix_results = {} if prefix_results is None else prefix_results
+
+    def shared_prefix(self, path: List[dict]) -> Optional[List[dict]]:
+        """Gets the shared path prefix of the `path`, None if the path prefix is not shared"""
+        shared_prefix = self._shared_prefixes.get(id(path))
+        if shared_prefix is None or shared_prefix[0] is not path:
+            return None
+        return shared_prefix[1]
+
+    def prefix_path_results(self, ifc_instance, prefix: List[dict],
+                            apply_prefix: Callable[[], List[Any]]) -> List[Any]:
+        """Gets the memoised path results of a shared path prefix on the `ifc_instance`.
+
+            The path prefix is applied once per instance for all the rules sharing it,
+            an error of applying the path prefix is raised again on each usage.
+
+            Args:
+                ifc_instance:
+                    The validated instance the path prefix starts at.
+                prefix (List[dict]):
+                    The shared path prefix, see :meth:`shared_prefix`.
+                apply_prefix (Callable[[], List[Any]]):
+                    Applies the path prefix on the `ifc_instance`.
+
+            Returns:
+                List[Any]:
+                    The path results of the path prefix.
+        """
+        if not _is_indexable(ifc_instance):
+            return apply_prefix()
+        key = (backends.get_active_backend().id(ifc_instance), id(prefix))
+        return _memoised_path_results(self._prefix_results, key, prefix, apply_prefix)
+
+    def check_result(self, check_definition: dict, path_result,
+                     validate: Callable[[], Any]) -> Any:
+        """Gets the memoised validation information of a constraint check on a path result.
+
+            The validation informations are memoised by the interned check definition and
+            the id of the path result, if it is an instance of the model,
+            or the path result itself, if it is hashable.
+            So the same check on an instance shared by many instances, like a property set,
+            is validated once, even for equal checks of different rules.
+            At most `CHECK_RESULTS_SIZE` validation informations are kept,
+            the least recently used are dropped first.
+
+            Args:
+                check_definition (dict):
+                    The constraint check definition from the rules file.
+                path_result:
+                    The path result to validate.
+                validate (Callable[[], ValidationInformation]):
+                    Validates the constraint check on the path result.
+
+            Returns:
+                ValidationInformation:
+                    A copy of the memoised validation information.
+        """
+        value_key = _value_key(path_result)
+        if value_key is None:
+            return validate()
+        try:
+            check_definition = self.interned(check_definition)
+        except TypeError:
+            return validate()
+        key = (id(check_definition), value_key)
+        with self._lock:
+            memoised = self._check_results.get(key)
+            if memoised is not None:
+                self._check_results.move_to_end(key)
+        if memoised is None:
+            memoised = (check_definition, validate())
+            with self._lock:
+                self._check_results[key] = memoised
+                if len(self._check_results) > CHECK_RESULTS_SIZE:
+                    self._check_results.popitem(last=False)
+        return copy.copy(memoised[1])
+
+
+def _memoised_path_results(memo: Dict[Hashable, Any], key: Hashable, path: List[dict],
+                           apply_path: Callable[[], List[Any]]) -> List[Any]:
+    """Gets the path results memoised by `key`, applies the path on the first usage.
+
+        The `path` is kept with the path results, so its id in the `key` stays unique.
+    """
+    if key not in memo:
+        try:
+            path_results = tuple(apply_path())
+        except (ValueError, IndexError, AttributeError) as error:
+            path_results = error
+        memo[key] = (path, path_results)
+    _, path_results = memo[key]
+    if isinstance(path_results, Exception):
+        raise type(path_results)(*path_results.args)
+    return list(path_results)
+
+
+def _value_key(path_result) -> Optional[Hashable]:
+    """Gets the key of a path result, None if it can not be memoised"""
+    if backends.get_active_backend().is_entity(path_result):
+        if _is_indexable(path_result):
+            return ("id", backends.get_active_backend().id(path_result))
+        return None
+    try:
+        hash(path_result)
+    except TypeError:
+        return None
+    return (type(path_result).__name__, path_result)
+
+
+def _is_indexable(ifc_instance) -> bool:
+    """Checks if the `ifc_instance` is an entity with an id in the ifc model"""
+    backend = backends.get_active_backend()
+    return bool(backend.is_entity(ifc_instance) and hasattr(ifc_instance, "id") and
+                backend.id(ifc_instance))
+
+
+def activate(model_index: Optional[ModelIndex]):
+    """Activates the `model_index` for the validation of the rules.
+
+        The path operators use the indexes of the active model index.
+        Deactivated with ``None``.
+    """
+    global _active_model_index  # pylint: disable=global-statement
+    _active_model_index = model_index
+
+
+def get_active_model_index() -> Optional[ModelIndex]:
+    """Gets the active model index, None if no model index is active"""
+    return _active_model_index
@@ -0,0 +1,152 @@
+"""Instance Filters"""
+import abc
+from typing import List, Set
+
+from ifc_data_checker import backends
+from ifc_data_checker.indexes import ModelIndex
+from ifc_data_checker.yaml_helper import YamlMatchingKeys
+
+
+class InstanceFilter(abc.ABC, YamlMatchingKeys):
+    """The instance filter base class.
+
+        Instance filters are defined in the `where` clause of a rule.
+        They pre-select the ifc instances of a rule with the indexes of the ifc model,
+        before the constraints of the rule get validated.
+
+        Every instance filter implementation need to
+        inherit from this class :class:`InstanceFilter`.
+    """
+
+    def __init__(self, definition: dict, model_index: ModelIndex):
+        """Constructor
+
+            Args:
+                definition (dict):
+                    The instance filter from the `where` clause of the rules file.
+                model_index (ModelIndex):
+                    The indexes of the ifc model to select the instances.
+
+            Raises:
+                ValueError:
+                    Raised on an invalid input parameter of
+                    `definition` or `model_index`.
+        """
+        if not definition:
+            raise ValueError("definition is None")
+        if not isinstance(definition, dict):
+            raise ValueError((f"definition {definition} is not of type dict "
+                              f"- definition is of type {type(definition)}"))
+        for yaml_key in self.yaml_keys:
+            if not yaml_key in definition:
+                raise ValueError(
+                    f"The key {yaml_key} is missing in instance filter {definition}")
+            if definition[yaml_key] is None or definition[yaml_key] == "":
+                raise ValueError(
+                    f"definition[{yaml_key}] is None")
+        self.definition = definition
+        if model_index is None:
+            raise ValueError("model_index is None")
+        self.model_index = model_index
+
+    @abc.abstractmethod
+    def matching_ids(self, ifc_classes: List[str]) -> Set[int]:
+        """Gets the ids of the instances matching the instance filter.
+
+            Args:
+                ifc_classes (List[str]):
+                    The defined ifc classes of the rule definition.
+
+            Returns:
+                Set[int]:
+                    The ids of the matching instances.
+        """
+
+
+class AttributeInstanceFilter(InstanceFilter):
+    """The attribute instance filter class
+
+        Example:
+            Defintion of an attribute instance filter in the rules file::
+
+                where:
+                  - attribute: attributename
+                    value: value to filter
+    """
+
+    yaml_keys = tuple(["attribute", "value"])
+    """In the rules yaml the :class:`AttributeInstanceFilter`
+    is defined by the keyword `attribute` and `value`"""
+
+    def matching_ids(self, ifc_classes: List[str]) -> Set[int]:
+        """Selects the instances by their attribute value with the attribute index.
+
+            Returns:
+                Set[int]:
+                    The ids of the instances with the defined attribute value.
+        """
+        ids = set()
+        for ifc_class in ifc_classes:
+            attribute_index = self.model_index.attribute_index(
+                ifc_class, self.definition["attribute"])
+            ids |= attribute_index.get(self.definition["value"], set())
+        return ids
+
+
+class ContainmentInstanceFilter(InstanceFilter):
+    """The containment instance filter class
+
+        Selects the elements contained in the spatial structure element
+        (e.g. ``IfcBuildingStorey``) with the given name, including the elements
+        contained in the spatial structure elements decomposing it (e.g. ``IfcSpace``).
+
+        Example:
+            Defintion of a containment instance filter in the rules file::
+
+                where:
+                  - contained_in: spatial structure element name
+    """
+
+    yaml_keys = tuple(["contained_in"])
+    """In the rules yaml the :class:`ContainmentInstanceFilter`
+    is defined by the keyword `contained_in`"""
+
+    def matching_ids(self, ifc_classes: List[str]) -> Set[int]:
+        """Selects the instances by their spatial structure element with the containment index.
+
+            The containment index is looked up by the name of the spatial structure element.
+
+            Returns:
+                Set[int]:
+                    The ids of the instances contained in the spatial structure element.
+        """
+        return set(self.model_index.containment_index().get(self.definition["contained_in"], ()))
+
+
+class TypeInstanceFilter(InstanceFilter):
+    """The type instance filter class
+
+        Selects the occurrences typed by the type object with the given name.
+
+        Example:
+            Defintion of a type instance filter in the rules file::
+
+                where:
+                  - typed_by: type object name
+    """
+
+    yaml_keys = tuple(["typed_by"])
+    """In the rules yaml the :class:`TypeInstanceFilter` is defined by the keyword `typed_by`"""
+
+    def matching_ids(self, ifc_classes: List[str]) -> Set[int]:
+        """Selects the instances by their type object with the type index.
+
+            Returns:
+                Set[int]:
+                    The ids of the instances typed by the type object.
+        """
+        type_name = self.definition["typed_by"]
+        backend = backends.get_active_backend()
+        return {occurrence_id
+                for occurrence_id, type_object in self.model_index.type_index().items()
+                if backend.get_attribute(type_object, "Name") == type_name}
@@ -2,6 +2,8 @@
 import abc
 from typing import Any, List
 
+from ifc_data_checker import backends
+from ifc_data_checker import indexes
 from ifc_data_checker.yaml_helper import YamlMatchingKeys
 
 
@@ -76,13 +78,15 @@ class AttributePathOperator(PathOperator):
     def apply(self) -> List[Any]:
         """Applies the attribute path operator on the actual position.
 
-            Using of `getattr` to get the value of an attribute by its name.
+            Using of the active model backend to get the value of an attribute by its name.
 
             Returns:
                 List[Any]:
                     The selected values after applying the `path_operator`.
         """
-        return list(map(lambda i: getattr(i, self.definition["attribute"]), self.actual_position))
+        backend = backends.get_active_backend()
+        attribute_name = self.definition["attribute"]
+        return [backend.get_attribute(i, attribute_name) for i in self.actual_position]
 
 
 class AttributeFilterPathOperator(PathOperator):
@@ -103,8 +107,10 @@ class AttributeFilterPathOperator(PathOperator):
     def apply(self) -> List[Any]:
         """Applies the attribute filter path operator on the actual position.
 
-            Using of `getattr` to get the value of an attribute by its name.
+            Using of the active model backend to get the value of an attribute by its name.
             And then filters by their values.
+            If a model index is active, the ifc instances are filtered
+            with its attribute index instead.
 
             Returns:
                 list:
@@ -112,9 +118,14 @@ class AttributeFilterPathOperator(PathOperator):
         """
         attribute_name = self.definition["attribute"]
         attribute_value = self.definition["value"]
-        return list(filter(lambda i:
-                           hasattr(i, attribute_name) and
-                           getattr(i, attribute_name) == attribute_value, self.actual_position))
+        model_index = indexes.get_active_model_index()
+        if model_index is not None:
+            return model_index.filter_by_attribute(
+                self.actual_position, attribute_name, attribute_value)
+        backend = backends.get_active_backend()
+        return [i for i in self.actual_position
+                if backend.has_attribute(i, attribute_name) and
+                backend.get_attribute(i, attribute_name) == attribute_value]
 
 
 class TypeFilterPathOperator(PathOperator):
@@ -133,14 +144,16 @@ class TypeFilterPathOperator(PathOperator):
     def apply(self) -> List[Any]:
         """Applies the type filter path operator on the actual position.
 
-            Using of ifcopenshell function `is_a` to get the type of the actual position.
+            Using of the active model backend to get the type of the actual position.
             And then filters by their type.
 
             Returns:
                 List[Any]:
                     The selected values after applying the `path_operator`.
         """
-        return list(filter(lambda i: i.is_a(self.definition["type"]), self.actual_position))
+        backend = backends.get_active_backend()
+        ifc_class = self.definition["type"]
+        return [i for i in self.actual_position if backend.is_a(i, ifc_class)]
 
 
 class ListPathOperator(PathOperator):
@@ -159,15 +172,24 @@ class ListPathOperator(PathOperator):
     def apply(self) -> List[Any]:
         """Applies the list path operator on the actual position.
 
-            Using of `getattr` to get the list of its name.
+            Using of the active model backend to get the list of its name.
             And then selecting all the items of this list as the new `actual_position`.
+            If a model index is active, the lists of inverse attributes like `IsDefinedBy`
+            are taken from its inverse indexes instead.
 
             Returns:
                 List[Any]:
                     The selected values after applying the `path_operator`.
         """
-        def execute_list(instances, list_name):
-            return [tuple_attribute
-                    for i in instances
-                    for tuple_attribute in list(getattr(i, list_name))]
-        return execute_list(self.actual_position, self.definition["list"])
+        backend = backends.get_active_backend()
+        model_index = indexes.get_active_model_index()
+        list_name = self.definition["list"]
+        selected_values = []
+        for i in self.actual_position:
+            values = None
+            if model_index is not None:
+                values = model_index.get_inverse(i, list_name)
+            if values is None:
+                values = backend.get_attribute(i, list_name)
+            selected_values.extend(values)
+        return selected_values
@@ -0,0 +1,120 @@
+"""Plan the validation of the rules sharing their ifc instances and path prefixes
+
+    The rules are grouped by their ifc classes and where clause, so the ifc instances
+    of a group are selected once for all its rules. Within a group, the path prefixes
+    of the constraints used more than once are applied once per ifc instance
+    and shared by the constraints of all the rules of the group.
+"""
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ifc_data_checker.columns import is_columnar
+from ifc_data_checker.definitions import FrozenList
+
+MIN_PREFIX_LENGTH = 2
+"""The minimum count of path operators of a shared path prefix"""
+
+
+class RuleGroup:
+    """The rules of a rules file with the same ifc classes and where clause"""
+
+    def __init__(self, ifc_classes: List[str], where_definition: Optional[List[dict]]):
+        """Constructor
+
+            Args:
+                ifc_classes (List[str]):
+                    The defined ifc classes of the rules.
+                where_definition (Optional[List[dict]]):
+                    The instance filters of the where clause of the rules.
+        """
+        self.ifc_classes = ifc_classes
+        self.where_definition = where_definition
+        self.positions: List[int] = []
+        self.shared_prefixes: Dict[int, Tuple[list, FrozenList]] = {}
+        """The shared path prefixes by the id of the path, with the path"""
+        self.ifc_instances: Optional[tuple] = None
+        """The selected ifc instances, while rules of the group are validated"""
+        self.prefix_results: Optional[Dict[Any, Any]] = None
+        """The path results of the shared path prefixes, while rules of the group
+            are validated"""
+
+
+class ValidationPlan:
+    """The plan to validate the rules of a rules file in the order of the rules file"""
+
+    def __init__(self, rules_definition: List[dict]):
+        """Constructor
+
+            Args:
+                rules_definition (List[dict]):
+                    The definition of all rules from the rules file,
+                    interned by :func:`ifc_data_checker.definitions.intern_definition`
+                    to share the groups of equal ifc classes and where clauses.
+        """
+        groups: Dict[Any, RuleGroup] = {}
+        self.groups: List[RuleGroup] = []
+        self._groups_by_position: List[RuleGroup] = []
+        for position, rule_definition in enumerate(rules_definition):
+            ifc_classes = rule_definition["rule"]["classes"]
+            where_definition = rule_definition["rule"].get("where")
+            try:
+                key = (ifc_classes, where_definition)
+                hash(key)
+            except TypeError:
+                key = position
+            if key not in groups:
+                groups[key] = RuleGroup(ifc_classes, where_definition)
+                self.groups.append(groups[key])
+            groups[key].positions.append(position)
+            self._groups_by_position.append(groups[key])
+        for group in self.groups:
+            group.shared_prefixes = _shared_prefixes(
+                _constraint_paths(rules_definition[position]["rule"]["constraints"]
+                                  for position in group.positions))
+
+    def group(self, position: int) -> RuleGroup:
+        """Gets the group of the rule at `position` of the rules file"""
+        return self._groups_by_position[position]
+
+    def is_last(self, position: int) -> bool:
+        """Checks if the rule at `position` is the last rule of its group"""
+        return self._groups_by_position[position].positions[-1] == position
+
+
+def _constraint_paths(constraints_definitions: Iterable[List[dict]]) -> Iterator[list]:
+    """Gets the paths of the constraints validated instance by instance,
+        including the constraints of the constraint groups"""
+    for constraints_definition in constraints_definitions:
+        for definition in constraints_definition or ():
+            if not isinstance(definition, dict) or is_columnar(definition):
+                continue
+            if "path" in definition:
+                if isinstance(definition["path"], FrozenList):
+                    yield definition["path"]
+            elif len(definition) == 1:
+                group_definition = next(iter(definition.values()))
+                if isinstance(group_definition, list):
+                    yield from _constraint_paths([group_definition])
+
+
+def _shared_prefixes(paths: Iterable[FrozenList]) -> Dict[int, Tuple[list, FrozenList]]:
+    """Gets the longest path prefix of each path used by more than one constraint.
+
+        Returns:
+            Dict[int, Tuple[list, FrozenList]]:
+                The path and its shared path prefix by the id of the path.
+    """
+    paths = list(paths)
+    prefix_counts = Counter()
+    for path in paths:
+        for length in range(MIN_PREFIX_LENGTH, len(path) + 1):
+            prefix_counts[FrozenList(path[:length])] += 1
+    prefixes = {}
+    shared_prefixes = {}
+    for path in paths:
+        for length in range(len(path), MIN_PREFIX_LENGTH - 1, -1):
+            prefix = FrozenList(path[:length])
+            if prefix_counts[prefix] > 1:
+                shared_prefixes[id(path)] = (path, prefixes.setdefault(prefix, prefix))
+                break
+    return shared_prefixes
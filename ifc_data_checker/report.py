@@ -1,33 +1,38 @@
 """Report the validation results"""
-from typing import List
+import html
+import json
+import sys
+from typing import Iterable, Iterator, List, TextIO
 from os import path
 
+from ifc_data_checker import backends
+from ifc_data_checker.report_columns import ColumnarReportWriter
 from ifc_data_checker.rules import Rule
+from ifc_data_checker.validation import ValidationInformation
+from ifc_data_checker.validation import ValidationResult
 
 
-def _create_report(validated_rules: List[Rule]) -> List[str]:
+def _create_report(validated_rules: Iterable[Rule]) -> Iterator[List[str]]:
     """Creates the report on the given validated rules
 
         Args:
-            validated_rules (List[Rule]):
+            validated_rules (Iterable[Rule]):
                 The rules to report
 
-        Returns:
+        Yields:
             List[str]:
-                The report of the rules as List of lines
+                The report of each rule as List of lines
     """
-    report = []
     for validated_rule in validated_rules:
-        report.append(validated_rule.report())
-    return report
+        yield validated_rule.report()
 
 
-def create_validation_report_console(validated_rules: List[Rule],
+def create_validation_report_console(validated_rules: Iterable[Rule],
                                      rules_file: str, ifc_file: str):
     """Create a validation report on the console.
 
         Args:
-            validated_rules (List[Rule]):
+            validated_rules (Iterable[Rule]):
                 The validated rules from the validations
             rules_file (str):
                 The file path of the rules file.
@@ -37,31 +42,334 @@ def create_validation_report_console(validated_rules: List[Rule],
     rules_file_name = path.basename(rules_file)
     ifc_file_name = path.basename(ifc_file)
     print(f"validation report {rules_file_name} {ifc_file_name}")
-    reported_rules = _create_report(validated_rules)
-    for rule in reported_rules:
+    for rule in _create_report(validated_rules):
         print(*rule, sep="\n")
 
 
-def create_validation_report_file(validated_rules: List[Rule],
-                                  rules_file: str, ifc_file: str):
+def create_validation_report_file(validated_rules: Iterable[Rule],
+                                  rules_file: str, ifc_file: str, report_directory: str = None):
     """Creates a validation report file.
 
         If the validation report file already exists, then it will be overridden.
 
         Args:
-            validated_rules (List[Rule]):
+            validated_rules (Iterable[Rule]):
                 The validated rules from the validations
             rules_file (str):
                 The file path of the rules file.
             ifc_file (str):
                 The file path of the ifc file.
+            report_directory (str):
+                The directory of the validation report file. If None, the working directory.
     """
     rules_file_name = path.basename(rules_file)
     ifc_file_name = path.basename(ifc_file)
-    validation_report_file_name = f"validation report {rules_file_name} {ifc_file_name}.txt"
+    validation_report_file_name = path.join(
+        report_directory or "", f"validation report {rules_file_name} {ifc_file_name}.txt")
     with open(validation_report_file_name, 'w+') as validation_report_file:
         validation_report_file.write(
             f"validation report {rules_file_name} {ifc_file_name}\n")
-        report_lines = _create_report(validated_rules)
-        for rule in report_lines:
+        for rule in _create_report(validated_rules):
             validation_report_file.write('\n'.join(rule) + '\n')
+
+
+def _create_constraint_records(validated_constraint, rule_position: int, ifc_instance,
+                               constraint_path: str) -> Iterator[dict]:
+    """Creates the records of the validated constraint and its constraint components"""
+    validation_information = validated_constraint.validation_information
+    backend = backends.get_active_backend()
+    yield {
+        "record": "constraint",
+        "rule": rule_position,
+        "global_id": backend.get_attribute(ifc_instance, "GlobalId"),
+        "type": backend.is_a(ifc_instance),
+        "path": constraint_path,
+        "result": validation_information.validation_result.name,
+        "message": validation_information.message
+    }
+    if hasattr(validated_constraint, "validated_constraints"):
+        group_key = next(iter(validated_constraint.definition.keys()))
+        for position, constraint in enumerate(validated_constraint.validated_constraints):
+            yield from _create_constraint_records(
+                constraint, rule_position, ifc_instance,
+                f"{constraint_path}.{group_key}[{position}]")
+
+
+def _create_rule_records(rule_position: int, validated_rule: Rule) -> Iterator[dict]:
+    """Creates the records of the validated rule, its instances and constraints"""
+    yield {
+        "record": "rule",
+        "rule": rule_position,
+        "path": f"rules[{rule_position}].rule",
+        "classes": validated_rule.get_classes(),
+        "result": validated_rule.validation_information.validation_result.name,
+        "message": validated_rule.validation_information.message
+    }
+    backend = backends.get_active_backend()
+    for instance_validation in validated_rule.validation:
+        ifc_instance = instance_validation['ifc_instance']
+        validation_information = instance_validation['validation_information']
+        yield {
+            "record": "instance",
+            "rule": rule_position,
+            "global_id": backend.get_attribute(ifc_instance, "GlobalId"),
+            "type": backend.is_a(ifc_instance),
+            "name": backend.get_attribute(ifc_instance, "Name"),
+            "result": validation_information.validation_result.name,
+            "message": validation_information.message
+        }
+        for position, validated_constraint in zip(
+                instance_validation['constraint_positions'],
+                instance_validation['validated_constraints']):
+            yield from _create_constraint_records(
+                validated_constraint, rule_position, ifc_instance,
+                f"rules[{rule_position}].rule.constraints[{position}]")
+
+
+def _create_records(validated_rules: Iterable[Rule]) -> Iterator[dict]:
+    """Creates the records of the validated rules, their instances and constraints
+
+        Args:
+            validated_rules (Iterable[Rule]):
+                The rules to report
+
+        Yields:
+            dict:
+                One record per rule, instance and constraint
+    """
+    for rule_position, validated_rule in enumerate(validated_rules):
+        yield from _create_rule_records(rule_position, validated_rule)
+
+
+def create_json_report_chunks(validated_rules: Iterable[Rule], rules_file: str,
+                              ifc_file: str) -> Iterator[str]:
+    """Creates the JSON lines validation report in chunks.
+
+        Args:
+            validated_rules (Iterable[Rule]):
+                The validated rules from the validations
+            rules_file (str):
+                The file path of the rules file.
+            ifc_file (str):
+                The file path of the ifc file.
+
+        Yields:
+            str:
+                The JSON line of the report record first,
+                then the JSON lines of each rule as soon as the rule is validated.
+    """
+    yield json.dumps({
+        "record": "report",
+        "rules_file": path.basename(rules_file),
+        "ifc_file": path.basename(ifc_file)
+    }, ensure_ascii=False) + "\n"
+    for rule_position, validated_rule in enumerate(validated_rules):
+        yield "".join(json.dumps(record, ensure_ascii=False) + "\n"
+                      for record in _create_rule_records(rule_position, validated_rule))
+
+
+def _write_json_report(validated_rules: Iterable[Rule], rules_file: str, ifc_file: str,
+                       json_report: TextIO):
+    """Writes the records of the validated rules as JSON lines to `json_report`"""
+    for chunk in create_json_report_chunks(validated_rules, rules_file, ifc_file):
+        json_report.write(chunk)
+
+
+def create_validation_report_json_console(validated_rules: Iterable[Rule],
+                                          rules_file: str, ifc_file: str):
+    """Create a JSON lines validation report on the console.
+
+        Each line is a JSON record of a rule, an instance or a constraint,
+        written as soon as the rule is validated.
+
+        Args:
+            validated_rules (Iterable[Rule]):
+                The validated rules from the validations
+            rules_file (str):
+                The file path of the rules file.
+            ifc_file (str):
+                The file path of the ifc file.
+    """
+    _write_json_report(validated_rules, rules_file, ifc_file, sys.stdout)
+
+
+def create_validation_report_json_file(validated_rules: Iterable[Rule],
+                                       rules_file: str, ifc_file: str,
+                                       report_directory: str = None):
+    """Creates a JSON lines validation report file.
+
+        Each line is a JSON record of a rule, an instance or a constraint,
+        written as soon as the rule is validated.
+        If the validation report file already exists, then it will be overridden.
+
+        Args:
+            validated_rules (Iterable[Rule]):
+                The validated rules from the validations
+            rules_file (str):
+                The file path of the rules file.
+            ifc_file (str):
+                The file path of the ifc file.
+            report_directory (str):
+                The directory of the validation report file. If None, the working directory.
+    """
+    rules_file_name = path.basename(rules_file)
+    ifc_file_name = path.basename(ifc_file)
+    validation_report_file_name = path.join(
+        report_directory or "", f"validation report {rules_file_name} {ifc_file_name}.ndjson")
+    with open(validation_report_file_name, 'w+', encoding='utf-8') as validation_report_file:
+        _write_json_report(validated_rules, rules_file, ifc_file, validation_report_file)
+
+
+def create_validation_report_columnar_file(validated_rules: Iterable[Rule],
+                                           rules_file: str, ifc_file: str,
+                                           report_directory: str = None):
+    """Creates a columnar validation report file.
+
+        The records of the rules, instances and constraints are stored in the columnar
+        file format of :mod:`ifc_data_checker.report_columns`, with dictionary-encoded
+        texts, to be read with :func:`ifc_data_checker.report_columns.read_columnar_report`.
+        If the validation report file already exists, then it will be overridden.
+
+        Args:
+            validated_rules (Iterable[Rule]):
+                The validated rules from the validations
+            rules_file (str):
+                The file path of the rules file.
+            ifc_file (str):
+                The file path of the ifc file.
+            report_directory (str):
+                The directory of the validation report file. If None, the working directory.
+    """
+    rules_file_name = path.basename(rules_file)
+    ifc_file_name = path.basename(ifc_file)
+    validation_report_file_name = path.join(
+        report_directory or "", f"validation report {rules_file_name} {ifc_file_name}.idcr")
+    with open(validation_report_file_name, 'wb') as validation_report_file:
+        writer = ColumnarReportWriter(validation_report_file, rules_file_name, ifc_file_name)
+        for record in _create_records(validated_rules):
+            writer.write(record)
+        writer.flush()
+
+
+_junit_result_tags = {
+    ValidationResult.FAILED: "failure",
+    ValidationResult.ERROR: "error",
+    ValidationResult.NOT_EVALUATED: "skipped"
+}
+
+
+def _create_junit_testcase(name: str, classname: str,
+                           validation_information: ValidationInformation,
+                           details: List[str]) -> str:
+    """Creates a JUnit testcase element, with a failure, error or skipped element if not valid"""
+    testcase = (f"    <testcase name=\"{html.escape(name)}\" "
+                f"classname=\"{html.escape(classname)}\"")
+    result_tag = _junit_result_tags.get(validation_information.validation_result)
+    if result_tag is None:
+        return f"{testcase}/>\n"
+    message = html.escape(validation_information.message or "")
+    text = html.escape("\n".join(details))
+    return (f"{testcase}>\n"
+            f"      <{result_tag} message=\"{message}\">{text}</{result_tag}>\n"
+            f"    </testcase>\n")
+
+
+def _create_junit_testsuite(rule_position: int, validated_rule: Rule,
+                            failing_instances: bool) -> str:
+    """Creates the JUnit testsuite of a validated rule.
+
+        The testsuite has one testcase for the rule and,
+        if `failing_instances` is True, one testcase per failing ifc instance.
+    """
+    classname = f"rules[{rule_position}].rule"
+    failed_instance_validations = [
+        instance_validation for instance_validation in validated_rule.validation
+        if instance_validation['validation_information'].validation_result
+        != ValidationResult.VALID]
+    testcases = [(", ".join(validated_rule.get_classes()), validated_rule.validation_information,
+                  [str(instance_validation['validation_information'])
+                   for instance_validation in failed_instance_validations])]
+    if failing_instances:
+        backend = backends.get_active_backend()
+        for instance_validation in failed_instance_validations:
+            ifc_instance = instance_validation['ifc_instance']
+            details = []
+            for validated_constraint in instance_validation['validated_constraints']:
+                details += validated_constraint.report()
+            testcases.append((f"{backend.is_a(ifc_instance)} "
+                              f"{backend.get_attribute(ifc_instance, 'Name')} "
+                              f"{backend.get_attribute(ifc_instance, 'GlobalId')}",
+                              instance_validation['validation_information'], details))
+    results = [validation_information.validation_result
+               for _, validation_information, _ in testcases]
+    return (f"  <testsuite name=\"{html.escape(classname)}\" tests=\"{len(testcases)}\" "
+            f"failures=\"{results.count(ValidationResult.FAILED)}\" "
+            f"errors=\"{results.count(ValidationResult.ERROR)}\" "
+            f"skipped=\"{results.count(ValidationResult.NOT_EVALUATED)}\">\n"
+            + "".join(_create_junit_testcase(name, classname, validation_information, details)
+                      for name, validation_information, details in testcases)
+            + "  </testsuite>\n")
+
+
+def _write_junit_report(validated_rules: Iterable[Rule], rules_file: str, ifc_file: str,
+                        junit_report: TextIO, failing_instances: bool):
+    """Writes the validated rules as JUnit XML to `junit_report`, one testsuite per rule"""
+    report_name = f"validation report {path.basename(rules_file)} {path.basename(ifc_file)}"
+    junit_report.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    junit_report.write(f"<testsuites name=\"{html.escape(report_name)}\">\n")
+    for rule_position, validated_rule in enumerate(validated_rules):
+        junit_report.write(
+            _create_junit_testsuite(rule_position, validated_rule, failing_instances))
+    junit_report.write("</testsuites>\n")
+
+
+def create_validation_report_junit_console(validated_rules: Iterable[Rule],
+                                           rules_file: str, ifc_file: str,
+                                           failing_instances: bool = False):
+    """Create a JUnit XML validation report on the console.
+
+        Each rule is a testsuite with a testcase for the rule,
+        written as soon as the rule is validated.
+
+        Args:
+            validated_rules (Iterable[Rule]):
+                The validated rules from the validations
+            rules_file (str):
+                The file path of the rules file.
+            ifc_file (str):
+                The file path of the ifc file.
+            failing_instances (bool):
+                If True, each failing ifc instance is an additional testcase.
+    """
+    _write_junit_report(validated_rules, rules_file, ifc_file, sys.stdout, failing_instances)
+
+
+def create_validation_report_junit_file(validated_rules: Iterable[Rule],
+                                        rules_file: str, ifc_file: str,
+                                        failing_instances: bool = False,
+                                        report_directory: str = None):
+    """Creates a JUnit XML validation report file.
+
+        Each rule is a testsuite with a testcase for the rule,
+        written as soon as the rule is validated.
+        If the validation report file already exists, then it will be overridden.
+
+        Args:
+            validated_rules (Iterable[Rule]):
+                The validated rules from the validations
+            rules_file (str):
+                The file path of the rules file.
+            ifc_file (str):
+                The file path of the ifc file.
+            failing_instances (bool):
+                If True, each failing ifc instance is an additional testcase.
+            report_directory (str):
+                The directory of the validation report file. If None, the working directory.
+    """
+    rules_file_name = path.basename(rules_file)
+    ifc_file_name = path.basename(ifc_file)
+    validation_report_file_name = path.join(
+        report_directory or "", f"validation report {rules_file_name} {ifc_file_name}.xml")
+    with open(validation_report_file_name, 'w+', encoding='utf-8') as validation_report_file:
+        _write_junit_report(validated_rules, rules_file, ifc_file, validation_report_file,
+                            failing_instances)
@@ -0,0 +1,281 @@
+"""Columnar file format of the validation report
+
+    The validation report records are stored column by column in row groups.
+    Text columns are dictionary-encoded per row group, so repeated values like
+    messages, constraint paths or entity types are stored once per row group.
+    Each column is compressed with zlib.
+
+    File layout, all integers little-endian::
+
+        magic b"IDCR", version (uint8)
+        rules file, ifc file (each: uint32 length, utf-8)
+        row groups until the end of the file:
+            row count (uint32)
+            per column of `COLUMNS`: compressed length (uint32), zlib compressed data
+
+    The data of a dictionary-encoded column is the dictionary
+    (uint32 count, then per value: uint32 length, utf-8) followed by the codes (uint32).
+    The data of an integer column are the values (int32).
+"""
+import struct
+import sys
+import zlib
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+MAGIC = b"IDCR"
+VERSION = 1
+ROW_GROUP_SIZE = 65536
+
+DICTIONARY = "dictionary"
+INTEGER = "integer"
+
+COLUMNS = (
+    ("record", DICTIONARY),
+    ("rule", INTEGER),
+    ("path", DICTIONARY),
+    ("global_id", DICTIONARY),
+    ("type", DICTIONARY),
+    ("result", DICTIONARY),
+    ("message", DICTIONARY),
+)
+"""The columns of the columnar report with their encoding"""
+
+_NONE_CODE = 0xFFFFFFFF
+
+
+def _pack_text(text: str) -> bytes:
+    """Packs a text with its length"""
+    data = text.encode("utf-8")
+    return struct.pack("<I", len(data)) + data
+
+
+def _unpack_text(data: bytes, offset: int) -> Tuple[str, int]:
+    """Unpacks a text with its length, returns the text and the next offset"""
+    (length,) = struct.unpack_from("<I", data, offset)
+    offset += 4
+    return data[offset:offset + length].decode("utf-8"), offset + length
+
+
+class _DictionaryColumn:
+    """A dictionary-encoded text column of a row group"""
+
+    def __init__(self):
+        """Constructor"""
+        self.dictionary = {}
+        self.codes = array("I")
+
+    def append(self, value: Optional[str]):
+        """Appends a value, ``None`` is stored as missing value"""
+        if value is None:
+            self.codes.append(_NONE_CODE)
+            return
+        value = str(value)
+        code = self.dictionary.get(value)
+        if code is None:
+            code = len(self.dictionary)
+            self.dictionary[value] = code
+        self.codes.append(code)
+
+    def to_bytes(self) -> bytes:
+        """Gets the data of the column"""
+        codes = self.codes
+        if sys.byteorder == "big":
+            codes = array("I", codes)
+            codes.byteswap()
+        data = [struct.pack("<I", len(self.dictionary))]
+        data += [_pack_text(value) for value in self.dictionary]
+        data.append(codes.tobytes())
+        return b"".join(data)
+
+    @staticmethod
+    def from_bytes(data: bytes, row_count: int) -> List[Optional[str]]:
+        """Decodes the values of the column"""
+        (count,) = struct.unpack_from("<I", data, 0)
+        offset = 4
+        dictionary = []
+        for _ in range(count):
+            value, offset = _unpack_text(data, offset)
+            dictionary.append(value)
+        codes = struct.unpack_from(f"<{row_count}I", data, offset)
+        return [None if code == _NONE_CODE else dictionary[code] for code in codes]
+
+
+class _IntegerColumn:
+    """An integer column of a row group"""
+
+    def __init__(self):
+        """Constructor"""
+        self.values = []
+
+    def append(self, value: Optional[int]):
+        """Appends a value, ``None`` is stored as -1"""
+        self.values.append(-1 if value is None else value)
+
+    def to_bytes(self) -> bytes:
+        """Gets the data of the column"""
+        return struct.pack(f"<{len(self.values)}i", *self.values)
+
+    @staticmethod
+    def from_bytes(data: bytes, row_count: int) -> List[int]:
+        """Decodes the values of the column"""
+        return list(struct.unpack_from(f"<{row_count}i", data, 0))
+
+
+class ColumnarReportWriter:
+    """Writes the records of a validation report into a columnar report file.
+
+        The records are buffered up to `row_group_size` rows
+        and then written as one row group.
+    """
+
+    def __init__(self, report_file, rules_file: str, ifc_file: str,
+                 row_group_size: int = ROW_GROUP_SIZE):
+        """Constructor
+
+            Args:
+                report_file:
+                    The binary file object to write the columnar report to.
+                rules_file (str):
+                    The name of the rules file of the validation report.
+                ifc_file (str):
+                    The name of the ifc file of the validation report.
+                row_group_size (int):
+                    The maximum count of rows per row group.
+        """
+        self.report_file = report_file
+        self.row_group_size = row_group_size
+        self.report_file.write(MAGIC + struct.pack("<B", VERSION))
+        self.report_file.write(_pack_text(rules_file) + _pack_text(ifc_file))
+        self._columns = None
+        self._row_count = 0
+        self._start_row_group()
+
+    def _start_row_group(self):
+        """Starts a new row group"""
+        self._columns = [_DictionaryColumn() if encoding == DICTIONARY else _IntegerColumn()
+                         for _, encoding in COLUMNS]
+        self._row_count = 0
+
+    def write(self, record: dict):
+        """Writes a record, missing columns of the record are stored as missing values"""
+        for column, (name, _) in zip(self._columns, COLUMNS):
+            column.append(record.get(name))
+        self._row_count += 1
+        if self._row_count >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered rows as row group"""
+        if not self._row_count:
+            return
+        self.report_file.write(struct.pack("<I", self._row_count))
+        for column in self._columns:
+            data = zlib.compress(column.to_bytes())
+            self.report_file.write(struct.pack("<I", len(data)) + data)
+        self._start_row_group()
+
+
+def _read(report_file, length: int) -> bytes:
+    """Reads `length` bytes of the columnar report file
+
+        Raises:
+            ValueError:
+                Raised if the file ends before.
+    """
+    data = report_file.read(length)
+    if len(data) != length:
+        raise ValueError(f"{report_file.name} is a truncated columnar validation report")
+    return data
+
+
+def _read_text(report_file) -> str:
+    """Reads a text with its length from the columnar report file"""
+    (length,) = struct.unpack("<I", _read(report_file, 4))
+    return _read(report_file, length).decode("utf-8")
+
+
+def _read_header(report_file) -> Tuple[str, str]:
+    """Reads the header of an open columnar report file.
+
+        Returns:
+            Tuple[str, str]:
+                The rules file and the ifc file of the report.
+
+        Raises:
+            ValueError:
+                Raised if the file is not a columnar report.
+    """
+    if report_file.read(5) != MAGIC + struct.pack("<B", VERSION):
+        raise ValueError(f"{report_file.name} is not a columnar validation report")
+    rules_file = _read_text(report_file)
+    return rules_file, _read_text(report_file)
+
+
+def _iter_row_groups(report_file) -> Iterator[Dict[str, list]]:
+    """Reads and decodes the row groups of an open columnar report file one by one,
+        after its header"""
+    while True:
+        row_count_data = report_file.read(4)
+        if not row_count_data:
+            return
+        if len(row_count_data) != 4:
+            raise ValueError(f"{report_file.name} is a truncated columnar validation report")
+        (row_count,) = struct.unpack("<I", row_count_data)
+        row_group = {}
+        for name, encoding in COLUMNS:
+            (length,) = struct.unpack("<I", _read(report_file, 4))
+            column_data = zlib.decompress(_read(report_file, length))
+            column_class = _DictionaryColumn if encoding == DICTIONARY else _IntegerColumn
+            row_group[name] = column_class.from_bytes(column_data, row_count)
+        yield row_group
+
+
+def iter_row_groups(report_file_name: str) -> Iterator[Dict[str, list]]:
+    """Reads the row groups of a columnar report file.
+
+        The row groups are read from the file one by one,
+        so only one row group of a large report is in memory at a time.
+
+        Args:
+            report_file_name (str):
+                The file path of the columnar report.
+
+        Yields:
+            Dict[str, list]:
+                The values of each column by the column name, per row group.
+
+        Raises:
+            ValueError:
+                Raised if the file is not a columnar report.
+    """
+    with open(report_file_name, "rb") as report_file:
+        _read_header(report_file)
+        yield from _iter_row_groups(report_file)
+
+
+def read_columnar_report(report_file_name: str) -> Dict[str, list]:
+    """Reads a columnar report file.
+
+        Args:
+            report_file_name (str):
+                The file path of the columnar report.
+
+        Returns:
+            Dict[str, list]:
+                The values of each column by the column name,
+                plus the `rules_file` and `ifc_file` of the report.
+
+        Raises:
+            ValueError:
+                Raised if the file is not a columnar report.
+    """
+    columns = {name: [] for name, _ in COLUMNS}
+    with open(report_file_name, "rb") as report_file:
+        rules_file, ifc_file = _read_header(report_file)
+        for row_group in _iter_row_groups(report_file):
+            for name, values in row_group.items():
+                columns[name] += values
+    columns["rules_file"] = rules_file
+    columns["ifc_file"] = ifc_file
+    return columns
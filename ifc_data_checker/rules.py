@@ -1,74 +1,240 @@
 """Read the rules file and the get the instances from the ifc file"""
-from typing import List
-
-import ifcopenshell
+import itertools
+import time
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
 
+from ifc_data_checker import backends
 from ifc_data_checker import config
+from ifc_data_checker import indexes
+from ifc_data_checker import scheduling
+from ifc_data_checker import shared_model
+from ifc_data_checker.bitmaps import ResultBitmap
+from ifc_data_checker.columns import create_column
+from ifc_data_checker.columns import is_columnar
+from ifc_data_checker.definitions import intern_definition
+from ifc_data_checker.indexes import ModelIndex
+from ifc_data_checker.planner import ValidationPlan
+from ifc_data_checker.sampling import wilson_interval
+from ifc_data_checker.scheduling import ValidationProfile
+from ifc_data_checker.shared_model import SharedTables
+from ifc_data_checker.shared_model import inverse_attribute_names
+from ifc_data_checker.validation import ReportLevel
 from ifc_data_checker.validation import ValidationInformation
+from ifc_data_checker.validation import ValidationOptions
 from ifc_data_checker.validation import ValidationResult
 
 
 class Rule:
     """Rule"""
 
-    def __init__(self, rule_definition: dict, ifc_instances: tuple):
-        """Constructor"""
+    def __init__(self, rule_definition: dict, ifc_instances: tuple,
+                 validation_options: ValidationOptions = None, population_count: int = None):
+        """Constructor
+
+            The `population_count` is the count of all the ifc instances of the rule,
+            if the `ifc_instances` are a sample of them.
+        """
         self.rule_definition = rule_definition
         self.ifc_instances = ifc_instances
+        self.validation_options = validation_options or ValidationOptions()
+        self.population_count = population_count
         self.validation = []
         self.validation_information = ValidationInformation()
+        self.constraint_results = []
+        self.results = ResultBitmap()
+        self.truncated = False
+
+    def validate(self, executor: Executor = None, profile: ValidationProfile = None):
+        """Validates a rule on the ifc instances
+
+            The columnar constraints are evaluated on all the ifc instances at once
+            before the other constraints are validated instance by instance.
+            The validation results of each constraint are kept as :class:`ResultBitmap`
+            in `constraint_results`, combined into the validation results
+            of the ifc instances in `results`.
+            Depending on the report level of the validation options, the passing
+            ifc instances and constraints are dropped as soon as they are validated.
+            The positions of the kept constraints in the rule definition
+            are kept in `constraint_positions` of each ifc instance.
+            With a maximum count of failures per rule, the validation stops
+            after this count of failed ifc instances and the rule is `truncated`.
 
-    def validate(self):
-        """Validates a rule on the ifc instances"""
-        for ifc_instance in self.ifc_instances:
+            Args:
+                executor (Executor):
+                    If not None, the ifc instances are validated in shards
+                    on the threads or processes of the `executor`. The results are collected
+                    in the order of the ifc instances, like without an executor.
+                profile (ValidationProfile):
+                    If not None, the ifc instances are scheduled on the `executor`
+                    by their validation times in the profile, the most expensive first,
+                    and the validation times of the ifc instances are recorded.
+        """
+        report_level = self.validation_options.report_level
+        max_failures = self.validation_options.max_failures_per_rule
+        failures_count = 0
+        validated_count = len(self.ifc_instances)
+        constraint_definitions = self.get_constraints()
+        columns = {}
+        for position, constraint_component_definition in enumerate(constraint_definitions):
+            if is_columnar(constraint_component_definition):
+                column = create_column(constraint_component_definition, self.ifc_instances)
+                column.evaluate()
+                columns[position] = column
+        self.constraint_results = [columns[position].results if position in columns
+                                   else ResultBitmap()
+                                   for position in range(len(constraint_definitions))]
+        instance_indexes = []
+        keep_valid = report_level == ReportLevel.FULL
+        validated_positions = [position for position in range(len(constraint_definitions))
+                               if position not in columns or report_level != ReportLevel.SUMMARY]
+        instance_definitions = [constraint_definitions[position]
+                                for position in validated_positions if position not in columns]
+        validated_instances = self._iter_validate_instances(instance_definitions, executor,
+                                                            profile)
+        for index, (ifc_instance, instance_components) in enumerate(
+                zip(self.ifc_instances, validated_instances)):
+            instance_components = iter(instance_components)
             validated_constraints = []
-            valid_constraint_components_count = 0
-            for constraint_component_definition in self.get_constraints():
-                constraint_component = config.get_constraint(
-                    constraint_component_definition, ifc_instance)
-                constraint_component.validate()
-                if constraint_component.is_valid():
-                    valid_constraint_components_count += 1
-                validated_constraints.append(constraint_component)
-            instance_validation_result = ValidationInformation()
-            if valid_constraint_components_count == len(validated_constraints):
-                instance_validation_result.set_valid((
-                    f"{ifc_instance.is_a()} "
-                    f"{ifc_instance.Name} "
-                    f"Global Id: {ifc_instance.GlobalId}: "
-                    f"{len(validated_constraints)} of "
-                    f"{len(validated_constraints)} constraints "
-                    f"are valid."
-                ))
-            else:
-                instance_validation_result.set_failed((
-                    f"{ifc_instance.is_a()} "
-                    f"{ifc_instance.Name} "
-                    f"Global Id: {ifc_instance.GlobalId}: "
-                    f"{valid_constraint_components_count} of "
-                    f"{len(validated_constraints)} constraints "
-                    f"are valid."
-                ))
-            self.validation.append(
-                {
-                    'ifc_instance': ifc_instance,
-                    'validated_constraints': validated_constraints,
-                    'validation_information': instance_validation_result
-                })
-        valid_instances = [
-            v for v in self.validation
-            if v['validation_information'].validation_result == ValidationResult.VALID
-        ]
-        if len(valid_instances) == len(self.validation):
+            constraint_positions = []
+            for position in validated_positions:
+                if position in columns:
+                    constraint_component = columns[position].constraint(index)
+                else:
+                    constraint_component = next(instance_components)
+                    self.constraint_results[position].append(
+                        constraint_component.validation_information.validation_result)
+                if keep_valid or not constraint_component.is_valid():
+                    validated_constraints.append(constraint_component)
+                    constraint_positions.append(position)
+            if keep_valid or (report_level != ReportLevel.SUMMARY and validated_constraints):
+                instance_indexes.append(index)
+                self.validation.append(
+                    {
+                        'ifc_instance': ifc_instance,
+                        'validated_constraints': validated_constraints,
+                        'constraint_positions': constraint_positions,
+                        'validation_information': None
+                    })
+            if max_failures is not None and not all(
+                    constraint_results.is_valid(index)
+                    for constraint_results in self.constraint_results):
+                failures_count += 1
+                if failures_count >= max_failures and index + 1 < len(self.ifc_instances):
+                    validated_count = index + 1
+                    self.truncated = True
+                    break
+        validated_instances.close()
+        if self.truncated:
+            self.constraint_results = [constraint_results.head(validated_count)
+                                       for constraint_results in self.constraint_results]
+        self.results = ResultBitmap.all_valid(self.constraint_results, validated_count)
+        for index, instance_validation in zip(instance_indexes, self.validation):
+            instance_validation['validation_information'] = self._create_instance_information(
+                index, instance_validation['ifc_instance'])
+        valid_instances_count = self.results.valid_count()
+        if valid_instances_count == len(self.results):
             self.validation_information.set_valid((
-                f"Rule: {len(self.validation)} of {len(self.validation)} "
+                f"Rule: {len(self.results)} of {len(self.results)} "
                 f"instances of types {self.get_classes()} successfully validated."
             ))
         else:
             self.validation_information.set_failed((
-                f"Rule: {len(valid_instances)} of {len(self.validation)} "
+                f"Rule: {valid_instances_count} of {len(self.results)} "
                 f"instances of types {self.get_classes()} successfully validated."
             ))
+        if self.truncated:
+            self.validation_information.message += (
+                f" Validation stopped after {max_failures} failed instances, "
+                f"{len(self.ifc_instances) - validated_count} instances not validated.")
+        if self.population_count is not None:
+            lower_bound, upper_bound = wilson_interval(valid_instances_count, len(self.results))
+            pass_rate = valid_instances_count / len(self.results) if len(self.results) else 0.0
+            self.validation_information.message += (
+                f" Sample of {len(self.ifc_instances)} of {self.population_count} instances: "
+                f"pass rate {pass_rate:.1%}, "
+                f"95% confidence interval {lower_bound:.1%} to {upper_bound:.1%}.")
+
+    def _iter_validate_instances(self, constraint_definitions: List[dict],
+                                 executor: Optional[Executor],
+                                 profile: Optional[ValidationProfile]) -> Iterator[list]:
+        """Validates the constraints of the `constraint_definitions` instance by instance.
+
+            With an `executor`, the chunks of the ifc instances are validated concurrently,
+            see :func:`ifc_data_checker.scheduling.schedule`,
+            the chunks not started are cancelled on closing.
+
+            Yields:
+                list:
+                    The validated constraint components of each ifc instance,
+                    in the order of the ifc instances.
+        """
+        costs = [None] * len(self.ifc_instances)
+        if profile is not None:
+            profile_key = scheduling.rule_key(self.rule_definition)
+            instance_keys = [scheduling.instance_key(ifc_instance)
+                             for ifc_instance in self.ifc_instances]
+            known_costs = profile.costs(profile_key)
+            costs = [known_costs.get(key) for key in instance_keys]
+        if executor is None or len(self.ifc_instances) < 2:
+            validated_instances = (validate_instances(constraint_definitions, (ifc_instance,))[0]
+                                   for ifc_instance in self.ifc_instances)
+        else:
+            validated_instances = self._iter_validate_chunks(
+                constraint_definitions, executor,
+                scheduling.schedule(costs, self.validation_options.workers))
+        try:
+            for index, (constraint_components, seconds) in enumerate(validated_instances):
+                if profile is not None:
+                    profile.record(profile_key, instance_keys[index], seconds)
+                yield constraint_components
+        finally:
+            validated_instances.close()
+
+    def _iter_validate_chunks(self, constraint_definitions: List[dict], executor: Executor,
+                              chunks: List[List[int]]) -> Iterator[tuple]:
+        """Validates the chunks of the ifc instances on the `executor` in the order
+            of the `chunks`, yields the results in the order of the ifc instances"""
+        futures = [executor.submit(validate_instances, constraint_definitions,
+                                   tuple(self.ifc_instances[index] for index in chunk))
+                   for chunk in chunks]
+        positions = [None] * len(self.ifc_instances)
+        for future, chunk in zip(futures, chunks):
+            for position, index in enumerate(chunk):
+                positions[index] = (future, position)
+        try:
+            for future, position in positions:
+                yield future.result()[position]
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _create_instance_information(self, index: int, ifc_instance) -> ValidationInformation:
+        """Creates the validation information of the ifc instance at `index`"""
+        valid_constraint_components_count = sum(
+            constraint_results.is_valid(index) for constraint_results in self.constraint_results)
+        instance_validation_result = ValidationInformation()
+        backend = backends.get_active_backend()
+        ifc_class = backend.is_a(ifc_instance)
+        name = backend.get_attribute(ifc_instance, "Name")
+        global_id = backend.get_attribute(ifc_instance, "GlobalId")
+        if self.results.is_valid(index):
+            instance_validation_result.set_valid((
+                f"{ifc_class} {name} Global Id: {global_id}: "
+                f"{len(self.constraint_results)} of "
+                f"{len(self.constraint_results)} constraints "
+                f"are valid."
+            ))
+        else:
+            instance_validation_result.set_failed((
+                f"{ifc_class} {name} Global Id: {global_id}: "
+                f"{valid_constraint_components_count} of "
+                f"{len(self.constraint_results)} constraints "
+                f"are valid."
+            ))
+        return instance_validation_result
 
     def report(self) -> List[str]:
         """Reports the rule"""
@@ -90,6 +256,40 @@ class Rule:
         return self.rule_definition["constraints"]
 
 
+def validate_instance(constraint_definitions: List[dict], ifc_instance) -> list:
+    """Validates the constraints of the `constraint_definitions` on the ifc instance
+
+        Returns:
+            list:
+                The validated constraint components.
+    """
+    constraint_components = []
+    for constraint_definition in constraint_definitions:
+        constraint_component = config.get_constraint(constraint_definition, ifc_instance)
+        constraint_component.validate()
+        constraint_components.append(constraint_component)
+    return constraint_components
+
+
+def validate_instances(constraint_definitions: List[dict],
+                       ifc_instances: tuple) -> List[Tuple[list, float]]:
+    """Validates the constraints of the `constraint_definitions` on a chunk of ifc instances.
+
+        A module level function, so the chunks can be validated in worker processes.
+
+        Returns:
+            List[Tuple[list, float]]:
+                The validated constraint components of each ifc instance
+                and its validation time in seconds.
+    """
+    validated_instances = []
+    for ifc_instance in ifc_instances:
+        start = time.perf_counter()
+        constraint_components = validate_instance(constraint_definitions, ifc_instance)
+        validated_instances.append((constraint_components, time.perf_counter() - start))
+    return validated_instances
+
+
 def get_instances(ifc_classes: List[str], ifc_model) -> tuple:
     """Gets the instances by their `ifc_classes` of the given `ifc_model`
 
@@ -103,13 +303,49 @@ def get_instances(ifc_classes: List[str], ifc_model) -> tuple:
             tuple:
                 The ifc instances with appropriate ifc classes in the ifc model.
     """
+    backend = backends.get_active_backend()
     ifc_instances = []
     for ifc_class in ifc_classes:
-        ifc_instances += ifc_model.by_type(ifc_class)
+        ifc_instances += backend.by_type(ifc_model, ifc_class)
     return tuple(ifc_instances)
 
 
-def get_rule(rule_definition: dict, ifc_model) -> Rule:
+def select_instances(ifc_instances: tuple, ifc_classes: List[str],
+                     where_definition: List[dict], model_index: ModelIndex) -> tuple:
+    """Selects the instances matching each instance filter of the `where_definition`
+
+        The instance filters are evaluated on the indexes of the `model_index`,
+        so the instances not matching are never validated.
+
+        Args:
+            ifc_instances (tuple):
+                The ifc instances selected by the ifc classes of the rule definition.
+            ifc_classes (List[str]):
+                The defined ifc classes of the rule definition.
+            where_definition (List[dict]):
+                The instance filters of the where clause of the rule definition.
+            model_index (ModelIndex):
+                The indexes of the ifc model.
+
+        Returns:
+            tuple:
+                The ifc instances matching every instance filter.
+    """
+    if not where_definition:
+        return ifc_instances
+    matching_ids = None
+    for instance_filter_definition in where_definition:
+        instance_filter = config.get_instance_filter(
+            instance_filter_definition, model_index)
+        filter_ids = instance_filter.matching_ids(ifc_classes)
+        matching_ids = filter_ids if matching_ids is None else matching_ids & filter_ids
+    backend = backends.get_active_backend()
+    return tuple(i for i in ifc_instances if backend.id(i) in matching_ids)
+
+
+def get_rule(rule_definition: dict, ifc_model, model_index: ModelIndex = None,
+             validation_options: ValidationOptions = None,
+             ifc_instances: tuple = None) -> Rule:
     """Gets the rule object by their rule definition.
 
         Args:
@@ -117,17 +353,135 @@ def get_rule(rule_definition: dict, ifc_model) -> Rule:
                 The rule defintion from the rules file.
             ifc_model:
                 The ifc model to validate the rule.
+            model_index (ModelIndex):
+                The indexes of the ifc model to evaluate the where clause.
+                If None, new indexes are built on the `ifc_model`.
+            validation_options (ValidationOptions):
+                The options of the validation. If None, the default options are used.
+            ifc_instances (tuple):
+                The ifc instances selected by the ifc classes and the where clause
+                of the rule definition, shared by the rules on the same ifc instances.
+                If None, the ifc instances are selected from the `ifc_model`.
 
         Returns:
             Rule:
                 The Rule object ready to validate.
     """
-    ifc_instances = get_instances(
-        rule_definition["rule"]["classes"], ifc_model)
-    return Rule(rule_definition["rule"], ifc_instances)
+    ifc_classes = rule_definition["rule"]["classes"]
+    if ifc_instances is None:
+        ifc_instances = get_instances(ifc_classes, ifc_model)
+        where_definition = rule_definition["rule"].get("where")
+        if where_definition:
+            if model_index is None:
+                model_index = ModelIndex(ifc_model)
+            ifc_instances = select_instances(
+                ifc_instances, ifc_classes, where_definition, model_index)
+    if validation_options is None or validation_options.sampling is None:
+        return Rule(rule_definition["rule"], ifc_instances, validation_options)
+    sampling = validation_options.sampling
+    if sampling.cover_type_objects and model_index is None:
+        model_index = ModelIndex(ifc_model)
+    return Rule(rule_definition["rule"],
+                sampling.sample(ifc_instances, ifc_classes, model_index),
+                validation_options, population_count=len(ifc_instances))
+
+
+def iter_validate(rules_definition: List[dict], ifc_file: str,
+                  validation_options: ValidationOptions = None) -> Iterator[Rule]:
+    """Valdiates the rules definied in the rules file on the given ifc file one by one.
+
+    Each rule is yielded as soon as it is validated, so the validation report
+    can be written while the following rules are validated.
+    The rules definition is interned first, so equal constraint definitions
+    of all the rules share one node in the caches of the model index.
+    The rules on the same ifc classes and where clause are planned as one group,
+    see :class:`ifc_data_checker.planner.ValidationPlan`: the ifc instances of a group
+    are selected once and the path prefixes shared by its rules are applied once
+    per ifc instance, until the last rule of the group is validated.
+    With more than one thread in the validation options, the ifc instances of each rule
+    are validated in shards on a thread pool, see :meth:`Rule.validate`.
+    With more than one process, the shards are validated on a process pool,
+    whose worker processes share the tables of the lazy model backend,
+    see :mod:`ifc_data_checker.shared_model`.
+    With a profile file in the validation options, the ifc instances are scheduled
+    on the threads or processes by their validation times of the former runs
+    and the validation times of this run are written to the profile file,
+    see :mod:`ifc_data_checker.scheduling`.
+    With the fail fast validation option, no more rules are validated
+    after the first not valid rule.
+    After the validation, the model backend closes the ifc model,
+    see :meth:`ifc_data_checker.backends.ModelBackend.close`.
+
+    Args:
+        rules_definition (list):
+            The definition of all rules from the rules file.
+        ifc_file (str):
+            The ifc file path.
+        validation_options (ValidationOptions):
+            The options of the validation. If None, the default options are used.
+
+    Yields:
+        Rule:
+            The validated rules in the order of the rules file.
+    """
+    if validation_options is None:
+        validation_options = ValidationOptions()
+    rules_definition = intern_definition(rules_definition)
+    if validation_options.snapshot_directory is not None:
+        backend = backends.SnapshotBackend(validation_options.snapshot_directory)
+    else:
+        backend = backends.get_backend(validation_options.model_backend)
+    ifc_model = backend.open(ifc_file)
+    backends.activate(backend)
+    model_index = ModelIndex(ifc_model)
+    indexes.activate(model_index)
+    plan = ValidationPlan(rules_definition)
+    profile = None
+    if validation_options.profile_file is not None:
+        profile = ValidationProfile.load(validation_options.profile_file)
+    shared_tables = None
+    executor = None
+    if validation_options.processes > 1:
+        shared_tables = SharedTables(ifc_model, inverse_attribute_names(rules_definition))
+        executor = ProcessPoolExecutor(max_workers=validation_options.processes,
+                                       initializer=shared_model.attach,
+                                       initargs=(shared_tables.descriptor,))
+    elif validation_options.threads > 1:
+        executor = ThreadPoolExecutor(max_workers=validation_options.threads)
+    try:
+        for position, rule_definition in enumerate(rules_definition):
+            group = plan.group(position)
+            if group.ifc_instances is None:
+                group.ifc_instances = select_instances(
+                    get_instances(group.ifc_classes, ifc_model), group.ifc_classes,
+                    group.where_definition, model_index)
+                group.prefix_results = {}
+            model_index.share_path_prefixes(group.shared_prefixes, group.prefix_results)
+            rule = get_rule(rule_definition, ifc_model, model_index, validation_options,
+                            group.ifc_instances)
+            rule.validate(executor, profile)
+            model_index.share_path_prefixes({}, None)
+            if plan.is_last(position):
+                group.ifc_instances = group.prefix_results = None
+            yield rule
+            if (validation_options.fail_fast and
+                    rule.validation_information.validation_result != ValidationResult.VALID):
+                break
+        backend.finish(ifc_model)
+        if profile is not None:
+            profile.save(validation_options.profile_file)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if shared_tables is not None:
+            shared_tables.close()
+        indexes.activate(None)
+        backends.activate(None)
+        backend.close(ifc_model)
 
 
-def validate(rules_definition: List[dict], ifc_file: str) -> List[Rule]:
+def validate(rules_definition: List[dict], ifc_file: str,
+             validation_options: ValidationOptions = None) -> List[Rule]:
     """Valdiates the rules definied in the rules file on the given ifc file.
 
     Args:
@@ -135,15 +489,63 @@ def validate(rules_definition: List[dict], ifc_file: str) -> List[Rule]:
             The definition of all rules from the rules file.
         ifc_file (str):
             The ifc file path.
+        validation_options (ValidationOptions):
+            The options of the validation. If None, the default options are used.
 
     Returns:
         List[Rule]:
             List of validated rules.
     """
-    ifc_model = ifcopenshell.open(ifc_file)
-    rules = []
-    for rule_definition in rules_definition:
-        rule = get_rule(rule_definition, ifc_model)
-        rule.validate()
-        rules.append(rule)
-    return rules
+    return list(iter_validate(rules_definition, ifc_file, validation_options))
+
+
+def iter_validate_files(rules_definitions: List[List[dict]], ifc_file: str,
+                        validation_options: ValidationOptions = None) -> Iterator[Iterator[Rule]]:
+    """Valdiates the rules of several rules files on the given ifc file in one pass.
+
+    The ifc file is opened once and the rules of all the rules files are planned
+    and validated together by :func:`iter_validate`, so they share the indexes
+    and the caches of one model index.
+    With the fail fast validation option, no more rules of any rules file are validated
+    after the first not valid rule.
+
+    Args:
+        rules_definitions (List[List[dict]]):
+            The definition of all rules per rules file.
+        ifc_file (str):
+            The ifc file path.
+        validation_options (ValidationOptions):
+            The options of the validation. If None, the default options are used.
+
+    Yields:
+        Iterator[Rule]:
+            Per rules file, the validated rules in the order of the rules file.
+            Each iterator needs to be consumed before the next one,
+            the validation is finished with the iterator of the last rules file.
+    """
+    validated_rules = iter_validate(list(itertools.chain.from_iterable(rules_definitions)),
+                                    ifc_file, validation_options)
+    for rules_definition in rules_definitions[:-1]:
+        yield itertools.islice(validated_rules, len(rules_definition))
+    if rules_definitions:
+        yield validated_rules
+
+
+def validate_files(rules_definitions: List[List[dict]], ifc_file: str,
+                   validation_options: ValidationOptions = None) -> List[List[Rule]]:
+    """Valdiates the rules of several rules files on the given ifc file in one pass.
+
+    Args:
+        rules_definitions (List[List[dict]]):
+            The definition of all rules per rules file.
+        ifc_file (str):
+            The ifc file path.
+        validation_options (ValidationOptions):
+            The options of the validation. If None, the default options are used.
+
+    Returns:
+        List[List[Rule]]:
+            The validated rules per rules file.
+    """
+    return [list(validated_rules) for validated_rules in
+            iter_validate_files(rules_definitions, ifc_file, validation_options)]
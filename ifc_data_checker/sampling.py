@@ -0,0 +1,129 @@
+"""Sampling of the ifc instances for a quick approximate validation"""
+import math
+import random
+from typing import List, Optional, Tuple
+
+from ifc_data_checker import backends
+from ifc_data_checker.indexes import ModelIndex
+
+Z_95 = 1.959963984540054
+"""The z value of the 95% confidence interval"""
+
+
+class Sampling:
+    """Draws a deterministic random sample of the ifc instances of each rule.
+
+        The sample of a rule only depends on the seed and the ifc classes of the rule,
+        so repeated validations of the same model validate the same ifc instances.
+    """
+
+    def __init__(self, sample: str, seed: int = 0, cover_type_objects: bool = False):
+        """Constructor
+
+            Args:
+                sample (str):
+                    The size of the sample, either a count of ifc instances like ``1000``
+                    or a percentage of the ifc instances like ``5%``.
+                seed (int):
+                    The seed of the random sample.
+                cover_type_objects (bool):
+                    If True, each type object of the ifc instances is covered
+                    by at least one ifc instance of the sample.
+
+            Raises:
+                ValueError:
+                    If the `sample` is neither a positive count nor a percentage
+                    greater than 0 and up to 100.
+        """
+        self.size: Optional[int] = None
+        self.percentage: Optional[float] = None
+        try:
+            if sample.endswith("%"):
+                self.percentage = float(sample[:-1])
+            else:
+                self.size = int(sample)
+        except ValueError as error:
+            raise ValueError(f"sample {sample} is neither a count nor a percentage") from error
+        if self.size is not None and self.size < 1:
+            raise ValueError(f"sample {sample} is less than 1")
+        if self.percentage is not None and not 0 < self.percentage <= 100:
+            raise ValueError(f"sample {sample} is not greater than 0% and up to 100%")
+        self.seed = seed
+        self.cover_type_objects = cover_type_objects
+
+    def sample_size(self, population_count: int) -> int:
+        """Gets the size of the sample of `population_count` ifc instances"""
+        if self.percentage is not None:
+            return min(population_count, math.ceil(population_count * self.percentage / 100))
+        return min(population_count, self.size)
+
+    def sample(self, ifc_instances: tuple, ifc_classes: List[str],
+               model_index: ModelIndex = None) -> tuple:
+        """Draws the sample of the `ifc_instances` of a rule.
+
+            Args:
+                ifc_instances (tuple):
+                    The ifc instances of the rule.
+                ifc_classes (List[str]):
+                    The defined ifc classes of the rule definition, part of the seed.
+                model_index (ModelIndex):
+                    The indexes of the ifc model to cover the type objects.
+                    Required, if the type objects are covered.
+
+            Returns:
+                tuple:
+                    The sampled ifc instances in the order of the `ifc_instances`.
+        """
+        random_generator = random.Random(  # nosec B311 - sampling, not security
+            f"{self.seed}:{','.join(ifc_classes)}")
+        sample_size = self.sample_size(len(ifc_instances))
+        indexes = set(random_generator.sample(range(len(ifc_instances)), sample_size))
+        if self.cover_type_objects and model_index is not None:
+            indexes |= self._cover_type_objects(
+                ifc_instances, indexes, model_index, random_generator)
+        return tuple(ifc_instances[index] for index in sorted(indexes))
+
+    @staticmethod
+    def _cover_type_objects(ifc_instances: tuple, indexes: set, model_index: ModelIndex,
+                            random_generator: random.Random) -> set:
+        """Gets one index of an ifc instance per type object not covered by the `indexes`"""
+        backend = backends.get_active_backend()
+        type_index = model_index.type_index()
+        indexes_by_type_object = {}
+        for index, ifc_instance in enumerate(ifc_instances):
+            type_object = type_index.get(backend.id(ifc_instance))
+            if type_object is not None:
+                indexes_by_type_object.setdefault(backend.id(type_object), []).append(index)
+        covering_indexes = set()
+        for type_object_indexes in indexes_by_type_object.values():
+            if indexes.isdisjoint(type_object_indexes):
+                covering_indexes.add(random_generator.choice(type_object_indexes))
+        return covering_indexes
+
+
+def wilson_interval(valid_count: int, sample_count: int,
+                    z_value: float = Z_95) -> Tuple[float, float]:
+    """Calculates the Wilson score interval of the pass rate of a sample.
+
+        Args:
+            valid_count (int):
+                The count of the valid ifc instances of the sample.
+            sample_count (int):
+                The count of the ifc instances of the sample.
+            z_value (float):
+                The z value of the confidence level, by default of 95%.
+
+        Returns:
+            Tuple[float, float]:
+                The lower and the upper bound of the pass rate.
+    """
+    if sample_count == 0:
+        return 0.0, 1.0
+    pass_rate = valid_count / sample_count
+    z_squared = z_value * z_value
+    denominator = 1 + z_squared / sample_count
+    center = (pass_rate + z_squared / (2 * sample_count)) / denominator
+    half_width = z_value * math.sqrt(
+        pass_rate * (1 - pass_rate) / sample_count +
+        z_squared / (4 * sample_count * sample_count)) / denominator
+    return max(0.0, center - half_width), min(1.0, center + half_width)
@@ -0,0 +1,135 @@
+"""Scheduling of the ifc instances of a rule on threads or worker processes
+
+    The ifc instances are split into chunks and each idle thread or worker process
+    takes the next chunk, so a worker validating expensive ifc instances does not
+    hold up the others. With a validation profile of a former run, the ifc instances
+    are ordered by their validation time, the most expensive first, and the chunks
+    are cut to equal validation times. The results are always collected
+    in the order of the ifc instances.
+
+    Profile file layout (JSON)::
+
+        {"version": 1, "rules": {<rule key>: {<instance key>: <seconds>, ...}, ...}}
+"""
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+from ifc_data_checker import backends
+
+PROFILE_VERSION = 1
+
+INSTANCE_SHARD_SIZE = 256
+"""The maximum count of ifc instances of a chunk"""
+
+SHARDS_PER_WORKER = 4
+"""The count of chunks of the ifc instances of a rule per thread or process,
+    to balance the workers"""
+
+
+class ValidationProfile:
+    """The validation times of the ifc instances per rule, from former runs"""
+
+    def __init__(self, timings: Dict[str, Dict[str, float]] = None):
+        """Constructor
+
+            Args:
+                timings (Dict[str, Dict[str, float]]):
+                    The validation times in seconds by the instance key, by the rule key.
+        """
+        self.timings = {} if timings is None else timings
+
+    @classmethod
+    def load(cls, profile_file_name: str) -> "ValidationProfile":
+        """Reads the profile file, an empty profile if the profile file does not exist
+
+            Raises:
+                ValueError:
+                    If the file is not a validation profile.
+        """
+        if not os.path.exists(profile_file_name):
+            return cls()
+        with open(profile_file_name, encoding="utf-8") as profile_file:
+            try:
+                profile = json.load(profile_file)
+            except ValueError as error:
+                raise ValueError(f"{profile_file_name} is not a validation profile") from error
+        if not isinstance(profile, dict) or profile.get("version") != PROFILE_VERSION or \
+                not isinstance(profile.get("rules"), dict):
+            raise ValueError(f"{profile_file_name} is not a validation profile")
+        return cls(profile["rules"])
+
+    def save(self, profile_file_name: str):
+        """Writes the profile file, to a temporary file first and then renamed"""
+        directory = os.path.dirname(profile_file_name)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_file_name = f"{profile_file_name}.{os.getpid()}.tmp"
+        with open(temporary_file_name, "w", encoding="utf-8") as profile_file:
+            json.dump({"version": PROFILE_VERSION, "rules": self.timings}, profile_file)
+        os.replace(temporary_file_name, profile_file_name)
+
+    def costs(self, rule_key: str) -> Dict[str, float]:
+        """Gets the validation times by the instance key of the rule"""
+        return self.timings.get(rule_key, {})
+
+    def record(self, rule_key: str, instance_key: str, seconds: float):
+        """Records the validation time of the ifc instance of the rule"""
+        self.timings.setdefault(rule_key, {})[instance_key] = round(seconds, 6)
+
+
+def rule_key(rule_definition: dict) -> str:
+    """Gets the key of the rule in the validation profile, the hash of the rule definition"""
+    definition = json.dumps(rule_definition, sort_keys=True, default=str)
+    return hashlib.sha256(definition.encode("utf-8")).hexdigest()[:16]
+
+
+def instance_key(ifc_instance) -> str:
+    """Gets the key of the ifc instance in the validation profile,
+        the GlobalId or else the id in the ifc model"""
+    backend = backends.get_active_backend()
+    if backend.has_attribute(ifc_instance, "GlobalId"):
+        return str(backend.get_attribute(ifc_instance, "GlobalId"))
+    return f"#{backend.id(ifc_instance)}"
+
+
+def schedule(costs: List[Optional[float]], workers: int) -> List[List[int]]:
+    """Splits the indexes of the ifc instances into the chunks for the workers.
+
+        The ifc instances are ordered by their cost, the most expensive first,
+        ifc instances of equal costs in their order. The chunks are cut to about
+        the same cost, so an expensive ifc instance is a chunk on its own.
+        Without known costs, the chunks are of the same size in the order of the ifc instances.
+
+        Args:
+            costs (List[Optional[float]]):
+                The expected validation time of each ifc instance, None if unknown.
+                An unknown cost is the mean of the known costs.
+            workers (int):
+                The count of threads or worker processes.
+
+        Returns:
+            List[List[int]]:
+                The chunks of indexes of the ifc instances, in the order to dispatch them.
+    """
+    known_costs = [cost for cost in costs if cost is not None]
+    default_cost = sum(known_costs) / len(known_costs) if known_costs else 1.0
+    costs = [default_cost if cost is None else cost for cost in costs]
+    if not any(costs):
+        costs = [1.0] * len(costs)
+    order = sorted(range(len(costs)), key=lambda index: -costs[index])
+    chunk_cost = sum(costs) / max(1, workers * SHARDS_PER_WORKER)
+    chunks = []
+    chunk = []
+    cost = 0.0
+    for index in order:
+        chunk.append(index)
+        cost += costs[index]
+        if cost >= chunk_cost or len(chunk) >= INSTANCE_SHARD_SIZE:
+            chunks.append(chunk)
+            chunk = []
+            cost = 0.0
+    if chunk:
+        chunks.append(chunk)
+    return chunks
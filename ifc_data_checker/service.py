@@ -0,0 +1,435 @@
+"""Validation service accepting ifc files over HTTP
+
+    The service validates the uploaded ifc files on the rules files it is started with
+    and streams the JSON lines validation report back, see
+    :func:`ifc_data_checker.report.create_json_report_chunks`.
+    The requests are served on one asyncio event loop: the upload of an ifc file
+    is streamed to a temporary file on disk, the validation runs on a bounded pool
+    of worker processes and the JSON lines of each rule are sent back as soon as
+    the rule is validated, while the worker process validates the following rules.
+    So many small ifc files are validated next to a few huge ones and
+    no request blocks the uploads and reports of the others.
+    The worker processes are spawned, so they do not inherit the sockets of the server.
+    If a worker process dies, the pool is replaced for the following requests.
+    If a client disconnects, its job stops after the rule being validated.
+
+    Request::
+
+        POST /validate/<rules file name>?ifc=<ifc file name> HTTP/1.1
+        Content-Length: <size of the ifc file>
+
+        <ifc file>
+
+    The ifc file name is optional and only named in the report.
+    The response is `application/x-ndjson` in chunked transfer encoding.
+    A failure of the validation after the response has started is reported
+    as a last record `{"record": "error", "message": ...}`.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs
+from urllib.parse import unquote
+from urllib.parse import urlsplit
+
+import jsonschema
+import yaml
+
+from ifc_data_checker import backends
+from ifc_data_checker import report
+from ifc_data_checker import rules
+from ifc_data_checker.validation import ValidationOptions
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+"""The count of bytes of the upload read and written at once"""
+
+_HEADER_LIMIT = 100
+"""The maximum count of header lines of a request"""
+
+_POLL_INTERVAL = 1.0
+"""The seconds to wait for a report chunk before checking that the job is still running"""
+
+
+def validate_job(rules_definition: List[dict], rules_file: str, ifc_file: str,
+                 validation_options: ValidationOptions, chunks, cancelled):
+    """Validates the rules on the ifc file and puts the report chunks into `chunks`.
+
+        The job of a worker process. After the last chunk, None is put into `chunks`.
+        No more rules are validated, once `cancelled` is set.
+
+        Args:
+            rules_definition (List[dict]):
+                The definition of all rules from the rules file.
+            rules_file (str):
+                The file path of the rules file, for the report.
+            ifc_file (str):
+                The file path of the uploaded ifc file.
+            validation_options (ValidationOptions):
+                The options of the validation.
+            chunks (queue.Queue):
+                The queue of the report chunks, shared with the service.
+            cancelled (threading.Event):
+                Set by the service, if the client disconnected.
+    """
+    try:
+        validated_rules = rules.iter_validate(rules_definition, ifc_file, validation_options)
+        for chunk in report.create_json_report_chunks(validated_rules, rules_file, ifc_file):
+            if cancelled.is_set():
+                validated_rules.close()
+                break
+            chunks.put(chunk)
+    except Exception as error:  # pylint: disable=broad-except
+        chunks.put(json.dumps({"record": "error", "message": str(error)},
+                              ensure_ascii=False) + "\n")
+    finally:
+        chunks.put(None)
+
+
+class HttpError(Exception):
+    """An error of a request, answered with its HTTP status"""
+
+    def __init__(self, status: HTTPStatus, message: str = None):
+        """Constructor"""
+        super().__init__(message or status.phrase)
+        self.status = status
+
+
+class ValidationService:
+    """The asyncio validation service of the rules files"""
+
+    def __init__(self, rules_files: List[str], jobs: int = 1,
+                 validation_options: ValidationOptions = None,
+                 upload_directory: str = None, max_upload_size: Optional[int] = None):
+        """Constructor
+
+            Reads and validates the rules files, they are named by their file name
+            in the requests.
+
+            Args:
+                rules_files (List[str]):
+                    The file paths of the rules files.
+                jobs (int):
+                    The count of worker processes, the count of ifc files validated
+                    at the same time. The other requests wait after their upload.
+                validation_options (ValidationOptions):
+                    The options of the validation. If None, the default options are used.
+                upload_directory (str):
+                    The directory of the uploaded ifc files.
+                    If None, the directory of temporary files.
+                max_upload_size (Optional[int]):
+                    The maximum count of bytes of an ifc file. If None, unlimited.
+
+            Raises:
+                ValueError:
+                    If `jobs` is less than 1, the validation options use worker processes
+                    or two rules files have the same file name.
+        """
+        if jobs < 1:
+            raise ValueError(f"jobs {jobs} is less than 1")
+        if validation_options is None:
+            validation_options = ValidationOptions()
+        if validation_options.processes > 1:
+            raise ValueError("the worker processes of the service can not start processes")
+        with open(os.path.join(os.path.dirname(__file__), "rules.schema.json"),
+                  encoding="utf-8") as schema_file:
+            rules_schema = json.load(schema_file)
+        self.rules_definitions: Dict[str, List[dict]] = {}
+        self.rules_files: Dict[str, str] = {}
+        for rules_file in rules_files:
+            name = os.path.basename(rules_file)
+            if name in self.rules_definitions:
+                raise ValueError(f"rules file name {name} is not unique")
+            with open(rules_file, encoding="utf-8") as yaml_file:
+                rules_json = yaml.safe_load(yaml_file)
+            jsonschema.validate(instance=rules_json, schema=rules_schema)
+            self.rules_definitions[name] = rules_json["rules"]
+            self.rules_files[name] = rules_file
+        self.jobs = jobs
+        self.validation_options = validation_options
+        self.upload_directory = upload_directory
+        self.max_upload_size = max_upload_size
+        self._context = multiprocessing.get_context("spawn")
+        self._manager = None
+        self._process_pool = None
+        self._queue_readers = None
+        self._job_slots = None
+        self._handlers = set()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.AbstractServer:
+        """Starts the worker processes and the server on `host` and `port`
+
+            The worker processes are spawned, so the main module of a program
+            starting the service needs the ``if __name__ == "__main__":`` guard.
+
+            Returns:
+                asyncio.AbstractServer:
+                    The server, `port` 0 binds a free port.
+        """
+        self._manager = self._context.Manager()
+        self._process_pool = ProcessPoolExecutor(max_workers=self.jobs, mp_context=self._context)
+        self._queue_readers = ThreadPoolExecutor(max_workers=self.jobs)
+        self._job_slots = asyncio.Semaphore(self.jobs)
+        return await asyncio.start_server(self.handle, host, port)
+
+    async def close(self):
+        """Waits for the requests being served and stops the worker processes"""
+        if self._handlers:
+            await asyncio.wait(self._handlers)
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._queue_readers.shutdown()
+            self._manager.shutdown()
+            self._process_pool = self._queue_readers = self._manager = None
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serves one request of the connection"""
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        try:
+            try:
+                rules_name, ifc_file_name, content_length = await self._read_request(
+                    reader, writer)
+                ifc_file = await self._receive_upload(reader, ifc_file_name, content_length)
+            except HttpError as error:
+                await self._send_error(writer, error)
+                return
+            try:
+                await self._send_report(writer, rules_name, ifc_file)
+            finally:
+                shutil.rmtree(os.path.dirname(ifc_file))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            self._handlers.discard(handler)
+
+    async def _read_request(self, reader: asyncio.StreamReader,
+                            writer: asyncio.StreamWriter):
+        """Reads the request line and the headers,
+            answers `Expect: 100-continue` before the upload is read
+
+            Returns:
+                Tuple[str, str, int]:
+                    The name of the rules file, the name of the ifc file
+                    and the content length.
+
+            Raises:
+                HttpError:
+                    If the request is not a validation request of a known rules file.
+        """
+        request_line = (await _read_line(reader)).split()
+        if len(request_line) != 3:
+            raise HttpError(HTTPStatus.BAD_REQUEST)
+        method, target, _ = request_line
+        headers = {}
+        for _ in range(_HEADER_LIMIT):
+            line = (await _read_line(reader)).strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise HttpError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE)
+        if not target.startswith("/validate/"):
+            raise HttpError(HTTPStatus.NOT_FOUND)
+        if method != "POST":
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED)
+        url = urlsplit(target)
+        rules_name = unquote(url.path[len("/validate/"):])
+        ifc_file_name = os.path.basename(parse_qs(url.query).get("ifc", [""])[0])
+        if ifc_file_name in ("", ".", ".."):
+            ifc_file_name = "upload.ifc"
+        if rules_name not in self.rules_definitions:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"unknown rules file {rules_name}")
+        if "content-length" not in headers:
+            raise HttpError(HTTPStatus.LENGTH_REQUIRED)
+        try:
+            content_length = int(headers["content-length"])
+        except ValueError as error:
+            raise HttpError(HTTPStatus.BAD_REQUEST) from error
+        if content_length < 0:
+            raise HttpError(HTTPStatus.BAD_REQUEST)
+        if self.max_upload_size is not None and content_length > self.max_upload_size:
+            raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        if headers.get("expect", "").lower() == "100-continue":
+            writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+            await writer.drain()
+        return rules_name, ifc_file_name, content_length
+
+    async def _receive_upload(self, reader: asyncio.StreamReader, ifc_file_name: str,
+                              content_length: int) -> str:
+        """Streams the uploaded ifc file into a temporary directory of its own
+
+            Returns:
+                str:
+                    The file path of the uploaded ifc file.
+        """
+        upload_directory = tempfile.mkdtemp(prefix="upload-", dir=self.upload_directory)
+        ifc_file = os.path.join(upload_directory, ifc_file_name)
+        try:
+            with open(ifc_file, "wb") as upload_file:
+                remaining = content_length
+                while remaining:
+                    data = await reader.read(min(remaining, UPLOAD_CHUNK_SIZE))
+                    if not data:
+                        raise asyncio.IncompleteReadError(b"", remaining)
+                    upload_file.write(data)
+                    remaining -= len(data)
+        except BaseException:
+            shutil.rmtree(upload_directory)
+            raise
+        return ifc_file
+
+    def _replace_process_pool(self, process_pool: ProcessPoolExecutor):
+        """Replaces the process pool broken by a dead worker process,
+            unless it is replaced already"""
+        if self._process_pool is process_pool:
+            process_pool.shutdown(wait=False)
+            self._process_pool = ProcessPoolExecutor(max_workers=self.jobs,
+                                                     mp_context=self._context)
+
+    def _submit_job(self, *args) -> asyncio.Future:
+        """Submits :func:`validate_job` to the process pool,
+            replaces the process pool if it is broken"""
+        loop = asyncio.get_running_loop()
+        try:
+            return loop.run_in_executor(self._process_pool, validate_job, *args)
+        except BrokenProcessPool:
+            self._replace_process_pool(self._process_pool)
+            return loop.run_in_executor(self._process_pool, validate_job, *args)
+
+    async def _send_report(self, writer: asyncio.StreamWriter, rules_name: str, ifc_file: str):
+        """Validates the ifc file on a worker process and streams the report chunks.
+
+            If the client disconnects, the job is cancelled and its remaining chunks
+            are dropped.
+        """
+        async with self._job_slots:
+            chunks = self._manager.Queue()
+            cancelled = self._manager.Event()
+            job = self._submit_job(self.rules_definitions[rules_name],
+                                   self.rules_files[rules_name], ifc_file,
+                                   self.validation_options, chunks, cancelled)
+            process_pool = self._process_pool
+            connected = True
+            try:
+                writer.write(b"HTTP/1.1 200 OK\r\n"
+                             b"Content-Type: application/x-ndjson; charset=utf-8\r\n"
+                             b"Transfer-Encoding: chunked\r\n"
+                             b"Connection: close\r\n\r\n")
+                while True:
+                    chunk = await self._next_chunk(chunks, job)
+                    if chunk is None:
+                        break
+                    if connected:
+                        try:
+                            data = chunk.encode("utf-8")
+                            writer.write(b"%x\r\n%b\r\n" % (len(data), data))
+                            await writer.drain()
+                        except ConnectionError:
+                            connected = False
+                            cancelled.set()
+                if connected:
+                    writer.write(b"0\r\n\r\n")
+                    await writer.drain()
+            finally:
+                cancelled.set()
+                await asyncio.wait([job])
+                if not job.cancelled() and isinstance(job.exception(), BrokenProcessPool):
+                    self._replace_process_pool(process_pool)
+
+    async def _next_chunk(self, chunks, job: asyncio.Future) -> Optional[str]:
+        """Gets the next report chunk of the job, None after the last one.
+
+            If the worker process of the job ended without its last chunk,
+            the error is the last chunk.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                return await loop.run_in_executor(self._queue_readers, chunks.get,
+                                                  True, _POLL_INTERVAL)
+            except queue.Empty:
+                if job.done():
+                    error = job.exception()
+                    chunks.put(None)
+                    return json.dumps({"record": "error", "message": str(error)},
+                                      ensure_ascii=False) + "\n"
+
+    @staticmethod
+    async def _send_error(writer: asyncio.StreamWriter, error: HttpError):
+        """Answers the request with the status of the error"""
+        data = (str(error) + "\n").encode("utf-8")
+        writer.write(f"HTTP/1.1 {error.status.value} {error.status.phrase}\r\n"
+                     f"Content-Type: text/plain; charset=utf-8\r\n"
+                     f"Content-Length: {len(data)}\r\n"
+                     f"Connection: close\r\n\r\n".encode("latin-1") + data)
+        await writer.drain()
+
+
+async def _read_line(reader: asyncio.StreamReader) -> str:
+    """Reads a line of the request line or the headers
+
+        Raises:
+            HttpError:
+                If the line is too long.
+    """
+    try:
+        return (await reader.readline()).decode("latin-1")
+    except ValueError as error:
+        raise HttpError(HTTPStatus.BAD_REQUEST) from error
+
+
+async def serve(service: ValidationService, host: str, port: int):
+    """Serves the requests until cancelled"""
+    server = await service.start(host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog='ifc_data_checker.service')
+    parser.add_argument(
+        "rules", nargs="+",
+        help="The paths to the rules files, requested by their file name "
+             "as POST /validate/<rules file name>.")
+    parser.add_argument("--host", default="127.0.0.1", help="The host to listen on.")
+    parser.add_argument("--port", type=int, default=8080, help="The port to listen on.")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="Validate up to N ifc files at the same time "
+                             "on N worker processes.")
+    parser.add_argument("--threads", type=int, default=1, metavar="N",
+                        help="Validate the instances of each rule on N threads per job.")
+    parser.add_argument("--model-backend", choices=list(backends.model_backends),
+                        default="ifcopenshell",
+                        help="The backend to open the ifc files.")
+    parser.add_argument("--upload-dir", metavar="DIR",
+                        help="The directory of the uploaded ifc files.")
+    parser.add_argument("--max-upload-size", type=int, metavar="BYTES",
+                        help="Refuse ifc files larger than BYTES.")
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs needs at least 1 job")
+    if args.threads < 1:
+        parser.error("--threads needs at least 1 thread")
+    args_service = ValidationService(
+        args.rules, args.jobs,
+        ValidationOptions(model_backend=args.model_backend, threads=args.threads),
+        args.upload_dir, args.max_upload_size)
+    try:
+        asyncio.run(serve(args_service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
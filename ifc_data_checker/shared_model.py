@@ -0,0 +1,232 @@
+"""Read-only tables of a scanned IFC STEP file shared with worker processes
+
+    The parent process scans the STEP file once as :class:`ifc_data_checker.step.LazyStepModel`,
+    builds the inverse tables the rules need and writes the tables into one temporary file.
+    Each worker process memory-maps the tables file and the STEP file read-only,
+    so all the processes share the same pages of the page cache instead of
+    parsing the ifc file and building the tables once per process.
+
+    Tables file layout, native byte order, each table aligned to 8 bytes::
+
+        entity ids (int64), sorted
+        offsets (int64), type codes (uint32), by the sorted entity ids
+        entity ids grouped by type code (int64), sorted within each type
+        per inverse table: referenced ids (int64), sorted,
+            referencing ids starts (int64), count + 1, referencing ids (int64)
+
+    The descriptor passed to the worker processes holds the positions of the tables,
+    the type names of the type codes and the references of the inverse tables.
+"""
+import bisect
+import mmap
+import os
+import tempfile
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from ifc_data_checker import backends
+from ifc_data_checker import indexes
+from ifc_data_checker.step import LazyStepModel
+
+_ALIGNMENT = 8
+
+_attached_model = None
+
+
+class SharedTables:
+    """The tables file of a scanned STEP file, written by the parent process"""
+
+    def __init__(self, model: LazyStepModel, attribute_names: Iterable[str] = ()):
+        """Constructor
+
+            Builds the inverse tables of the inverse attributes named `attribute_names`
+            and writes the tables of the `model` into a temporary file.
+
+            Args:
+                model (LazyStepModel):
+                    The scanned STEP file.
+                attribute_names (Iterable[str]):
+                    The names of the inverse attributes used by the rules,
+                    like `IsDefinedBy`.
+        """
+        for reference in sorted(model.inverse_references(attribute_names)):
+            model.inverse_table(*reference)
+        entity_ids = array("q", sorted(model.offsets))
+        type_names = sorted(set(model.types.values()))
+        type_codes = {type_name: code for code, type_name in enumerate(type_names)}
+        tables = [("ids", entity_ids),
+                  ("offsets", array("q", (model.offsets[entity_id] for entity_id in entity_ids))),
+                  ("types", array("I", (type_codes[model.types[entity_id]]
+                                        for entity_id in entity_ids)))]
+        ids_by_type = array("q")
+        type_ranges = []
+        for type_name in type_names:
+            start = len(ids_by_type)
+            ids_by_type.extend(sorted(model.ids_by_type[type_name]))
+            type_ranges.append((type_name, start, len(ids_by_type)))
+        tables.append(("ids_by_type", ids_by_type))
+        inverse_tables = []
+        for (entity_reference, attribute_reference), inverse_table in \
+                model.inverse_tables.items():
+            referenced_ids = array("q", sorted(inverse_table))
+            starts = array("q", [0])
+            referencing_ids = array("q")
+            for referenced_id in referenced_ids:
+                referencing_ids.extend(inverse_table[referenced_id])
+                starts.append(len(referencing_ids))
+            position = len(tables)
+            tables += [("referenced", referenced_ids), ("starts", starts),
+                       ("referencing", referencing_ids)]
+            inverse_tables.append((entity_reference, attribute_reference, position))
+        file_descriptor, self.file_name = tempfile.mkstemp(prefix="ifc-data-checker-",
+                                                           suffix=".tables")
+        positions = []
+        with os.fdopen(file_descriptor, "wb") as tables_file:
+            for _, table in tables:
+                start = tables_file.tell()
+                tables_file.write(table.tobytes())
+                positions.append((table.typecode, start, len(table)))
+                tables_file.write(bytes(-tables_file.tell() % _ALIGNMENT))
+            if not tables_file.tell():
+                tables_file.write(bytes(_ALIGNMENT))
+        self.descriptor = {
+            "ifc_file": model.key,
+            "tables_file": self.file_name,
+            "tables": positions,
+            "type_names": type_names,
+            "type_ranges": type_ranges,
+            "inverse_tables": inverse_tables
+        }
+        """The positions of the tables in the tables file, passed to the worker processes"""
+
+    def close(self):
+        """Removes the tables file"""
+        if os.path.exists(self.file_name):
+            os.remove(self.file_name)
+
+
+class SharedColumn(Mapping):
+    """A read-only mapping of the entity ids to the values of a shared table"""
+
+    def __init__(self, entity_ids: memoryview, values: memoryview,
+                 names: Optional[List[str]] = None):
+        """Constructor
+
+            Args:
+                entity_ids (memoryview):
+                    The sorted entity ids.
+                values (memoryview):
+                    The values by the position of the entity ids.
+                names (Optional[List[str]]):
+                    If not None, the values are codes of these names.
+        """
+        self.entity_ids = entity_ids
+        self.values = values
+        self.names = names
+
+    def __getitem__(self, entity_id: int) -> Any:
+        """Gets the value of the entity id, found by bisection"""
+        position = bisect.bisect_left(self.entity_ids, entity_id)
+        if position == len(self.entity_ids) or self.entity_ids[position] != entity_id:
+            raise KeyError(entity_id)
+        value = self.values[position]
+        return value if self.names is None else self.names[value]
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterates the sorted entity ids"""
+        return iter(self.entity_ids)
+
+    def __len__(self) -> int:
+        """Gets the count of the entity ids"""
+        return len(self.entity_ids)
+
+
+class SharedInverseTable(Mapping):
+    """A read-only inverse table of referencing ids by the referenced id of a shared table"""
+
+    def __init__(self, referenced_ids: memoryview, starts: memoryview,
+                 referencing_ids: memoryview):
+        """Constructor"""
+        self.referenced_ids = referenced_ids
+        self.starts = starts
+        self.referencing_ids = referencing_ids
+
+    def __getitem__(self, entity_id: int) -> memoryview:
+        """Gets the referencing ids of the referenced entity id, found by bisection"""
+        position = bisect.bisect_left(self.referenced_ids, entity_id)
+        if position == len(self.referenced_ids) or self.referenced_ids[position] != entity_id:
+            raise KeyError(entity_id)
+        return self.referencing_ids[self.starts[position]:self.starts[position + 1]]
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterates the sorted referenced ids"""
+        return iter(self.referenced_ids)
+
+    def __len__(self) -> int:
+        """Gets the count of the referenced ids"""
+        return len(self.referenced_ids)
+
+
+class SharedStepModel(LazyStepModel):
+    """A :class:`ifc_data_checker.step.LazyStepModel` on the shared tables of a worker process.
+
+        Inverse tables not shared by the parent process are built by the worker process.
+    """
+
+    def __init__(self, descriptor: Dict[str, Any]):
+        """Constructor
+
+            Args:
+                descriptor (Dict[str, Any]):
+                    The descriptor of the tables file, see :attr:`SharedTables.descriptor`.
+        """
+        super().__init__(descriptor["ifc_file"], ({}, {}))
+        with open(descriptor["tables_file"], "rb") as tables_file:
+            self.tables_data = mmap.mmap(tables_file.fileno(), 0, access=mmap.ACCESS_READ)
+        tables = [memoryview(self.tables_data)[start:start + count * array(typecode).itemsize]
+                  .cast(typecode) for typecode, start, count in descriptor["tables"]]
+        entity_ids, offsets, type_codes, ids_by_type = tables[:4]
+        self.offsets = SharedColumn(entity_ids, offsets)
+        self.types = SharedColumn(entity_ids, type_codes, descriptor["type_names"])
+        self.ids_by_type = {type_name: ids_by_type[start:end]
+                            for type_name, start, end in descriptor["type_ranges"]}
+        self._sorted_types = set(self.ids_by_type)
+        self.inverse_tables = {
+            (entity_reference, attribute_reference): SharedInverseTable(
+                *tables[position:position + 3])
+            for entity_reference, attribute_reference, position in descriptor["inverse_tables"]}
+
+
+def inverse_attribute_names(definition: Any) -> Set[str]:
+    """Gets the names of the attributes and the lists of the path operators
+        of a rules definition, which are the candidates of the inverse attributes"""
+    names = set()
+    if isinstance(definition, dict):
+        for key, value in definition.items():
+            if key in ("list", "attribute") and isinstance(value, str):
+                names.add(value)
+            else:
+                names |= inverse_attribute_names(value)
+    elif isinstance(definition, list):
+        for value in definition:
+            names |= inverse_attribute_names(value)
+    return names
+
+
+def attach(descriptor: Dict[str, Any]):
+    """Attaches the worker process to the shared tables,
+        activates the lazy model backend and a model index on the shared model.
+
+        The initializer of the worker processes.
+    """
+    global _attached_model  # pylint: disable=global-statement
+    _attached_model = SharedStepModel(descriptor)
+    backends.activate(backends.get_backend("lazy"))
+    indexes.activate(indexes.ModelIndex(_attached_model))
+
+
+def get_attached_model() -> Optional[SharedStepModel]:
+    """Gets the shared model of the worker process, None if not attached"""
+    return _attached_model
+
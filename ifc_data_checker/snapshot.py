@@ -0,0 +1,202 @@
+"""Snapshots of the scanned IFC STEP files
+
+    A snapshot keeps the offsets and the types of the entity instances of a
+    :class:`ifc_data_checker.step.LazyStepModel` and the inverse tables built while validating,
+    so the next validation of the same STEP file neither scans the STEP file
+    nor decodes the referencing entity instances of the inverse attributes again.
+    The snapshot file is named by the SHA-256 hash of the STEP file,
+    a changed STEP file gets a new snapshot.
+
+    File layout, all integers little-endian::
+
+        magic b"IDCS", version (uint8)
+        zlib compressed:
+            header length (uint32), header (JSON, utf-8)
+            entity ids (int64), offsets (int64), type codes (uint32)
+            per inverse table of the header: referenced ids (int64),
+                referencing ids counts (uint32), referencing ids (int64)
+
+    The header holds the entity count, the type names of the type codes and per inverse table
+    its entity reference, attribute reference, referenced ids count and referencing ids count.
+"""
+import hashlib
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from typing import Dict, List, Tuple
+
+from ifc_data_checker.step import LazyStepModel
+
+MAGIC = b"IDCS"
+VERSION = 1
+SNAPSHOT_SUFFIX = ".idcs"
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+Entities = Tuple[Dict[int, int], Dict[int, str]]
+"""The offsets and the upper case types of the entity instances by their ids"""
+
+InverseTables = Dict[Tuple[str, str], Dict[int, List[int]]]
+"""The ids of the referencing entity instances by the id of the referenced entity instance,
+    by the entity reference and the attribute reference"""
+
+
+def file_hash(ifc_file: str) -> str:
+    """Gets the SHA-256 hash of the content of the ifc file as hex digest"""
+    digest = hashlib.sha256()
+    with open(ifc_file, "rb") as hashed_file:
+        for chunk in iter(lambda: hashed_file.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _pack_array(values: array) -> bytes:
+    """Packs the values of the array little-endian"""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack_array(typecode: str, data: bytes, offset: int, count: int) -> Tuple[array, int]:
+    """Unpacks `count` little-endian values, returns the array and the next offset"""
+    values = array(typecode)
+    end = offset + count * values.itemsize
+    values.frombytes(data[offset:end])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values, end
+
+
+class SnapshotStepModel(LazyStepModel):
+    """A :class:`ifc_data_checker.step.LazyStepModel` opened from its snapshot, if it exists.
+
+        Without a snapshot, the STEP file is scanned and the snapshot is written on `save`.
+    """
+
+    def __init__(self, ifc_file: str, snapshot_directory: str):
+        """Constructor
+
+            Args:
+                ifc_file (str):
+                    The file path of the IFC STEP file.
+                snapshot_directory (str):
+                    The directory of the snapshot files.
+
+            Raises:
+                ValueError:
+                    If the file is empty, its schema is unknown or the snapshot is invalid.
+        """
+        self.snapshot_file = os.path.join(snapshot_directory,
+                                          file_hash(ifc_file) + SNAPSHOT_SUFFIX)
+        entities = None
+        inverse_tables = {}
+        if os.path.exists(self.snapshot_file):
+            entities, inverse_tables = read_snapshot(self.snapshot_file)
+        super().__init__(ifc_file, entities)
+        self.inverse_tables.update(inverse_tables)
+        self._saved_inverse_tables = set(inverse_tables) if entities is not None else None
+
+    def save(self):
+        """Writes the snapshot, if there is no snapshot or new inverse tables were built"""
+        if (self._saved_inverse_tables is not None and
+                self._saved_inverse_tables.issuperset(self.inverse_tables)):
+            return
+        write_snapshot(self, self.snapshot_file)
+        self._saved_inverse_tables = set(self.inverse_tables)
+
+
+def write_snapshot(model: LazyStepModel, snapshot_file_name: str):
+    """Writes the snapshot of the `model`.
+
+        The snapshot is written to a temporary file first and then renamed,
+        so a snapshot is never read half written.
+
+        Args:
+            model (LazyStepModel):
+                The scanned STEP file with its inverse tables.
+            snapshot_file_name (str):
+                The file path of the snapshot.
+    """
+    entity_ids = array("q", model.offsets.keys())
+    type_names = sorted(set(model.types.values()))
+    type_codes = {type_name: code for code, type_name in enumerate(type_names)}
+    inverse_tables = []
+    data = [_pack_array(entity_ids),
+            _pack_array(array("q", (model.offsets[entity_id] for entity_id in entity_ids))),
+            _pack_array(array("I", (type_codes[model.types[entity_id]]
+                                    for entity_id in entity_ids)))]
+    for (entity_reference, attribute_reference), inverse_table in model.inverse_tables.items():
+        referencing_ids = array("q")
+        for ids in inverse_table.values():
+            referencing_ids.extend(ids)
+        inverse_tables.append([entity_reference, attribute_reference,
+                               len(inverse_table), len(referencing_ids)])
+        data += [_pack_array(array("q", inverse_table.keys())),
+                 _pack_array(array("I", (len(ids) for ids in inverse_table.values()))),
+                 _pack_array(referencing_ids)]
+    header = json.dumps({
+        "entities": len(entity_ids),
+        "types": type_names,
+        "inverse_tables": inverse_tables
+    }).encode("utf-8")
+    body = zlib.compress(struct.pack("<I", len(header)) + header + b"".join(data))
+    directory = os.path.dirname(snapshot_file_name)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temporary_file_name = f"{snapshot_file_name}.{os.getpid()}.tmp"
+    with open(temporary_file_name, "wb") as snapshot_file:
+        snapshot_file.write(MAGIC + struct.pack("<B", VERSION) + body)
+    os.replace(temporary_file_name, snapshot_file_name)
+
+
+def read_snapshot(snapshot_file_name: str) -> Tuple[Entities, InverseTables]:
+    """Reads a snapshot.
+
+        Args:
+            snapshot_file_name (str):
+                The file path of the snapshot.
+
+        Returns:
+            Tuple[Entities, InverseTables]:
+                The offsets and the types of the entity instances by their ids
+                and the inverse tables.
+
+        Raises:
+            ValueError:
+                Raised if the file is not a snapshot.
+    """
+    with open(snapshot_file_name, "rb") as snapshot_file:
+        data = snapshot_file.read()
+    if data[:4] != MAGIC or len(data) < 5 or data[4] != VERSION:
+        raise ValueError(f"{snapshot_file_name} is not a snapshot")
+    try:
+        data = zlib.decompress(data[5:])
+    except zlib.error as error:
+        raise ValueError(f"{snapshot_file_name} is not a snapshot") from error
+    (header_length,) = struct.unpack_from("<I", data, 0)
+    offset = 4 + header_length
+    header = json.loads(data[4:offset].decode("utf-8"))
+    count = header["entities"]
+    entity_ids, offset = _unpack_array("q", data, offset, count)
+    offsets, offset = _unpack_array("q", data, offset, count)
+    type_codes, offset = _unpack_array("I", data, offset, count)
+    type_names = header["types"]
+    entities = (dict(zip(entity_ids, offsets)),
+                dict(zip(entity_ids, (type_names[code] for code in type_codes))))
+    inverse_tables = {}
+    for entity_reference, attribute_reference, ids_count, references_count in \
+            header["inverse_tables"]:
+        referenced_ids, offset = _unpack_array("q", data, offset, ids_count)
+        counts, offset = _unpack_array("I", data, offset, ids_count)
+        referencing_ids, offset = _unpack_array("q", data, offset, references_count)
+        inverse_table = {}
+        start = 0
+        for referenced_id, references in zip(referenced_ids, counts):
+            inverse_table[referenced_id] = referencing_ids[start:start + references].tolist()
+            start += references
+        inverse_tables[(entity_reference, attribute_reference)] = inverse_table
+    return entities, inverse_tables
@@ -0,0 +1,556 @@
+"""Memory-mapped and lazily parsed access to IFC STEP files
+
+    The STEP file is memory-mapped and scanned once for the ids, the types and the offsets
+    of its entity instances. An entity instance is only decoded, when one of its attributes
+    is accessed. The attribute names, the inverse attributes and the type hierarchy
+    are taken from the IFC schema of ifcopenshell.
+    Unlike ifcopenshell, derived attributes ``*`` are not computed but None.
+"""
+import mmap
+import os
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from ifcopenshell import ifcopenshell_wrapper
+
+_SCAN_PATTERN = re.compile(
+    rb"'[^']*'|/\*.*?\*/|#(\d+)\s*=\s*([A-Za-z][A-Za-z0-9_]*)\s*\(", re.DOTALL)
+"""Finds the entity instances, skipping over strings and comments.
+    An escaped quote ``''`` splits a string in two strings, which are skipped as well."""
+
+_SCHEMA_PATTERN = re.compile(rb"FILE_SCHEMA\s*\(\s*\(\s*'([^']+)'")
+
+_TOKEN_PATTERN = re.compile(rb"""\s*(?:
+    (?P<string>'(?:[^']|'')*')
+    |\#(?P<reference>\d+)
+    |\.(?P<enumeration>[A-Za-z0-9_]+)\.
+    |(?P<number>[+-]?(?:\d+(?P<real>\.\d*)?|(?P<fraction>\.\d+))(?P<exponent>[eE][+-]?\d+)?)
+    |(?P<binary>"[0-9A-Fa-f]*")
+    |(?P<keyword>[A-Za-z][A-Za-z0-9_]*)\s*\(
+    |(?P<open>\()
+    |(?P<close>\))
+    |(?P<comma>,)
+    |(?P<null>[$*])
+    )""", re.VERBOSE)
+
+_STRING_ESCAPE_PATTERN = re.compile(
+    r"''|\\\\|\\X2\\((?:[0-9A-Fa-f]{4})*)\\X0\\|\\X4\\((?:[0-9A-Fa-f]{8})*)\\X0\\"
+    r"|\\X\\([0-9A-Fa-f]{2})|\\S\\(.)|\\P[A-I]\\")
+
+_LOGICALS = {"T": True, "F": False, "U": "UNKNOWN"}
+
+DECODED_VALUES_SIZE = 65536
+"""The maximum count of decoded entity instances kept per model"""
+
+_models = weakref.WeakValueDictionary()
+"""The opened models by their key, to restore pickled entity instances"""
+
+
+def _decode_string_escape(match) -> str:
+    """Decodes one escape sequence of a STEP string"""
+    text = match.group(0)
+    if text == "''":
+        return "'"
+    if text == "\\\\":
+        return "\\"
+    if match.group(1) is not None:
+        return bytes.fromhex(match.group(1)).decode("utf-16-be")
+    if match.group(2) is not None:
+        return bytes.fromhex(match.group(2)).decode("utf-32-be")
+    if match.group(3) is not None:
+        return bytes.fromhex(match.group(3)).decode("latin-1")
+    if match.group(4) is not None:
+        return chr(ord(match.group(4)) + 128)
+    return ""
+
+
+def decode_string(data: bytes) -> str:
+    """Decodes the STEP string `data` without its quotes"""
+    return _STRING_ESCAPE_PATTERN.sub(_decode_string_escape, data.decode("latin-1"))
+
+
+def format_real(value: float) -> str:
+    """Formats a real like ifcopenshell writes it into a STEP file.
+
+        The shortest digits reading back as the same real, in fixed or in exponent
+        notation, whichever is shorter, always with a decimal point like ``1.E+15``.
+    """
+    sign, digits, exponent = Decimal(repr(value)).normalize().as_tuple()
+    digits = "".join(str(digit) for digit in digits)
+    count = len(digits)
+    if exponent >= 0:
+        fixed = str(int(abs(value)))
+    elif count + exponent > 0:
+        fixed = f"{digits[:count + exponent]}.{digits[count + exponent:]}"
+    else:
+        fixed = "0." + "0" * -(count + exponent) + digits
+    power = count + exponent - 1
+    scientific = f"{digits[0]}.{digits[1:]}E{'-' if power < 0 else '+'}{abs(power):02d}"
+    # the lengths are compared without the decimal point added to a single digit
+    if len(fixed) > len(scientific) - (count == 1):
+        return ("-" if sign else "") + scientific
+    return ("-" if sign else "") + (fixed if "." in fixed else fixed + ".")
+
+
+class StepSyntaxError(ValueError):
+    """Raised if an entity instance of the STEP file can not be decoded"""
+
+
+class TypedValue:
+    """A typed value of the STEP file like ``IFCLABEL('Wall')``.
+
+        Provides the interface of the typed values of ifcopenshell,
+        the value is the `wrappedValue`.
+    """
+
+    __slots__ = ("type_name", "wrappedValue", "text")
+
+    def __init__(self, type_name: str, wrapped_value, text: str):
+        """Constructor"""
+        self.type_name = type_name
+        self.wrappedValue = wrapped_value  # pylint: disable=invalid-name
+        self.text = text
+
+    def is_a(self, type_name: str = None):
+        """Gets the type name or checks if the value is of the type `type_name`"""
+        if type_name is None:
+            return self.type_name
+        return self.type_name.lower() == type_name.lower()
+
+    @staticmethod
+    def id() -> int:
+        """Typed values have no id"""
+        # pylint: disable=invalid-name
+        return 0
+
+    def __eq__(self, other):
+        """Equals the typed value of the same type and value"""
+        return (isinstance(other, TypedValue) and self.type_name == other.type_name and
+                self.wrappedValue == other.wrappedValue)
+
+    def __hash__(self):
+        """Hashes the type and the value"""
+        return hash((self.type_name, self.wrappedValue))
+
+    def __repr__(self):
+        """The typed value like in the STEP file"""
+        return f"{self.type_name}({self.text})"
+
+
+class LazyEntity:
+    """An entity instance of a :class:`LazyStepModel`, decoded on its first attribute access.
+
+        Provides the interface of the entity instances of ifcopenshell
+        used by the path operators and the constraint checks.
+    """
+
+    __slots__ = ("_model", "_id")
+
+    def __init__(self, model: "LazyStepModel", entity_id: int):
+        """Constructor"""
+        self._model = model
+        self._id = entity_id
+
+    def id(self) -> int:
+        """Gets the id of the entity instance"""
+        # pylint: disable=invalid-name
+        return self._id
+
+    def is_a(self, type_name: str = None):
+        """Gets the type name or checks if the entity instance is of the type `type_name`,
+            including its subtypes"""
+        if type_name is None:
+            return self._model.declaration(self._id).name()
+        return self._model.is_subtype(self._model.entity_type(self._id), type_name)
+
+    def __getattr__(self, attribute_name: str):
+        """Gets the decoded value of the attribute or the inverse attribute"""
+        if attribute_name.startswith("__"):
+            raise AttributeError(attribute_name)
+        return self._model.attribute(self._id, attribute_name)
+
+    def __dir__(self) -> Iterable[str]:
+        """Lists the attributes and the inverse attributes"""
+        declaration = self._model.declaration(self._id)
+        return [attribute.name() for attribute in declaration.all_attributes()] + \
+            [attribute.name() for attribute in declaration.all_inverse_attributes()]
+
+    def __eq__(self, other):
+        """Equals the entity instance with the same id of the same model"""
+        return (isinstance(other, LazyEntity) and self._model is other._model and
+                self._id == other._id)
+
+    def __hash__(self):
+        """Hashes the id"""
+        return hash(self._id)
+
+    def __repr__(self):
+        """The entity instance like in the STEP file"""
+        return f"#{self._id}={self.is_a()}({self._model.text(self._id)})"
+
+    def __reduce__(self):
+        """Pickles the entity instance as reference into the model opened with the same key,
+            so worker processes pass on the entity instances of the same STEP file"""
+        return (entity_by_key, (self._model.key, self._id))
+
+
+def entity_by_key(model_key: str, entity_id: int) -> LazyEntity:
+    """Gets the entity instance of the opened model with the `model_key`
+
+        Raises:
+            ValueError:
+                If no model with the `model_key` is opened.
+    """
+    model = _models.get(model_key)
+    if model is None:
+        raise ValueError(f"no model {model_key} is opened")
+    return LazyEntity(model, entity_id)
+
+
+class LazyStepModel:
+    """A memory-mapped IFC STEP file with lazily decoded entity instances.
+
+        Provides the interface of the ifc models of ifcopenshell
+        used by the validation, the entity instances are :class:`LazyEntity`.
+    """
+
+    def __init__(self, ifc_file: str, entities: Tuple[Dict[int, int], Dict[int, str]] = None):
+        """Constructor
+
+            Scans the STEP file once for the offsets of its entity instances.
+
+            Args:
+                ifc_file (str):
+                    The file path of the IFC STEP file.
+                entities (Tuple[Dict[int, int], Dict[int, str]]):
+                    The offsets and the upper case types of the entity instances by their ids
+                    from a former scan of the same STEP file. If None, the STEP file is scanned.
+
+            Raises:
+                ValueError:
+                    If the file is empty or its schema is unknown.
+        """
+        self.key = os.path.abspath(ifc_file)
+        """The key of the model to restore the pickled entity instances,
+            the absolute path of the STEP file"""
+        self._map()
+        schema_match = _SCHEMA_PATTERN.search(self.data)
+        if schema_match is None:
+            raise ValueError(f"{ifc_file} has no file schema")
+        self.schema_name = schema_match.group(1).decode("ascii").upper()
+        try:
+            self.schema = ifcopenshell_wrapper.schema_by_name(self.schema_name)
+        except (RuntimeError, IndexError) as error:
+            raise ValueError(f"{ifc_file} has the unknown schema {self.schema_name}") from error
+        self.offsets: Dict[int, int] = {}
+        self.types: Dict[int, str] = {}
+        self.ids_by_type: Dict[str, List[int]] = {}
+        if entities is None:
+            self._scan()
+        else:
+            self.offsets, self.types = entities
+            for entity_id, entity_type in self.types.items():
+                self.ids_by_type.setdefault(entity_type, []).append(entity_id)
+        self.inverse_tables: Dict[Tuple[str, str], Dict[int, List[int]]] = {}
+        """The ids of the referencing entity instances by the id of the referenced
+            entity instance, by the entity reference and the attribute reference"""
+        self._values: Dict[int, Tuple[tuple, int]] = OrderedDict()
+        self._values_lock = threading.Lock()
+        self._map_lock = threading.RLock()
+        self._declarations = {}
+        self._attribute_positions = {}
+        self._subtypes = {}
+        self._sorted_types = set()
+        _models[self.key] = self
+
+    def _map(self):
+        """Memory-maps the STEP file"""
+        with open(self.key, "rb") as step_file:
+            self.data = mmap.mmap(step_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _scan(self):
+        """Scans the STEP file for the offsets and the types of the entity instances"""
+        for match in _SCAN_PATTERN.finditer(self.data):
+            if match.group(1) is None:
+                continue
+            entity_id = int(match.group(1))
+            entity_type = match.group(2).decode("ascii").upper()
+            self.offsets[entity_id] = match.end() - 1
+            self.types[entity_id] = entity_type
+            self.ids_by_type.setdefault(entity_type, []).append(entity_id)
+
+    def declaration(self, entity_id: int):
+        """Gets the schema declaration of the type of the entity instance"""
+        return self._declaration(self.types[entity_id])
+
+    def _declaration(self, type_name: str):
+        """Gets the schema declaration of the type, cached by the upper case type name"""
+        if type_name not in self._declarations:
+            self._declarations[type_name] = self.schema.declaration_by_name(type_name)
+        return self._declarations[type_name]
+
+    def entity_type(self, entity_id: int) -> str:
+        """Gets the upper case type name of the entity instance"""
+        return self.types[entity_id]
+
+    def is_subtype(self, type_name: str, supertype_name: str) -> bool:
+        """Checks if the type `type_name` is the type `supertype_name` or one of its subtypes"""
+        key = (type_name, supertype_name.upper())
+        if key not in self._subtypes:
+            declaration = self._declaration(type_name)
+            while declaration is not None and declaration.name().upper() != key[1]:
+                declaration = declaration.supertype()
+            self._subtypes[key] = declaration is not None
+        return self._subtypes[key]
+
+    def by_id(self, entity_id: int) -> LazyEntity:
+        """Gets the entity instance by its id
+
+            Raises:
+                RuntimeError:
+                    If there is no entity instance with the id, like in ifcopenshell.
+        """
+        if entity_id not in self.offsets:
+            raise RuntimeError(f"Instance #{entity_id} not found")
+        return LazyEntity(self, entity_id)
+
+    def by_type(self, type_name: str) -> List[LazyEntity]:
+        """Gets the entity instances of the type `type_name`, including its subtypes.
+
+            The entity instances are grouped by their type depth-first through
+            the type hierarchy and ordered by their ids within each type, like in ifcopenshell.
+        """
+        types = [entity_type for entity_type in self.ids_by_type
+                 if self.is_subtype(entity_type, type_name)]
+        types.sort(key=self._type_order)
+        return [LazyEntity(self, entity_id)
+                for entity_type in types for entity_id in self._sorted_ids(entity_type)]
+
+    def _type_order(self, type_name: str) -> Tuple[int, ...]:
+        """Gets the schema positions of the type and its supertypes from the root type,
+            to order the types depth-first through the type hierarchy"""
+        positions = []
+        declaration = self._declaration(type_name)
+        while declaration is not None:
+            positions.append(declaration.index_in_schema())
+            declaration = declaration.supertype()
+        return tuple(reversed(positions))
+
+    def _sorted_ids(self, type_name: str) -> List[int]:
+        """Gets the ids of the entity instances of the type in ascending order"""
+        if type_name not in self._sorted_types:
+            self.ids_by_type[type_name] = sorted(self.ids_by_type[type_name])
+            self._sorted_types.add(type_name)
+        return self.ids_by_type[type_name]
+
+    def text(self, entity_id: int) -> str:
+        """Gets the attributes of the entity instance like written by ifcopenshell"""
+        if self.data.closed:
+            return self._reopened(self.text, entity_id)
+        _, end = self._decode(entity_id)
+        return self._text(self.offsets[entity_id] + 1, end - 1)
+
+    def _text(self, start: int, end: int) -> str:
+        """Gets the text of the STEP file from `start` to `end`
+            without whitespace, with the type names of the schema, the decoded strings
+            and the numbers formatted like by ifcopenshell"""
+        tokens = []
+        offset = start
+        while offset < end:
+            match = _TOKEN_PATTERN.match(self.data, offset)
+            if match is None:
+                raise StepSyntaxError(f"invalid STEP syntax at offset {offset}")
+            offset = match.end()
+            if match.lastgroup == "keyword":
+                type_name = match.group("keyword").decode("ascii").upper()
+                tokens.append(f"{self._declaration(type_name).name()}(")
+            elif match.lastgroup == "string":
+                tokens.append(f"'{self._decode_simple(match)}'")
+            elif match.lastgroup == "number":
+                number = self._decode_simple(match)
+                tokens.append(format_real(number) if isinstance(number, float) else str(number))
+            else:
+                tokens.append(match.group(0).strip().decode("latin-1"))
+        return "".join(tokens)
+
+    def _decode(self, entity_id: int) -> Tuple[tuple, int]:
+        """Decodes the attribute values of the entity instance, cached by its id.
+
+            At most `DECODED_VALUES_SIZE` decoded entity instances are kept,
+            the least recently used are dropped first.
+        """
+        with self._values_lock:
+            decoded = self._values.get(entity_id)
+            if decoded is not None:
+                self._values.move_to_end(entity_id)
+                return decoded
+        if self.data.closed:
+            return self._reopened(self._decode, entity_id)
+        decoded = self._decode_aggregate(self.offsets[entity_id] + 1)
+        with self._values_lock:
+            self._values[entity_id] = decoded
+            if len(self._values) > DECODED_VALUES_SIZE:
+                self._values.popitem(last=False)
+        return decoded
+
+    def _decode_aggregate(self, offset: int) -> Tuple[tuple, int]:
+        """Decodes the values of an aggregate from `offset` after its opening parenthesis
+            up to its closing parenthesis, returns the values and the offset after it"""
+        values = []
+        while True:
+            match = _TOKEN_PATTERN.match(self.data, offset)
+            if match is None:
+                raise StepSyntaxError(f"invalid STEP syntax at offset {offset}")
+            offset = match.end()
+            kind = match.lastgroup
+            if kind == "close":
+                return tuple(values), offset
+            if kind == "comma":
+                continue
+            if kind == "open":
+                value, offset = self._decode_aggregate(offset)
+            elif kind == "keyword":
+                typed_values, end = self._decode_aggregate(offset)
+                type_name = self._declaration(match.group("keyword").decode("ascii").upper())
+                value = TypedValue(type_name.name(), typed_values[0] if typed_values else None,
+                                   self._text(offset, end - 1))
+                offset = end
+            else:
+                value = self._decode_simple(match)
+            values.append(value)
+
+    def _decode_simple(self, match) -> Any:
+        """Decodes a simple value token"""
+        kind = match.lastgroup
+        if kind == "string":
+            return decode_string(match.group("string")[1:-1])
+        if kind == "reference":
+            return LazyEntity(self, int(match.group("reference")))
+        if kind == "enumeration":
+            enumeration = match.group("enumeration").decode("ascii")
+            return _LOGICALS.get(enumeration, enumeration)
+        if kind == "number":
+            number = match.group("number")
+            if match.group("real") or match.group("fraction") or match.group("exponent"):
+                return float(number)
+            return int(number)
+        if kind == "binary":
+            return match.group("binary")[1:-1].decode("ascii")
+        return None
+
+    def attribute(self, entity_id: int, attribute_name: str) -> Any:
+        """Gets the decoded value of the attribute or the inverse attribute of the entity instance
+
+            Raises:
+                AttributeError:
+                    If the entity instance has no attribute `attribute_name`.
+        """
+        entity_type = self.types[entity_id]
+        key = (entity_type, attribute_name)
+        if key not in self._attribute_positions:
+            self._attribute_positions[key] = self._attribute_position(entity_type, attribute_name)
+        position = self._attribute_positions[key]
+        if position is None:
+            raise AttributeError(
+                f"entity instance of type "
+                f"'{self.schema.name()}.{self._declaration(entity_type).name()}' "
+                f"has no attribute '{attribute_name}'")
+        if isinstance(position, int):
+            values, _ = self._decode(entity_id)
+            return values[position] if position < len(values) else None
+        return self.inverse(entity_id, *position)
+
+    def _attribute_position(self, entity_type: str, attribute_name: str):
+        """Gets the position of the attribute or the reference of the inverse attribute,
+            None if there is no such attribute"""
+        declaration = self._declaration(entity_type)
+        for position, attribute in enumerate(declaration.all_attributes()):
+            if attribute.name() == attribute_name:
+                return position
+        for inverse_attribute in declaration.all_inverse_attributes():
+            if inverse_attribute.name() == attribute_name:
+                return (inverse_attribute.entity_reference().name(),
+                        inverse_attribute.attribute_reference().name())
+        return None
+
+    def inverse(self, entity_id: int, entity_reference: str,
+                attribute_reference: str) -> Tuple[LazyEntity, ...]:
+        """Gets the entity instances of the type `entity_reference`
+            referencing the entity instance by their attribute `attribute_reference`.
+
+            The inverse table is built on first usage by decoding the entity instances
+            of the type `entity_reference` only.
+        """
+        return tuple(LazyEntity(self, referencing_id) for referencing_id in
+                     self.inverse_table(entity_reference, attribute_reference).get(entity_id, ()))
+
+    def inverse_table(self, entity_reference: str,
+                      attribute_reference: str) -> Dict[int, List[int]]:
+        """Gets the ids of the entity instances of the type `entity_reference` by the id
+            of the entity instance they reference by their attribute `attribute_reference`,
+            built on first usage"""
+        key = (entity_reference, attribute_reference)
+        if key not in self.inverse_tables:
+            inverse_table = {}
+            for ifc_instance in self.by_type(entity_reference):
+                value = getattr(ifc_instance, attribute_reference)
+                references = value if isinstance(value, tuple) else (value,)
+                for reference in references:
+                    if isinstance(reference, LazyEntity):
+                        inverse_table.setdefault(reference.id(), []).append(ifc_instance.id())
+            self.inverse_tables[key] = inverse_table
+        return self.inverse_tables[key]
+
+    def inverse_references(self, attribute_names: Iterable[str]) -> Set[Tuple[str, str]]:
+        """Gets the entity references and the attribute references of the inverse attributes
+            named `attribute_names` of the types of the entity instances of the model"""
+        attribute_names = set(attribute_names)
+        references = set()
+        for entity_type in self.ids_by_type:
+            for inverse_attribute in self._declaration(entity_type).all_inverse_attributes():
+                if inverse_attribute.name() in attribute_names:
+                    references.add((inverse_attribute.entity_reference().name(),
+                                    inverse_attribute.attribute_reference().name()))
+        return references
+
+    def close(self):
+        """Closes the memory map of the STEP file and drops the decoded entity instances.
+
+            An entity instance decoded afterwards maps the STEP file again
+            for this access only, see :meth:`_reopened`.
+        """
+        with self._map_lock:
+            with self._values_lock:
+                self._values.clear()
+            self.data.close()
+
+    def _reopened(self, function, *args):
+        """Calls `function` with the STEP file of the closed model mapped again
+            and closes the memory map afterwards"""
+        with self._map_lock:
+            if not self.data.closed:
+                return function(*args)
+            self._map()
+            try:
+                return function(*args)
+            finally:
+                self.data.close()
+
+
+def open_model(ifc_file: str) -> LazyStepModel:
+    """Opens the IFC STEP file as :class:`LazyStepModel`.
+
+        Args:
+            ifc_file (str):
+                The file path of the IFC STEP file.
+
+        Returns:
+            LazyStepModel:
+                The memory-mapped model with lazily decoded entity instances.
+    """
+    return LazyStepModel(ifc_file)
+
@@ -11,6 +11,94 @@ class ValidationResult(Enum):
     VALID = 3
 
 
+class ReportLevel(Enum):
+    """Report Level of the validated rules"""
+
+    SUMMARY = "summary"
+    FAILURES = "failures"
+    FULL = "full"
+
+
+class ValidationOptions():
+    """Options of the validation of the rules"""
+
+    def __init__(self, report_level: ReportLevel = ReportLevel.FULL,
+                 max_failures_per_rule: int = None, fail_fast: bool = False,
+                 sampling=None, model_backend: str = "ifcopenshell",
+                 snapshot_directory: str = None, threads: int = 1, processes: int = 1,
+                 profile_file: str = None):
+        """Constructor
+
+            Args:
+                report_level (ReportLevel):
+                    Which ifc instances and constraints are kept for the report.
+                    `ReportLevel.SUMMARY` keeps the rule results only,
+                    `ReportLevel.FAILURES` the failing ifc instances with their failing
+                    constraints and `ReportLevel.FULL` everything.
+                max_failures_per_rule (int):
+                    The validation of a rule stops after this count of failed ifc instances.
+                    If None, all the ifc instances are validated.
+                fail_fast (bool):
+                    If True, the validation of a rule stops after the first failed
+                    ifc instance and no more rules are validated after the first
+                    not valid rule.
+                sampling (ifc_data_checker.sampling.Sampling):
+                    If not None, only a sample of the ifc instances of each rule
+                    is validated.
+                model_backend (str):
+                    The name of the backend to open the ifc file,
+                    `ifcopenshell` to parse the whole ifc file on opening
+                    or `lazy` to decode the entity instances on demand.
+                snapshot_directory (str):
+                    If not None, the lazy model backend opens the ifc file from its snapshot
+                    in this directory and writes the snapshot after the validation.
+                threads (int):
+                    The count of threads validating the ifc instances of a rule concurrently.
+                    With 1, the ifc instances are validated one by one.
+                processes (int):
+                    The count of worker processes validating the ifc instances of a rule
+                    concurrently, on the shared tables of the lazy model backend.
+                    With 1, the ifc instances are validated in the process itself.
+                profile_file (str):
+                    If not None, the validation times of the ifc instances are read from
+                    this file to validate the expensive ifc instances first on the threads
+                    or processes, and the validation times are written to this file.
+
+            Raises:
+                ValueError:
+                    If `max_failures_per_rule`, `threads` or `processes` is less than 1,
+                    both `threads` and `processes` are more than 1 or
+                    a `snapshot_directory` or `processes` are given without
+                    the lazy model backend.
+        """
+        if max_failures_per_rule is not None and max_failures_per_rule < 1:
+            raise ValueError(f"max_failures_per_rule {max_failures_per_rule} is less than 1")
+        if threads < 1:
+            raise ValueError(f"threads {threads} is less than 1")
+        if processes < 1:
+            raise ValueError(f"processes {processes} is less than 1")
+        if threads > 1 and processes > 1:
+            raise ValueError("threads and processes can not be combined")
+        if processes > 1 and model_backend != "lazy":
+            raise ValueError(f"processes require the lazy model backend, not {model_backend}")
+        if snapshot_directory is not None and model_backend != "lazy":
+            raise ValueError(f"snapshots require the lazy model backend, not {model_backend}")
+        self.report_level = report_level
+        self.max_failures_per_rule = 1 if fail_fast else max_failures_per_rule
+        self.fail_fast = fail_fast
+        self.sampling = sampling
+        self.model_backend = model_backend
+        self.snapshot_directory = snapshot_directory
+        self.threads = threads
+        self.processes = processes
+        self.profile_file = profile_file
+
+    @property
+    def workers(self) -> int:
+        """The count of threads or processes validating the ifc instances of a rule"""
+        return max(self.threads, self.processes)
+
+
 class ValidationInformation():
     """Validation information of a check"""
 
@@ -0,0 +1,190 @@
+"""Model Backend Unit Test Suite"""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from ifc_data_checker import backends
+from ifc_data_checker.backends import LazyStepBackend
+from ifc_data_checker.backends import ModelBackend
+from ifc_data_checker.rules import Rule
+from ifc_data_checker.rules import get_instances
+from ifc_data_checker.rules import iter_validate
+from ifc_data_checker.validation import ValidationOptions
+from ifc_data_checker.validation import ValidationResult
+from tests.step.lazy_step_model_test import STEP_FILE
+
+
+class DictBackend(ModelBackend):
+    """Model backend of ifc instances as plain dicts with the keys `type` and `id`"""
+
+    def open(self, ifc_file: str):
+        """Not used by the tests"""
+        raise NotImplementedError
+
+    def by_type(self, ifc_model, ifc_class: str):
+        """Gets the dicts of the `ifc_class` from the list `ifc_model`"""
+        return [ifc_instance for ifc_instance in ifc_model if ifc_instance["type"] == ifc_class]
+
+    def get_attribute(self, ifc_instance, attribute_name: str):
+        """Gets the item of the dict, AttributeError if missing"""
+        if attribute_name not in ifc_instance:
+            raise AttributeError(attribute_name)
+        return ifc_instance[attribute_name]
+
+    def has_attribute(self, ifc_instance, attribute_name: str) -> bool:
+        """Checks if the dict has the item"""
+        return isinstance(ifc_instance, dict) and attribute_name in ifc_instance
+
+    def is_entity(self, value) -> bool:
+        """Checks if the value is a dict"""
+        return isinstance(value, dict)
+
+    def is_a(self, ifc_instance, ifc_class: str = None):
+        """Gets or compares the item `type`"""
+        if ifc_class is None:
+            return ifc_instance["type"]
+        return ifc_instance["type"] == ifc_class
+
+    def id(self, ifc_instance) -> int:
+        """Gets the item `id`"""
+        return ifc_instance["id"]
+
+
+class TestModelBackend(unittest.TestCase):
+    """Test Model Backend"""
+
+    ifc_model = [
+        {"type": "IfcWall", "id": 1, "Name": "Wall", "GlobalId": "1",
+         "Parts": [{"type": "IfcPart", "id": 3, "Name": "Part"}]},
+        {"type": "IfcWall", "id": 2, "Name": "Door", "GlobalId": "2",
+         "Parts": [{"type": "IfcWall", "id": 4, "Name": "Part"}]},
+        {"type": "IfcSlab", "id": 5, "Name": "Slab", "GlobalId": "5", "Parts": []}
+    ]
+
+    def tearDown(self):
+        backends.activate(None)
+
+    def test_default_backend(self):
+        """Tests ``get_active_backend`` without an active model backend.
+
+        Test-Purpose:
+            Tests that the ifcopenshell model backend is the default model backend.
+
+        Under Test:
+            * ``backends.get_active_backend``
+            * ``backends.get_backend``
+
+        Given:
+            * no active model backend
+
+        Expected:
+            The ifcopenshell model backend"""
+        self.assertIs(backends.get_backend("ifcopenshell"), backends.get_active_backend())
+
+    def test_unknown_backend(self):
+        """Tests ``get_backend`` on a model backend not existing.
+
+        Test-Purpose:
+            Tests that unknown model backends are refused.
+
+        Under Test:
+            * ``backends.get_backend``
+
+        Given:
+            * name: a name of no model backend
+
+        Expected:
+            ValueError is raised"""
+        with self.assertRaises(ValueError):
+            backends.get_backend("unknown")
+
+    def test_validate_with_backend(self):
+        """Tests ``Rule.validate`` with another model backend.
+
+        Test-Purpose:
+            Tests that the rules, the path operators and the constraint checks
+            access the ifc instances through the active model backend only.
+
+        Under Test:
+            * ``get_instances``
+            * ``Rule.validate``
+
+        Given:
+            * active model backend: ifc instances as plain dicts
+            * rule: constraints with an attribute, a list and a type check
+
+        Expected:
+            The first wall is valid, the second wall is failed
+
+        Comment:
+            Plain dicts have neither attributes nor the method `is_a`,
+            so each access not through the model backend fails."""
+        backends.activate(DictBackend())
+        rule_definition = {
+            "classes": ["IfcWall"],
+            "constraints": [
+                {"path": [{"attribute": "Name"}], "check": {"equals": "Wall"}},
+                {"path": [{"list": "Parts"}], "check": {"type": "IfcPart"}}
+            ]
+        }
+        ifc_instances = get_instances(rule_definition["classes"], self.ifc_model)
+        self.assertEqual([1, 2], [ifc_instance["id"] for ifc_instance in ifc_instances])
+        rule = Rule(rule_definition, ifc_instances)
+        rule.validate()
+        self.assertEqual(ValidationResult.FAILED, rule.validation_information.validation_result)
+        self.assertEqual(
+            [ValidationResult.VALID, ValidationResult.FAILED],
+            [instance_validation["validation_information"].validation_result
+             for instance_validation in rule.validation])
+        self.assertEqual("IfcWall Door Global Id: 2: 0 of 2 constraints are valid.",
+                         rule.validation[1]["validation_information"].message)
+
+    def test_close_after_validation(self):
+        """Tests ``iter_validate`` on closing the ifc model.
+
+        Test-Purpose:
+            Tests that the model backend closes the ifc model after the validation,
+            also if the validation is not iterated to its end.
+
+        Under Test:
+            * ``iter_validate``
+            * ``LazyStepBackend.close``
+
+        Given:
+            * model backend: the lazy model backend, recording the closed ifc models
+            * rules: two rules on walls
+
+        Expected:
+            The ifc model is closed after the last rule and
+            after the validation is stopped at the first rule"""
+        closed_models = []
+
+        class ClosingBackend(LazyStepBackend):
+            """Lazy model backend recording the closed ifc models"""
+
+            def close(self, ifc_model):
+                """Records and closes the ifc model"""
+                closed_models.append(ifc_model)
+                super().close(ifc_model)
+
+        rule = {"rule": {"classes": ["IfcWall"], "constraints": [
+            {"path": [{"attribute": "Name"}], "check": {"equals": "Wall B"}}]}}
+        with tempfile.TemporaryDirectory() as directory:
+            ifc_file = os.path.join(directory, "model.ifc")
+            with open(ifc_file, "w", encoding="latin-1") as step_file:
+                step_file.write(STEP_FILE)
+            options = ValidationOptions(model_backend="closing")
+            with mock.patch.dict(backends.model_backends, {"closing": ClosingBackend()}):
+                self.assertEqual(2, len(list(iter_validate([rule, rule], ifc_file, options))))
+                self.assertEqual(1, len(closed_models))
+                self.assertTrue(closed_models[0].data.closed)
+                validated_rules = iter_validate([rule, rule], ifc_file, options)
+                next(validated_rules)
+                self.assertEqual(1, len(closed_models))
+                validated_rules.close()
+                self.assertEqual(2, len(closed_models))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,222 @@
+"""Batch Unit Test Suite"""
+import json
+import os
+import subprocess  # nosec
+import sys
+import tempfile
+import unittest
+
+from ifc_data_checker import batch
+from ifc_data_checker.batch import BatchQueue
+from ifc_data_checker.batch import JobStatus
+from ifc_data_checker.batch import parse_memory
+from ifc_data_checker.batch import run_batch
+from tests.step.lazy_step_model_test import STEP_FILE
+
+MEGABYTE = 1024 ** 2
+
+
+class TestBatch(unittest.TestCase):
+    """Test Batch"""
+
+    rules_definition = [
+        {"rule": {"classes": ["IfcWall"], "constraints": [
+            {"path": [{"attribute": "Name"}], "check": {"equals": "Wall B"}}]}}
+    ]
+
+    def setUp(self):
+        """Writes the rules file and a small and a large STEP file into a temporary directory"""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.rules_file = os.path.join(self.directory.name, "rules.yml")
+        with open(self.rules_file, "w", encoding="utf-8") as rules_file:
+            json.dump({"rules": self.rules_definition}, rules_file)
+        self.ifc_files = []
+        for name, comment in (("large.ifc", "/* padding */\n" * 100), ("small.ifc", "")):
+            ifc_file = os.path.join(self.directory.name, name)
+            with open(ifc_file, "w", encoding="latin-1") as step_file:
+                step_file.write(STEP_FILE.replace("DATA;\n", "DATA;\n" + comment))
+            self.ifc_files.append(ifc_file)
+        self.state_file = os.path.join(self.directory.name, "state.json")
+        self.command = ["--model-backend", "lazy", self.rules_file]
+
+    def tearDown(self):
+        """Removes the temporary directory"""
+        self.directory.cleanup()
+
+    def test_next_job(self):
+        """Tests ``BatchQueue.next_job`` within the memory budget.
+
+        Test-Purpose:
+            Tests that the job on the smallest ifc file is started first and
+            a job is started only if it fits into the memory budget besides the running jobs.
+
+        Under Test:
+            * ``BatchQueue.next_job``
+
+        Given:
+            * ifc files: a large and a small STEP file
+
+        Expected:
+            The job on the small ifc file first, the job on the large ifc file
+            only within the memory budget or without running jobs"""
+        batch_queue = BatchQueue(self.state_file, self.ifc_files, self.command, "lazy")
+        small_job = batch_queue.next_job(0, 0)
+        self.assertEqual(self.ifc_files[1], small_job["ifc_file"])
+        batch_queue.start(small_job)
+        reserved_memory = batch_queue.estimate_memory(small_job["size"])
+        large_memory = batch_queue.estimate_memory(batch_queue.jobs[0]["size"])
+        self.assertIsNone(batch_queue.next_job(reserved_memory,
+                                               reserved_memory + large_memory - 1))
+        self.assertEqual(self.ifc_files[0], batch_queue.next_job(
+            reserved_memory, reserved_memory + large_memory)["ifc_file"])
+        self.assertEqual(self.ifc_files[0], batch_queue.next_job(0, 0)["ifc_file"])
+
+    def test_estimate_memory(self):
+        """Tests ``BatchQueue.estimate_memory`` calibrated by finished jobs.
+
+        Test-Purpose:
+            Tests that the memory per byte of the ifc file is calibrated by the jobs
+            whose peak memory is mostly taken by their ifc file.
+
+        Under Test:
+            * ``BatchQueue.estimate_memory``
+            * ``BatchQueue.finish``
+
+        Given:
+            * finished jobs: a job of little peak memory and
+              a job of 4 bytes of memory per byte of its ifc file
+
+        Expected:
+            The default memory per byte first, 4 bytes per byte after the calibration"""
+        batch_queue = BatchQueue(self.state_file, self.ifc_files, self.command, "lazy")
+        self.assertEqual(batch.MEMORY_BASE + 3 * 100 * MEGABYTE,
+                         batch_queue.estimate_memory(100 * MEGABYTE))
+        small_job, large_job = batch_queue.jobs[1], batch_queue.jobs[0]
+        batch_queue.finish(small_job, 0, batch.MEMORY_BASE // 2, 1.0)
+        large_job["size"] = 100 * MEGABYTE
+        batch_queue.finish(large_job, 0, batch.MEMORY_BASE + 4 * large_job["size"], 1.0)
+        self.assertEqual(batch.MEMORY_BASE + 4 * 100 * MEGABYTE,
+                         batch_queue.estimate_memory(100 * MEGABYTE))
+
+    def test_resume(self):
+        """Tests ``BatchQueue.__init__`` on the state file of an interrupted batch.
+
+        Test-Purpose:
+            Tests that an interrupted batch resumes with its unfinished jobs,
+            while a batch of other ifc files or another command starts anew
+            with the calibration.
+
+        Under Test:
+            * ``BatchQueue.__init__``
+
+        Given:
+            * state file: a done and a running job, a calibration
+
+        Expected:
+            The done job is kept and the running job is pending again
+            for the same ifc files in another order, all jobs pending
+            for other ifc files or another command"""
+        batch_queue = BatchQueue(self.state_file, self.ifc_files, self.command, "lazy")
+        batch_queue.start(batch_queue.jobs[1])
+        batch_queue.finish(batch_queue.jobs[1], 0, MEGABYTE, 1.0)
+        batch_queue.start(batch_queue.jobs[0])
+        resumed_queue = BatchQueue(self.state_file, self.ifc_files[::-1], self.command, "lazy")
+        self.assertEqual([JobStatus.PENDING.value, JobStatus.DONE.value],
+                         [job["status"] for job in resumed_queue.jobs])
+        other_files_queue = BatchQueue(self.state_file, self.ifc_files[1:], self.command, "lazy")
+        self.assertEqual([JobStatus.PENDING.value],
+                         [job["status"] for job in other_files_queue.jobs])
+        batch_queue.save()
+        new_queue = BatchQueue(self.state_file, self.ifc_files,
+                               ["--report-level", "summary"] + self.command, "lazy")
+        self.assertEqual([JobStatus.PENDING.value] * 2,
+                         [job["status"] for job in new_queue.jobs])
+        self.assertEqual({"lazy": [[batch_queue.jobs[1]["size"], MEGABYTE]]},
+                         new_queue.calibration)
+        with open(self.state_file, "w", encoding="utf-8") as state_file:
+            state_file.write("[]")
+        with self.assertRaises(ValueError):
+            BatchQueue(self.state_file, self.ifc_files, self.command, "lazy")
+
+    def test_same_file_names(self):
+        """Tests ``BatchQueue.__init__`` on ifc files of the same file name.
+
+        Test-Purpose:
+            Tests that a batch of ifc files, whose validation reports would
+            overwrite each other, is refused.
+
+        Under Test:
+            * ``BatchQueue.__init__``
+
+        Given:
+            * ifc files: the small STEP file and a copy of it in a subdirectory
+
+        Expected:
+            ValueError is raised"""
+        os.mkdir(os.path.join(self.directory.name, "copy"))
+        copied_file = os.path.join(self.directory.name, "copy", "small.ifc")
+        with open(copied_file, "w", encoding="latin-1") as step_file:
+            step_file.write(STEP_FILE)
+        with self.assertRaises(ValueError):
+            BatchQueue(self.state_file, [self.ifc_files[1], copied_file], self.command, "lazy")
+        self.assertFalse(os.path.exists(self.state_file))
+
+    def test_run_batch(self):
+        """Tests ``run_batch`` on subprocesses.
+
+        Test-Purpose:
+            Tests that the ifc files are validated in subprocesses and
+            their peak memory calibrates the memory estimate.
+
+        Under Test:
+            * ``run_batch``
+
+        Given:
+            * ifc files: a large and a small STEP file
+            * command: the rules file relative to the working directory
+            * memory budget: 1 byte, so one job runs at a time
+            * report directory: a relative subdirectory
+            * another subprocess of the test exiting during the batch
+
+        Expected:
+            Both jobs are done, a validation report per ifc file in the report directory,
+            a calibration per job, the other subprocess is not reaped by the batch"""
+        report_directory = os.path.relpath(os.path.join(self.directory.name, "reports"))
+        os.mkdir(report_directory)
+        command = ["--model-backend", "lazy", os.path.relpath(self.rules_file)]
+        batch_queue = BatchQueue(self.state_file, self.ifc_files, command, "lazy")
+        other_process = subprocess.Popen([sys.executable, "-c", "pass"])  # nosec
+        failed_jobs = run_batch(batch_queue, parse_memory("1"), 2, report_directory)
+        self.assertEqual(other_process.pid, os.waitpid(other_process.pid, 0)[0])
+        other_process.returncode = 0
+        self.assertEqual(0, failed_jobs)
+        self.assertEqual([JobStatus.DONE.value, JobStatus.DONE.value],
+                         [job["status"] for job in batch_queue.jobs])
+        for name in ("large.ifc", "small.ifc"):
+            self.assertTrue(os.path.exists(os.path.join(
+                report_directory, f"validation report rules.yml {name}.txt")))
+        self.assertEqual(2, len(batch_queue.calibration["lazy"]))
+
+    def test_parse_memory(self):
+        """Tests ``parse_memory``.
+
+        Test-Purpose:
+            Tests that bytes of memory are parsed with and without a unit.
+
+        Under Test:
+            * ``parse_memory``
+
+        Given:
+            * memory: `512`, `1.5K`, `8g` and `lots`
+
+        Expected:
+            The bytes of memory, ValueError for `lots`"""
+        self.assertEqual(512, parse_memory("512"))
+        self.assertEqual(1536, parse_memory("1.5K"))
+        self.assertEqual(8 * 1024 ** 3, parse_memory("8g"))
+        with self.assertRaises(ValueError):
+            parse_memory("lots")
+
+
+if __name__ == '__main__':
+    unittest.main()
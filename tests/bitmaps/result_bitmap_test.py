@@ -0,0 +1,88 @@
+"""Result Bitmap Unit Test Suite"""
+import unittest
+
+from ifc_data_checker.bitmaps import ResultBitmap
+from ifc_data_checker.validation import ValidationResult
+
+
+class TestResultBitmap(unittest.TestCase):
+    """Test Result Bitmap"""
+
+    @staticmethod
+    def create_bitmap(*validation_results) -> ResultBitmap:
+        """Creates the bitmap of the given validation results"""
+        bitmap = ResultBitmap()
+        for validation_result in validation_results:
+            bitmap.append(validation_result)
+        return bitmap
+
+    def test_count(self):
+        """Tests ``ResultBitmap`` on counting the validation results.
+
+        Test-Purpose:
+            Tests that the validation results get counted by their kind.
+
+        Under Test:
+            * ``ResultBitmap.count``
+            * ``ResultBitmap.valid_count``
+            * ``ResultBitmap.result``
+
+        Given:
+            * bitmap: two valid, one failed and one error validation results
+
+        Expected:
+            The counts of the validation results and the validation result by index"""
+        bitmap = self.create_bitmap(ValidationResult.VALID, ValidationResult.FAILED,
+                                    ValidationResult.ERROR, ValidationResult.VALID)
+        self.assertEqual(4, len(bitmap))
+        self.assertEqual(2, bitmap.valid_count())
+        self.assertEqual(1, bitmap.count(ValidationResult.FAILED))
+        self.assertEqual(1, bitmap.count(ValidationResult.ERROR))
+        self.assertEqual(ValidationResult.ERROR, bitmap.result(2))
+        self.assertTrue(bitmap.is_valid(3))
+
+    def test_all_valid(self):
+        """Tests ``ResultBitmap.all_valid`` on combining bitmaps.
+
+        Test-Purpose:
+            Tests that an ifc instance is valid, if it is valid in each bitmap.
+
+        Under Test:
+            * ``ResultBitmap.all_valid``
+
+        Given:
+            * bitmaps: two bitmaps with valid, failed and error validation results
+
+        Expected:
+            A bitmap with valid and failed validation results only"""
+        first = self.create_bitmap(ValidationResult.VALID, ValidationResult.VALID,
+                                   ValidationResult.ERROR, ValidationResult.FAILED)
+        second = self.create_bitmap(ValidationResult.VALID, ValidationResult.FAILED,
+                                    ValidationResult.VALID, ValidationResult.FAILED)
+        expected = self.create_bitmap(ValidationResult.VALID, ValidationResult.FAILED,
+                                      ValidationResult.FAILED, ValidationResult.FAILED)
+        self.assertEqual(expected.results, ResultBitmap.all_valid([first, second], 4).results)
+        self.assertEqual(4, ResultBitmap.all_valid([], 4).valid_count())
+
+    def test_any_valid(self):
+        """Tests ``ResultBitmap.any_valid`` on combining bitmaps.
+
+        Test-Purpose:
+            Tests that an ifc instance is valid, if it is valid in one of the bitmaps.
+
+        Under Test:
+            * ``ResultBitmap.any_valid``
+
+        Given:
+            * bitmaps: two bitmaps with valid, failed and error validation results
+
+        Expected:
+            A bitmap with valid and failed validation results only"""
+        first = self.create_bitmap(ValidationResult.VALID, ValidationResult.FAILED,
+                                   ValidationResult.ERROR, ValidationResult.FAILED)
+        second = self.create_bitmap(ValidationResult.FAILED, ValidationResult.VALID,
+                                    ValidationResult.FAILED, ValidationResult.ERROR)
+        expected = self.create_bitmap(ValidationResult.VALID, ValidationResult.VALID,
+                                      ValidationResult.FAILED, ValidationResult.FAILED)
+        self.assertEqual(expected.results, ResultBitmap.any_valid([first, second], 4).results)
+        self.assertEqual(0, ResultBitmap.any_valid([], 4).valid_count())
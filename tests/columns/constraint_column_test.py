@@ -0,0 +1,197 @@
+"""Constraint Column Unit Test Suite"""
+import unittest
+
+from ifc_data_checker import config
+from ifc_data_checker.columns import ConstraintColumn
+from ifc_data_checker.columns import create_column
+from ifc_data_checker.columns import is_columnar
+from ifc_data_checker.constraints import Constraint
+
+from tests.helpers import IfcInstanceMock
+
+
+class TestConstraintColumn(unittest.TestCase):
+    """Test Constraint Column"""
+
+    ifc_instances = (
+        IfcInstanceMock(Name="Wall 1", GlobalId="Id1", ifc_type="IfcWall", Tag="A"),
+        IfcInstanceMock(Name="Wall 2", GlobalId="Id2", ifc_type="IfcWall", Tag="B"),
+        IfcInstanceMock(Name="Wall 3", GlobalId="Id3", ifc_type="IfcWall", Tag=""),
+        IfcInstanceMock(Name="Wall 4", GlobalId="Id4", ifc_type="IfcWall"),
+    )
+
+    def assert_same_as_constraint(self, constraint_definition):
+        """Asserts that the column validates each instance as ``Constraint`` does"""
+        column = ConstraintColumn(constraint_definition, self.ifc_instances)
+        column.evaluate()
+        for index, ifc_instance in enumerate(self.ifc_instances):
+            constraint = Constraint(constraint_definition, ifc_instance)
+            constraint.validate()
+            validated_constraint = column.constraint(index)
+            self.assertEqual(constraint.is_valid(), validated_constraint.is_valid())
+            self.assertEqual(constraint.validation_information,
+                             validated_constraint.validation_information)
+            self.assertEqual(constraint.report(), validated_constraint.report())
+
+    def test_column_equals(self):
+        """Tests ``ConstraintColumn`` on an equals check.
+
+        Test-Purpose:
+            Tests that the column validates the same results and messages as ``Constraint``,
+            including missing attributes and empty values.
+
+        Under Test:
+            * ``ConstraintColumn.evaluate``
+            * ``ColumnConstraint``
+
+        Given:
+            * `ifc_instances`: Mock instances with different, empty and missing `Tag`
+            * `constraint_definition`: attribute path with equals check
+
+        Expected:
+            The same validation information as ``Constraint`` for each instance
+
+        Comment:
+            Usage of ``IfcInstanceMock`` to represent an ifc instance"""
+        self.assert_same_as_constraint(
+            {"path": [{"attribute": "Tag"}], "check": {"equals": "A"}})
+
+    def test_column_in(self):
+        """Tests ``ConstraintColumn`` on an in check.
+
+        Test-Purpose:
+            Tests that the column validates the same results and messages as ``Constraint``
+
+        Under Test:
+            * ``ConstraintColumn.evaluate``
+            * ``ColumnConstraint``
+
+        Given:
+            * `ifc_instances`: Mock instances with different `Tag`
+            * `constraint_definition`: attribute path with in check
+
+        Expected:
+            The same validation information as ``Constraint`` for each instance
+
+        Comment:
+            Usage of ``IfcInstanceMock`` to represent an ifc instance"""
+        self.assert_same_as_constraint(
+            {"path": [{"attribute": "Tag"}], "check": {"in": ["B", "C"]}})
+
+    def test_column_not_exists_type(self):
+        """Tests ``ConstraintColumn`` on negated exists and type checks.
+
+        Test-Purpose:
+            Tests that the column validates the same results and messages as ``Constraint``,
+            also on an empty path and on checks resulting in errors.
+
+        Under Test:
+            * ``ConstraintColumn.evaluate``
+            * ``ColumnConstraint``
+
+        Given:
+            * `ifc_instances`: Mock instances
+            * `constraint_definition`: empty path with negated exists check,
+              attribute path with type and negated type check
+
+        Expected:
+            The same validation information as ``Constraint`` for each instance
+
+        Comment:
+            Usage of ``IfcInstanceMock`` to represent an ifc instance"""
+        self.assert_same_as_constraint(
+            {"path": None, "check": {"not": {"exists": "Tag"}}})
+        self.assert_same_as_constraint(
+            {"path": None, "check": {"type": "IfcWall"}})
+        self.assert_same_as_constraint(
+            {"path": [{"attribute": "Name"}], "check": {"not": {"type": "IfcWall"}}})
+
+    def test_column_groups(self):
+        """Tests ``GroupColumn`` on set, and and or groups.
+
+        Test-Purpose:
+            Tests that the group column validates the same results and messages
+            as the constraint groups, including nested and empty groups.
+
+        Under Test:
+            * ``GroupColumn.evaluate``
+            * ``ColumnGroup``
+            * implicit: ``ResultBitmap.all_valid``, ``ResultBitmap.any_valid``
+
+        Given:
+            * `ifc_instances`: Mock instances with different, empty and missing `Tag`
+            * `constraint_definition`: nested set, and and or groups
+
+        Expected:
+            The same validation information and report as the constraint groups
+            for each instance
+
+        Comment:
+            Usage of ``IfcInstanceMock`` to represent an ifc instance"""
+        tag_equals = {"path": [{"attribute": "Tag"}], "check": {"equals": "A"}}
+        tag_in = {"path": [{"attribute": "Tag"}], "check": {"in": ["A", "B"]}}
+        for group_definition in ({"set": [tag_equals, tag_in]},
+                                 {"and": [tag_in, {"or": [tag_equals, {"set": []}]}]},
+                                 {"or": [tag_equals, {"and": [tag_in]}]},
+                                 {"or": []},
+                                 {"and": []}):
+            column = create_column(group_definition, self.ifc_instances)
+            column.evaluate()
+            for index, ifc_instance in enumerate(self.ifc_instances):
+                group = config.get_constraint(group_definition, ifc_instance)
+                group.validate()
+                validated_group = column.constraint(index)
+                self.assertEqual(group.is_valid(), validated_group.is_valid())
+                self.assertEqual(group.validation_information,
+                                 validated_group.validation_information)
+                self.assertEqual(group.report(), validated_group.report())
+
+    def test_is_columnar(self):
+        """Tests ``is_columnar`` on detecting columnar constraints.
+
+        Test-Purpose:
+            Tests that only constraints with attribute path operators
+            and simple checks are columnar.
+
+        Under Test:
+            * ``is_columnar``
+
+        Given:
+            * constraint definitions with attribute, list and filter path operators
+              and with different checks
+
+        Expected:
+            Only attribute paths with equals, in, in_file, exists, type
+            and not checks and groups of them are columnar"""
+        self.assertTrue(is_columnar(
+            {"path": [{"attribute": "Name"}], "check": {"equals": "Wall"}}))
+        self.assertTrue(is_columnar(
+            {"path": None, "check": {"not": {"exists": "Name"}}}))
+        self.assertFalse(is_columnar(
+            {"path": [{"list": "IsDefinedBy"}], "check": {"equals": "Wall"}}))
+        self.assertFalse(is_columnar(
+            {"path": [{"attribute": "Name", "value": "Wall"}], "check": {"exists": "Name"}}))
+        self.assertFalse(is_columnar(
+            {"path": [{"attribute": "Name"}], "check": {"equals": ""}}))
+        self.assertTrue(is_columnar(
+            {"or": [{"path": None, "check": {"exists": "Name"}}, {"and": []}]}))
+        self.assertFalse(is_columnar(
+            {"set": [{"path": [{"list": "IsDefinedBy"}], "check": {"equals": "Wall"}}]}))
+
+    def test_column_not_columnar(self):
+        """Tests ``ConstraintColumn`` on validating the input parameter correctly.
+
+        Test-Purpose:
+            parameter input validation of `constraint_definition`
+
+        Under Test:
+            * ``ConstraintColumn``
+
+        Given:
+            * `constraint_definition`: constraint with a list path operator
+
+        Expected:
+            Raises ``ValueError`` because the constraint is not columnar"""
+        self.assertRaises(ValueError, ConstraintColumn,
+                          {"path": [{"list": "IsDefinedBy"}], "check": {"equals": "Wall"}},
+                          self.ifc_instances)
@@ -0,0 +1,89 @@
+"""Command Line Unit Test Suite"""
+import json
+import os
+import subprocess  # nosec
+import sys
+import tempfile
+import unittest
+
+from tests.step.lazy_step_model_test import STEP_FILE
+
+PACKAGE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestCommandLine(unittest.TestCase):
+    """Test Command Line"""
+
+    def setUp(self):
+        """Writes a rules file and a STEP file into a temporary directory"""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.rules_file = os.path.join(self.directory.name, "rules.yml")
+        with open(self.rules_file, "w", encoding="utf-8") as rules_file:
+            json.dump({"rules": [{"rule": {"classes": ["IfcWall"], "constraints": [
+                {"path": [{"attribute": "Name"}], "check": {"equals": "Wall B"}}]}}]},
+                rules_file)
+        self.ifc_file = os.path.join(self.directory.name, "test.ifc")
+        with open(self.ifc_file, "w", encoding="latin-1") as step_file:
+            step_file.write(STEP_FILE)
+
+    def tearDown(self):
+        """Removes the temporary directory"""
+        self.directory.cleanup()
+
+    def run_command_line(self, *options: str) -> subprocess.CompletedProcess:
+        """Runs the ifc data checker on the rules file and the STEP file with the `options`"""
+        return subprocess.run(  # nosec
+            [sys.executable, "-m", "ifc_data_checker", self.rules_file, self.ifc_file,
+             "--model-backend", "lazy", *options],
+            cwd=PACKAGE_DIRECTORY, capture_output=True, text=True, check=False)
+
+    def test_max_failures_per_rule(self):
+        """Tests the command line on the maximum failures per rule.
+
+        Test-Purpose:
+            Tests that a maximum of failures per rule below 1 is refused
+            with a usage error instead of a traceback
+
+        Under Test:
+            * ``--max-failures-per-rule``
+
+        Given:
+            * maximum failures per rule: 0, -1 and 1
+
+        Expected:
+            A usage error for 0 and -1, the validation report for 1"""
+        for max_failures in ("0", "-1"):
+            completed = self.run_command_line("--max-failures-per-rule", max_failures)
+            self.assertEqual(2, completed.returncode)
+            self.assertIn("--max-failures-per-rule needs at least 1 failed instance",
+                          completed.stderr)
+            self.assertNotIn("Traceback", completed.stderr)
+        completed = self.run_command_line("--max-failures-per-rule", "1")
+        self.assertEqual(0, completed.returncode, completed.stderr)
+        self.assertIn("validation report rules.yml test.ifc", completed.stdout)
+
+    def test_sample_type_objects(self):
+        """Tests the command line on covering the type objects by the sample.
+
+        Test-Purpose:
+            Tests that covering the type objects without a sample is refused
+            with a usage error instead of being ignored
+
+        Under Test:
+            * ``--sample-type-objects``
+
+        Given:
+            * covering the type objects without and with a sample of 1 instance
+
+        Expected:
+            A usage error without the sample, the validation report with the sample"""
+        completed = self.run_command_line("--sample-type-objects")
+        self.assertEqual(2, completed.returncode)
+        self.assertIn("--sample-type-objects requires --sample", completed.stderr)
+        completed = self.run_command_line("--sample-type-objects", "--sample", "1")
+        self.assertEqual(0, completed.returncode, completed.stderr)
+        self.assertIn("validation report rules.yml test.ifc", completed.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
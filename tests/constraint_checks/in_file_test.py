@@ -0,0 +1,235 @@
+"""In File Check Unit Test Suite"""
+import os
+import tempfile
+from unittest import mock
+
+from ifc_data_checker import config
+from ifc_data_checker import indexes
+from ifc_data_checker.constraint_checks import InFileCheck
+from ifc_data_checker.definitions import resolve_allowed_values_files
+from ifc_data_checker.indexes import ModelIndex
+from ifc_data_checker.validation import ValidationInformation
+from ifc_data_checker.validation import ValidationResult
+
+from tests.constraint_checks.constraint_check_test import TestConstraintCheck
+from tests.helpers import IfcInstanceMock
+from tests.helpers import IfcModelMock
+
+
+class TestInFileCheck(TestConstraintCheck.TestParameterValidation):
+    """Test In File Constraint"""
+
+    constraint_check_class = InFileCheck
+    default_path_result = "three"
+    default_constraint = {"in_file": "allowed values.txt"}
+
+    def setUp(self):
+        """Creates the allowed values files"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.text_file = os.path.join(self.directory.name, "allowed values.txt")
+        with open(self.text_file, "w") as text_file:
+            text_file.write("one\ntwo\n\nthree\n")
+        self.csv_file = os.path.join(self.directory.name, "allowed values.csv")
+        with open(self.csv_file, "w") as csv_file:
+            csv_file.write("C-1,first code\nC-2,second code\n")
+
+    def tearDown(self):
+        """Removes the allowed values files"""
+        self.directory.cleanup()
+
+    def test_in_file_valid_text(self):
+        """Tests ``InFileCheck`` on valid validation results. Text file
+
+        Test-Purpose:
+            Tests that a value listed in the text file finishs in a `valid`
+            validation information
+
+        Under Test:
+            * ``InFileCheck.validate``
+            * implicit: ``load_allowed_values``
+
+        Given:
+            * `ifc_instance`: IFC Mock Instance
+            * `path_result`: "three"
+            * `constraint_check`: The in file constraint on a text file containing "three"
+
+        Expected:
+            validation information with ``ValidationResult.VALID``
+
+        Comment:
+            Usage of ``IfcInstanceMock`` to represent an ifc instance"""
+        ifc_instance = IfcInstanceMock(
+            Name="IfcMock",
+            GlobalId="IfcMockId",
+            ifc_type="MockType"
+        )
+        expected_result = ValidationInformation()
+        expected_result.set_valid("three is allowed")
+        check = InFileCheck({"in_file": self.text_file}, "three", ifc_instance)
+        self.assertEqual(expected_result, check.validate())
+
+    def test_in_file_failed_csv(self):
+        """Tests ``InFileCheck`` on failed validation results. CSV file
+
+        Test-Purpose:
+            Tests that a value not in the first column of the CSV file finishs in a `failed`
+            validation information
+
+        Under Test:
+            * ``InFileCheck.validate``
+            * implicit: ``load_allowed_values``
+
+        Given:
+            * `ifc_instance`: IFC Mock Instance
+            * `path_result`: "first code", which is in the second column only
+            * `constraint_check`: The in file constraint on a CSV file
+
+        Expected:
+            validation information with ``ValidationResult.FAILED``
+            naming the file instead of listing the values
+
+        Comment:
+            Usage of ``IfcInstanceMock`` to represent an ifc instance"""
+        ifc_instance = IfcInstanceMock(
+            Name="IfcMock",
+            GlobalId="IfcMockId",
+            ifc_type="MockType"
+        )
+        expected_result = ValidationInformation()
+        expected_result.set_failed(
+            "validation in error - allowed: values of allowed values.csv, actual: first code")
+        check = InFileCheck({"in_file": self.csv_file}, "first code", ifc_instance)
+        self.assertEqual(expected_result, check.validate())
+        check = InFileCheck({"in_file": self.csv_file}, "C-2", ifc_instance)
+        self.assertTrue(check.validate())
+
+    def test_in_file_missing_file(self):
+        """Tests ``InFileCheck`` on a missing file.
+
+        Test-Purpose:
+            error handling on a missing allowed values file
+
+        Under Test:
+            * ``InFileCheck.validate``
+
+        Given:
+            * `ifc_instance`: IFC Mock Instance
+            * `constraint_check`: The in file constraint on a missing file
+
+        Expected:
+            Raises ``ValueError`` because of the missing file
+
+        Comment:
+            Usage of ``IfcInstanceMock`` to represent an ifc instance"""
+        ifc_instance = IfcInstanceMock(
+            Name="IfcMock",
+            GlobalId="IfcMockId",
+            ifc_type="MockType"
+        )
+        missing_file = os.path.join(self.directory.name, "missing.txt")
+        check = InFileCheck({"in_file": missing_file}, "three", ifc_instance)
+        self.assertRaises(ValueError, check.validate)
+
+    def test_in_file_loaded_per_validation(self):
+        """Tests ``InFileCheck.get_allowed_values`` with and without a model index.
+
+        Test-Purpose:
+            Tests that the allowed values file is loaded once per validation,
+            without looking at the file again for each ifc instance
+
+        Under Test:
+            * ``InFileCheck.get_allowed_values``
+            * ``ModelIndex.loaded_allowed_values``
+
+        Given:
+            * `constraint_check`: two in file constraints on the same text file
+            * an active model index, then no model index
+
+        Expected:
+            The same allowed values for both checks of the model index, without a file
+            access by the second check, newly loaded allowed values without a model index"""
+        ifc_instance = IfcInstanceMock(Name="IfcMock", GlobalId="IfcMockId", ifc_type="MockType")
+        first_check = InFileCheck({"in_file": self.text_file}, "one", ifc_instance)
+        second_check = InFileCheck({"in_file": self.text_file}, "two", ifc_instance)
+        indexes.activate(ModelIndex(IfcModelMock(ifc_instance)))
+        try:
+            allowed_values = first_check.get_allowed_values()
+            with mock.patch("os.path.isfile") as isfile, mock.patch("builtins.open") as open_file:
+                self.assertIs(allowed_values, second_check.get_allowed_values())
+            isfile.assert_not_called()
+            open_file.assert_not_called()
+        finally:
+            indexes.activate(None)
+        self.assertIsNot(allowed_values, first_check.get_allowed_values())
+        self.assertIn("three", first_check.get_allowed_values())
+
+    def test_resolve_allowed_values_files(self):
+        """Tests ``resolve_allowed_values_files`` on the paths of the rules file.
+
+        Test-Purpose:
+            Tests that the paths of the allowed values files are relative to the rules file
+
+        Under Test:
+            * ``resolve_allowed_values_files``
+
+        Given:
+            * rules definition: a relative path in a not check and an absolute path
+            * rules directory: a directory of rules files
+
+        Expected:
+            The relative path joined to the rules directory, the absolute path
+            and the other definitions unchanged"""
+        rules_definition = [{"rule": {"classes": ["IfcWall"], "constraints": [
+            {"path": [{"attribute": "Name"}], "check": {"not": {"in_file": "codes.csv"}}},
+            {"path": [{"attribute": "Tag"}], "check": {"in_file": self.text_file}}]}}]
+        resolved = resolve_allowed_values_files(rules_definition, "rulesfiles")
+        constraints = resolved[0]["rule"]["constraints"]
+        self.assertEqual(os.path.join("rulesfiles", "codes.csv"),
+                         constraints[0]["check"]["not"]["in_file"])
+        self.assertEqual(self.text_file, constraints[1]["check"]["in_file"])
+        self.assertEqual(["IfcWall"], resolved[0]["rule"]["classes"])
+        self.assertEqual(rules_definition[0]["rule"]["constraints"][0]["path"],
+                         constraints[0]["path"])
+
+    def test_in_file_yaml_keys(self):
+        """Tests ``InFileCheck`` on the correct yaml keys
+
+        Test-Purpose:
+            Tests that the yaml keys of ``InFileCheck`` won't change
+
+        Under Test:
+            * ``InFileCheck.yaml_keys``
+
+        Given:
+            * ``InFileCheck``
+
+        Expected:
+            The `yaml_keys` of ``InFileCheck`` is 'in_file'"""
+        self.assertEqual(("in_file",), InFileCheck.get_yaml_keys())
+
+    def test_in_file_get_constraint_check(self):
+        """Tests ``config.get_constraint_check`` on getting the constraint check correctly.
+
+        Test-Purpose:
+            Tests that the constraint check definition results in ``InFileCheck``
+
+        Under Test:
+            * ``config.get_constraint_check``
+
+        Given:
+            * `ifc_instance`: Object of ``IfcInstanceMock``
+            * dict of in file constraint check
+
+        Expected:
+            An instance of ``InFileCheck``
+
+        Comment:
+            Usage of ``IfcInstanceMock`` to represent an ifc instance"""
+        ifc_instance = IfcInstanceMock(
+            Name="IfcMock",
+            GlobalId="IfcMockId",
+            ifc_type="MockType"
+        )
+        check = config.get_constraint_check(
+            {"in_file": self.text_file}, "three", ifc_instance)
+        self.assertIsInstance(check, InFileCheck)
@@ -1,11 +1,14 @@
 """In Check Unit Test Suite"""
 from ifc_data_checker import config
+from ifc_data_checker import indexes
 from ifc_data_checker.constraint_checks import InCheck
+from ifc_data_checker.indexes import ModelIndex
 from ifc_data_checker.validation import ValidationInformation
 from ifc_data_checker.validation import ValidationResult
 
 from tests.constraint_checks.constraint_check_test import TestConstraintCheck
 from tests.helpers import IfcInstanceMock
+from tests.helpers import IfcModelMock
 
 
 class TestInCheck(TestConstraintCheck.TestParameterValidation):
@@ -89,6 +92,70 @@ class TestInCheck(TestConstraintCheck.TestParameterValidation):
         check = InCheck(check_definition, path_result, ifc_instance)
         self.assertEqual(expected_result, check.validate())
 
+    def test_in_valid_unhashable(self):
+        """Tests ``InCheck`` on valid validation results. Unhashable allowed values
+
+        Test-Purpose:
+            Tests that unhashable allowed values are compared without a set
+
+        Under Test:
+            * ``InCheck.validate``
+            * implicit: ``AllowedValues``
+
+        Given:
+            * `ifc_instance`: IFC Mock Instance
+            * `path_result`: The list ``["one", "two"]``
+            * `constraint_check`: The in constraint with lists as allowed values
+
+        Expected:
+            validation information with ``ValidationResult.VALID``
+
+        Comment:
+            Usage of ``IfcInstanceMock`` to represent an ifc instance"""
+        ifc_instance = IfcInstanceMock(
+            Name="IfcMock",
+            GlobalId="IfcMockId",
+            ifc_type="MockType"
+        )
+        path_result = ["one", "two"]
+        expected_result = ValidationInformation()
+        expected_result.message = str(path_result) + " is allowed"
+        expected_result.validation_result = ValidationResult.VALID
+        check_definition = {"in": [["one"], ["one", "two"]]}
+        check = InCheck(check_definition, path_result, ifc_instance)
+        self.assertEqual(expected_result, check.validate())
+
+    def test_in_allowed_values_per_validation(self):
+        """Tests ``InCheck.get_allowed_values`` with and without a model index.
+
+        Test-Purpose:
+            Tests that the allowed values are compiled once per validation
+            for equal definitions and are not kept beyond the validation
+
+        Under Test:
+            * ``InCheck.get_allowed_values``
+            * ``ModelIndex.allowed_values``
+
+        Given:
+            * `constraint_check`: two in constraints of equal allowed values
+            * an active model index, then no model index
+
+        Expected:
+            The same compiled allowed values for both checks of the model index,
+            newly compiled allowed values without a model index"""
+        ifc_instance = IfcInstanceMock(Name="IfcMock", GlobalId="IfcMockId", ifc_type="MockType")
+        first_check = InCheck({"in": ["one", "two"]}, "one", ifc_instance)
+        second_check = InCheck({"in": ["one", "two"]}, "two", ifc_instance)
+        indexes.activate(ModelIndex(IfcModelMock(ifc_instance)))
+        try:
+            allowed_values = first_check.get_allowed_values()
+            self.assertIs(allowed_values, second_check.get_allowed_values())
+            self.assertEqual("['one', 'two']", allowed_values.description)
+        finally:
+            indexes.activate(None)
+        self.assertIsNot(allowed_values, first_check.get_allowed_values())
+        self.assertIsNot(first_check.get_allowed_values(), first_check.get_allowed_values())
+
     def test_in_error_str(self):
         """Tests ``InCheck`` on error validation results. Type ``str``
 
@@ -1,10 +1,30 @@
 """Constraint Unit Test Suite"""
 import unittest
+from unittest import mock
 
+from ifc_data_checker.backends import IfcOpenShellBackend
 from ifc_data_checker.constraints import Constraint
+from ifc_data_checker.indexes import ModelIndex
 from ifc_data_checker.validation import ValidationInformation
+from ifc_data_checker.validation import ValidationResult
+from ifc_data_checker import backends
+from ifc_data_checker import indexes
 
 from tests.helpers import IfcInstanceMock
+from tests.helpers import IfcModelMock
+
+
+class CountingBackend(IfcOpenShellBackend):
+    """Model backend counting the accesses of the attributes by name"""
+
+    def __init__(self):
+        """Constructor"""
+        self.accesses = {}
+
+    def get_attribute(self, ifc_instance, attribute_name):
+        """Counts the access of the attribute"""
+        self.accesses[attribute_name] = self.accesses.get(attribute_name, 0) + 1
+        return super().get_attribute(ifc_instance, attribute_name)
 
 
 class TestConstraint(unittest.TestCase):
@@ -313,3 +333,97 @@ class TestConstraint(unittest.TestCase):
         constraint = Constraint(constraint_definition, ifc_instance)
         constraint.validate()
         self.assertEqual(expected_constraint, constraint)
+
+    def test_constraint_shared_path_results(self):
+        """Tests ``Constraint.validate`` on paths passing a shared type object.
+
+        Test-Purpose:
+            Tests that the rest of a path from a shared type object is applied
+            once per type object, not once per ifc instance.
+
+        Under Test:
+            * ``Constraint.validate``
+            * implicit: ``ModelIndex.shared_path_results``
+
+        Given:
+            * ifc_instances: five walls sharing two type objects
+            * constraint_definition: path over the type object to its `PredefinedType`
+
+        Expected:
+            The `PredefinedType` is accessed once per type object
+            and each wall gets the result of its type object"""
+        type_objects = [IfcInstanceMock(ifc_id=i, ifc_type="IfcTypeObject", PredefinedType=value)
+                        for i, value in ((10, "SOLIDWALL"), (11, "NOTDEFINED"))]
+        walls = [IfcInstanceMock(ifc_id=i, ifc_type="IfcWall", Type=type_objects[i % 2])
+                 for i in range(1, 6)]
+        constraint_definition = {
+            "path": [{"attribute": "Type"}, {"attribute": "PredefinedType"}],
+            "check": {"equals": "SOLIDWALL"}
+        }
+        backend = CountingBackend()
+        backends.activate(backend)
+        indexes.activate(ModelIndex(IfcModelMock(*walls, *type_objects)))
+        try:
+            results = []
+            for wall in walls:
+                constraint = Constraint(constraint_definition, wall)
+                constraint.validate()
+                results.append(constraint.validation_information.validation_result)
+        finally:
+            indexes.activate(None)
+            backends.activate(None)
+        self.assertEqual(2, backend.accesses["PredefinedType"])
+        self.assertEqual(5, backend.accesses["Type"])
+        self.assertEqual([ValidationResult.FAILED, ValidationResult.VALID] * 2 +
+                         [ValidationResult.FAILED], results)
+
+    def test_constraint_check_results(self):
+        """Tests ``Constraint.validate`` on checks of a shared path result.
+
+        Test-Purpose:
+            Tests that the same check on the same instance shared by many instances
+            is validated once, within the bounded memo of the model index.
+
+        Under Test:
+            * ``Constraint.validate``
+            * implicit: ``ModelIndex.check_result``
+
+        Given:
+            * ifc_instances: four walls, three sharing one property set
+            * constraint_definition: path to the property set, checking its attribute `Name`
+
+        Expected:
+            The check is validated once per property set and every wall
+            gets an own copy of the validation information.
+            With a memo of one validation information, the property sets
+            validated alternately are validated each time."""
+        property_sets = [IfcInstanceMock(ifc_id=i, ifc_type="IfcPropertySet", Name=name)
+                         for i, name in ((10, "Pset_WallCommon"), (11, "Other"))]
+        walls = [IfcInstanceMock(ifc_id=i, ifc_type="IfcWall", Pset=property_sets[i // 4])
+                 for i in range(1, 5)]
+        constraint_definition = {"path": [{"attribute": "Pset"}], "check": {"exists": "Name"}}
+
+        def validate_walls(ifc_instances):
+            validation_informations = []
+            for wall in ifc_instances:
+                constraint = Constraint(constraint_definition, wall)
+                constraint.validate()
+                validation_informations.append(constraint.validation_information)
+            return validation_informations
+
+        indexes.activate(ModelIndex(IfcModelMock(*walls, *property_sets)))
+        try:
+            with mock.patch.object(Constraint, "_validate_check", autospec=True,
+                                   side_effect=Constraint._validate_check) as validate_check:
+                validation_informations = validate_walls(walls)
+                self.assertEqual(2, validate_check.call_count)
+                with mock.patch.object(indexes, "CHECK_RESULTS_SIZE", 1):
+                    indexes.activate(ModelIndex(IfcModelMock(*walls, *property_sets)))
+                    validate_walls(walls + walls)
+                self.assertEqual(2 + 4, validate_check.call_count)
+        finally:
+            indexes.activate(None)
+        self.assertEqual([ValidationResult.VALID] * 4,
+                         [validation_information.validation_result
+                          for validation_information in validation_informations])
+        self.assertIsNot(validation_informations[0], validation_informations[1])
@@ -0,0 +1,95 @@
+"""Intern Definition Unit Test Suite"""
+import copy
+import unittest
+
+from ifc_data_checker.definitions import FrozenDict
+from ifc_data_checker.definitions import FrozenList
+from ifc_data_checker.definitions import intern_definition
+
+
+class TestInternDefinition(unittest.TestCase):
+    """Test Intern Definition"""
+
+    rules_definition = [
+        {"rule": {"classes": ["IfcWindow"], "constraints": [
+            {"path": [{"attribute": "Name"}], "check": {"in": ["A", "B"]}},
+            {"path": [{"attribute": "Tag"}], "check": {"equals": 1}}]}},
+        {"rule": {"classes": ["IfcDoor"], "constraints": [
+            {"path": [{"attribute": "Name"}], "check": {"in": ["A", "B"]}},
+            {"path": [{"attribute": "Tag"}], "check": {"equals": True}}]}}
+    ]
+
+    def test_intern_definition(self):
+        """Tests ``intern_definition`` on sharing equal nodes.
+
+        Test-Purpose:
+            Tests that equal constraint definitions of different rules
+            are interned into the same hashable node.
+
+        Under Test:
+            * ``intern_definition``
+
+        Given:
+            * rules_definition: two rules with an equal constraint
+
+        Expected:
+            The equal constraints are the same node, equal to the definition"""
+        interned = intern_definition(self.rules_definition)
+        self.assertEqual(self.rules_definition, interned)
+        self.assertIsInstance(interned, FrozenList)
+        self.assertIsInstance(interned[0], FrozenDict)
+        constraints = [rule["rule"]["constraints"] for rule in interned]
+        self.assertIs(constraints[0][0], constraints[1][0])
+        self.assertEqual(hash(constraints[0][0]), hash(copy.deepcopy(constraints[0][0])))
+        self.assertEqual(str(self.rules_definition), str(interned))
+
+    def test_intern_value_types(self):
+        """Tests ``intern_definition`` on equal values of different types.
+
+        Test-Purpose:
+            Tests that values equal but of different types keep their own nodes,
+            like ``1`` and ``True``.
+
+        Under Test:
+            * ``intern_definition``
+
+        Given:
+            * rules_definition: two rules with the checks `equals: 1` and `equals: True`
+
+        Expected:
+            The checks are different nodes, keeping the types of their values"""
+        interned = intern_definition(self.rules_definition)
+        checks = [rule["rule"]["constraints"][1]["check"] for rule in interned]
+        self.assertIsNot(checks[0], checks[1])
+        self.assertIs(int, type(checks[0]["equals"]))
+        self.assertIs(bool, type(checks[1]["equals"]))
+
+    def test_immutable(self):
+        """Tests ``FrozenDict`` and ``FrozenList`` on changing them.
+
+        Test-Purpose:
+            Tests that the interned nodes can not be changed,
+            as they are shared and used as keys.
+
+        Under Test:
+            * ``FrozenDict``
+            * ``FrozenList``
+
+        Given:
+            * interned rules definition
+
+        Expected:
+            TypeError is raised"""
+        interned = intern_definition(self.rules_definition)
+        with self.assertRaises(TypeError):
+            interned[0]["rule"] = None
+        with self.assertRaises(TypeError):
+            interned[0].update({"rule": None})
+        with self.assertRaises(TypeError):
+            interned.append(None)
+        with self.assertRaises(TypeError):
+            interned[0]["rule"]["classes"][0] = "IfcWall"
+
+
+if __name__ == '__main__':
+    unittest.main()
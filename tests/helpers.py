@@ -27,3 +27,23 @@ class IfcInstanceMock(MicroMock):
         if comparing_type is None:
             return self.__dict__["ifc_type"]
         return self.__dict__["ifc_type"] == comparing_type
+
+    def id(self):
+        """Gets the id of the IFC mock
+
+        Use `**kwargs` of constructor like `ifc_id=42`"""
+        # pylint: disable=invalid-name
+        return self.__dict__["ifc_id"]
+
+
+class IfcModelMock:
+    """IFC Model Micro Mock
+
+    Holds the given ifc instances and selects them by their type"""
+
+    def __init__(self, *ifc_instances):
+        self.ifc_instances = list(ifc_instances)
+
+    def by_type(self, ifc_class):
+        """Gets the ifc instances of the given type"""
+        return [i for i in self.ifc_instances if i.is_a(ifc_class)]
@@ -0,0 +1,127 @@
+"""Attribute Instance Filter Unit Test Suite"""
+from ifc_data_checker.indexes import ModelIndex
+from ifc_data_checker.instance_filters import AttributeInstanceFilter
+from ifc_data_checker import config
+
+from tests.instance_filters.instance_filter_test import TestInstanceFilter
+from tests.helpers import IfcInstanceMock
+from tests.helpers import IfcModelMock
+
+
+class TestAttributeInstanceFilter(TestInstanceFilter.TestParameterValidation):
+    """Test Attribute Instance Filter"""
+
+    instance_filter_class = AttributeInstanceFilter
+    default_instance_filter = {"attribute": "PredefinedType", "value": "SOLIDWALL"}
+
+    def test_attribute_matching_ids(self):
+        """Tests ``AttributeInstanceFilter`` on selecting the instances correctly.
+
+        Test-Purpose:
+            Tests that only the instances with the attribute value get selected.
+
+        Under Test:
+            * ``AttributeInstanceFilter.matching_ids``
+            * implicit: ``ModelIndex.attribute_index``
+
+        Given:
+            * ifc_model: Mock model with walls of different predefined types
+              and a window with the same predefined type
+            * instance_filter: The attribute instance filter on `PredefinedType`
+
+        Expected:
+            The ids of the walls with the filtered predefined type only
+
+        Comment:
+            Usage of ``IfcModelMock`` to represent an ifc model"""
+        ifc_model = IfcModelMock(
+            IfcInstanceMock(ifc_id=1, ifc_type="IfcWall", PredefinedType="SOLIDWALL"),
+            IfcInstanceMock(ifc_id=2, ifc_type="IfcWall", PredefinedType="PARTITIONING"),
+            IfcInstanceMock(ifc_id=3, ifc_type="IfcWall", PredefinedType="SOLIDWALL"),
+            IfcInstanceMock(ifc_id=4, ifc_type="IfcWindow", PredefinedType="SOLIDWALL"))
+        instance_filter = AttributeInstanceFilter(
+            {"attribute": "PredefinedType", "value": "SOLIDWALL"}, ModelIndex(ifc_model))
+        self.assertEqual({1, 3}, instance_filter.matching_ids(["IfcWall"]))
+
+    def test_attribute_missing_attribute(self):
+        """Tests ``AttributeInstanceFilter`` on instances without the attribute.
+
+        Test-Purpose:
+            Tests that instances without the attribute are not selected.
+
+        Under Test:
+            * ``AttributeInstanceFilter.matching_ids``
+            * implicit: ``ModelIndex.attribute_index``
+
+        Given:
+            * ifc_model: Mock model with one wall without the attribute
+            * instance_filter: The attribute instance filter on `PredefinedType`
+
+        Expected:
+            An empty set of ids
+
+        Comment:
+            Usage of ``IfcModelMock`` to represent an ifc model"""
+        ifc_model = IfcModelMock(IfcInstanceMock(ifc_id=1, ifc_type="IfcWall"))
+        instance_filter = AttributeInstanceFilter(
+            {"attribute": "PredefinedType", "value": "SOLIDWALL"}, ModelIndex(ifc_model))
+        self.assertEqual(set(), instance_filter.matching_ids(["IfcWall"]))
+
+    def test_attribute_falsy_value(self):
+        """Tests ``AttributeInstanceFilter`` on filtering a falsy value.
+
+        Test-Purpose:
+            Tests that the value ``False`` is a valid filter value.
+
+        Under Test:
+            * ``AttributeInstanceFilter.matching_ids``
+
+        Given:
+            * ifc_model: Mock model with an external and an internal wall
+            * instance_filter: The attribute instance filter on `IsExternal` with ``False``
+
+        Expected:
+            The id of the internal wall
+
+        Comment:
+            Usage of ``IfcModelMock`` to represent an ifc model"""
+        ifc_model = IfcModelMock(
+            IfcInstanceMock(ifc_id=1, ifc_type="IfcWall", IsExternal=True),
+            IfcInstanceMock(ifc_id=2, ifc_type="IfcWall", IsExternal=False))
+        instance_filter = AttributeInstanceFilter(
+            {"attribute": "IsExternal", "value": False}, ModelIndex(ifc_model))
+        self.assertEqual({2}, instance_filter.matching_ids(["IfcWall"]))
+
+    def test_attribute_yaml_keys(self):
+        """Tests ``AttributeInstanceFilter`` on the correct yaml keys
+
+        Test-Purpose:
+            Tests that the yaml keys of ``AttributeInstanceFilter`` won't change
+
+        Under Test:
+            * ``AttributeInstanceFilter.yaml_keys``
+
+        Given:
+            * ``AttributeInstanceFilter``
+
+        Expected:
+            The `yaml_keys` of ``AttributeInstanceFilter`` are 'attribute' and 'value'"""
+        self.assertEqual(("attribute", "value"), AttributeInstanceFilter.get_yaml_keys())
+
+    def test_attribute_get_instance_filter(self):
+        """Tests ``config.get_instance_filter`` on getting the instance filter correctly.
+
+        Test-Purpose:
+            Tests that the instance filter definition results in ``AttributeInstanceFilter``
+
+        Under Test:
+            * ``config.get_instance_filter``
+
+        Given:
+            * definition: dict of an attribute instance filter
+
+        Expected:
+            An instance of ``AttributeInstanceFilter``"""
+        instance_filter = config.get_instance_filter(
+            {"attribute": "Name", "value": "Wall"}, self.model_index)
+        self.assertIsInstance(instance_filter, AttributeInstanceFilter)
@@ -0,0 +1,125 @@
+"""Containment Instance Filter Unit Test Suite"""
+from ifc_data_checker.indexes import ModelIndex
+from ifc_data_checker.instance_filters import ContainmentInstanceFilter
+from ifc_data_checker import config
+
+from tests.instance_filters.instance_filter_test import TestInstanceFilter
+from tests.helpers import IfcInstanceMock
+from tests.helpers import IfcModelMock
+
+
+class TestContainmentInstanceFilter(TestInstanceFilter.TestParameterValidation):
+    """Test Containment Instance Filter"""
+
+    instance_filter_class = ContainmentInstanceFilter
+    default_instance_filter = {"contained_in": "EG"}
+
+    def test_containment_matching_ids(self):
+        """Tests ``ContainmentInstanceFilter`` on selecting the instances correctly.
+
+        Test-Purpose:
+            Tests that only the elements contained in the named storey get selected.
+
+        Under Test:
+            * ``ContainmentInstanceFilter.matching_ids``
+            * implicit: ``ModelIndex.containment_index``
+
+        Given:
+            * ifc_model: Mock model with two storeys each containing elements
+            * instance_filter: The containment instance filter on storey `EG`
+
+        Expected:
+            The ids of the elements contained in the storey `EG`
+
+        Comment:
+            Usage of ``IfcModelMock`` to represent an ifc model"""
+        ground_floor = IfcInstanceMock(ifc_id=10, ifc_type="IfcBuildingStorey", Name="EG")
+        first_floor = IfcInstanceMock(ifc_id=11, ifc_type="IfcBuildingStorey", Name="OG")
+        walls = [IfcInstanceMock(ifc_id=i, ifc_type="IfcWall") for i in range(1, 5)]
+        ifc_model = IfcModelMock(
+            IfcInstanceMock(ifc_id=20, ifc_type="IfcRelContainedInSpatialStructure",
+                            RelatingStructure=ground_floor, RelatedElements=walls[:3]),
+            IfcInstanceMock(ifc_id=21, ifc_type="IfcRelContainedInSpatialStructure",
+                            RelatingStructure=first_floor, RelatedElements=walls[3:]))
+        instance_filter = ContainmentInstanceFilter(
+            {"contained_in": "EG"}, ModelIndex(ifc_model))
+        self.assertEqual({1, 2, 3}, instance_filter.matching_ids(["IfcWall"]))
+
+    def test_containment_spatial_decomposition(self):
+        """Tests ``ContainmentInstanceFilter`` on following the spatial decomposition.
+
+        Test-Purpose:
+            Tests that the elements contained in a spatial structure element decomposing
+            the named spatial structure element get selected as well.
+
+        Under Test:
+            * ``ContainmentInstanceFilter.matching_ids``
+            * implicit: ``ModelIndex.containment_index``
+
+        Given:
+            * ifc_model: Mock model of a building aggregating two storeys,
+              the storey `EG` aggregating a space, each containing elements
+            * instance_filter: The containment instance filters on the space, the storey `EG`,
+              the building and a missing spatial structure element
+
+        Expected:
+            The ids of the elements contained in the space, in the storey `EG`
+            and its space, in the whole building, no ids for the missing name
+
+        Comment:
+            Usage of ``IfcModelMock`` to represent an ifc model"""
+        building = IfcInstanceMock(ifc_id=9, ifc_type="IfcBuilding", Name="Haus")
+        ground_floor = IfcInstanceMock(ifc_id=10, ifc_type="IfcBuildingStorey", Name="EG")
+        first_floor = IfcInstanceMock(ifc_id=11, ifc_type="IfcBuildingStorey", Name="OG")
+        space = IfcInstanceMock(ifc_id=12, ifc_type="IfcSpace", Name="Kueche")
+        walls = [IfcInstanceMock(ifc_id=i, ifc_type="IfcWall") for i in range(1, 5)]
+        ifc_model = IfcModelMock(
+            IfcInstanceMock(ifc_id=20, ifc_type="IfcRelContainedInSpatialStructure",
+                            RelatingStructure=ground_floor, RelatedElements=walls[:2]),
+            IfcInstanceMock(ifc_id=21, ifc_type="IfcRelContainedInSpatialStructure",
+                            RelatingStructure=space, RelatedElements=walls[2:3]),
+            IfcInstanceMock(ifc_id=22, ifc_type="IfcRelContainedInSpatialStructure",
+                            RelatingStructure=first_floor, RelatedElements=walls[3:]),
+            IfcInstanceMock(ifc_id=30, ifc_type="IfcRelAggregates",
+                            RelatingObject=building, RelatedObjects=[ground_floor, first_floor]),
+            IfcInstanceMock(ifc_id=31, ifc_type="IfcRelAggregates",
+                            RelatingObject=ground_floor, RelatedObjects=[space]))
+        model_index = ModelIndex(ifc_model)
+        for name, expected_ids in (("Kueche", {3}), ("EG", {1, 2, 3}), ("Haus", {1, 2, 3, 4}),
+                                   ("DG", set())):
+            instance_filter = ContainmentInstanceFilter({"contained_in": name}, model_index)
+            self.assertEqual(expected_ids, instance_filter.matching_ids(["IfcWall"]))
+
+    def test_containment_yaml_keys(self):
+        """Tests ``ContainmentInstanceFilter`` on the correct yaml keys
+
+        Test-Purpose:
+            Tests that the yaml keys of ``ContainmentInstanceFilter`` won't change
+
+        Under Test:
+            * ``ContainmentInstanceFilter.yaml_keys``
+
+        Given:
+            * ``ContainmentInstanceFilter``
+
+        Expected:
+            The `yaml_keys` of ``ContainmentInstanceFilter`` is 'contained_in'"""
+        self.assertEqual(("contained_in",), ContainmentInstanceFilter.get_yaml_keys())
+
+    def test_containment_get_instance_filter(self):
+        """Tests ``config.get_instance_filter`` on getting the instance filter correctly.
+
+        Test-Purpose:
+            Tests that the instance filter definition results in ``ContainmentInstanceFilter``
+
+        Under Test:
+            * ``config.get_instance_filter``
+
+        Given:
+            * definition: dict of a containment instance filter
+
+        Expected:
+            An instance of ``ContainmentInstanceFilter``"""
+        instance_filter = config.get_instance_filter(
+            {"contained_in": "EG"}, self.model_index)
+        self.assertIsInstance(instance_filter, ContainmentInstanceFilter)
@@ -0,0 +1,92 @@
+"""Instance Filter Unit Test Suite"""
+import unittest
+
+from ifc_data_checker.indexes import ModelIndex
+
+from tests.helpers import IfcModelMock
+
+
+class TestInstanceFilter:
+    """Test Instance Filter"""
+    # pylint: disable=too-few-public-methods
+
+    class TestParameterValidation(unittest.TestCase):
+        """Test instance filter parameter validation"""
+
+        instance_filter_class = None
+        default_instance_filter = None
+        model_index = ModelIndex(IfcModelMock())
+
+        def check_parameter(self):
+            """Checks that all the base class parameters are set.
+
+            `instance_filter_class`, `default_instance_filter`
+            need to be set by sub class. If not, the test case will fail
+
+            `model_index` is set by default, can be overridden"""
+            if self.instance_filter_class is None:
+                self.fail("Incorrect usage of `TestParameterValidation`." +
+                          "`instance_filter_class` need to be set by sub class.")
+            if self.default_instance_filter is None:
+                self.fail("Incorrect usage of `TestParameterValidation`." +
+                          "`default_instance_filter` need to be set by sub class.")
+            if self.model_index is None:
+                self.fail("Incorrect usage of `TestParameterValidation`." +
+                          "`model_index` need to be set by sub class.")
+
+        def test_none_instance_filter(self):
+            """Tests the instance filter on correct parameter validation of `definition`
+
+            Test-Purpose:
+                parameter input validation
+
+            Under Test:
+                * ``self.instance_filter_class``
+
+            Given:
+                * definition: ``None``
+                * model_index: The model index on an empty mock model
+
+            Expected:
+                Raises ``ValueError`` because of `definition` parameter is ``None``"""
+            self.check_parameter()
+            self.assertRaises(ValueError, self.instance_filter_class,
+                              None, self.model_index)
+
+        def test_invalid_instance_filter(self):
+            """Tests the instance filter on correct parameter validation of `definition`
+
+            Test-Purpose:
+                parameter input validation
+
+            Under Test:
+                * ``self.instance_filter_class``
+
+            Given:
+                * definition: list instead of dict
+                * model_index: The model index on an empty mock model
+
+            Expected:
+                Raises ``ValueError`` because of `definition` parameter is not a dict"""
+            self.check_parameter()
+            self.assertRaises(ValueError, self.instance_filter_class,
+                              [self.default_instance_filter], self.model_index)
+
+        def test_none_model_index(self):
+            """Tests the instance filter on correct parameter validation of `model_index`
+
+            Test-Purpose:
+                parameter input validation
+
+            Under Test:
+                * ``self.instance_filter_class``
+
+            Given:
+                * definition: using default_instance_filter from subclass
+                * model_index: ``None``
+
+            Expected:
+                Raises ``ValueError`` because of `model_index` parameter is ``None``"""
+            self.check_parameter()
+            self.assertRaises(ValueError, self.instance_filter_class,
+                              self.default_instance_filter, None)
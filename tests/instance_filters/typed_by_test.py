@@ -0,0 +1,80 @@
+"""Type Instance Filter Unit Test Suite"""
+from ifc_data_checker.indexes import ModelIndex
+from ifc_data_checker.instance_filters import TypeInstanceFilter
+from ifc_data_checker import config
+
+from tests.instance_filters.instance_filter_test import TestInstanceFilter
+from tests.helpers import IfcInstanceMock
+from tests.helpers import IfcModelMock
+
+
+class TestTypeInstanceFilter(TestInstanceFilter.TestParameterValidation):
+    """Test Type Instance Filter"""
+
+    instance_filter_class = TypeInstanceFilter
+    default_instance_filter = {"typed_by": "Basic Wall"}
+
+    def test_typed_by_matching_ids(self):
+        """Tests ``TypeInstanceFilter`` on selecting the instances correctly.
+
+        Test-Purpose:
+            Tests that only the occurrences typed by the named type object get selected.
+
+        Under Test:
+            * ``TypeInstanceFilter.matching_ids``
+            * implicit: ``ModelIndex.type_index``
+
+        Given:
+            * ifc_model: Mock model with two wall types each typing walls
+            * instance_filter: The type instance filter on the wall type `Basic Wall`
+
+        Expected:
+            The ids of the walls typed by `Basic Wall`
+
+        Comment:
+            Usage of ``IfcModelMock`` to represent an ifc model"""
+        basic_wall = IfcInstanceMock(ifc_id=10, ifc_type="IfcWallType", Name="Basic Wall")
+        curtain_wall = IfcInstanceMock(ifc_id=11, ifc_type="IfcWallType", Name="Curtain Wall")
+        walls = [IfcInstanceMock(ifc_id=i, ifc_type="IfcWall") for i in range(1, 5)]
+        ifc_model = IfcModelMock(
+            IfcInstanceMock(ifc_id=20, ifc_type="IfcRelDefinesByType",
+                            RelatingType=basic_wall, RelatedObjects=walls[1:]),
+            IfcInstanceMock(ifc_id=21, ifc_type="IfcRelDefinesByType",
+                            RelatingType=curtain_wall, RelatedObjects=walls[:1]))
+        instance_filter = TypeInstanceFilter(
+            {"typed_by": "Basic Wall"}, ModelIndex(ifc_model))
+        self.assertEqual({2, 3, 4}, instance_filter.matching_ids(["IfcWall"]))
+
+    def test_typed_by_yaml_keys(self):
+        """Tests ``TypeInstanceFilter`` on the correct yaml keys
+
+        Test-Purpose:
+            Tests that the yaml keys of ``TypeInstanceFilter`` won't change
+
+        Under Test:
+            * ``TypeInstanceFilter.yaml_keys``
+
+        Given:
+            * ``TypeInstanceFilter``
+
+        Expected:
+            The `yaml_keys` of ``TypeInstanceFilter`` is 'typed_by'"""
+        self.assertEqual(("typed_by",), TypeInstanceFilter.get_yaml_keys())
+
+    def test_typed_by_get_instance_filter(self):
+        """Tests ``config.get_instance_filter`` on getting the instance filter correctly.
+
+        Test-Purpose:
+            Tests that the instance filter definition results in ``TypeInstanceFilter``
+
+        Under Test:
+            * ``config.get_instance_filter``
+
+        Given:
+            * definition: dict of a type instance filter
+
+        Expected:
+            An instance of ``TypeInstanceFilter``"""
+        instance_filter = config.get_instance_filter(
+            {"typed_by": "Basic Wall"}, self.model_index)
+        self.assertIsInstance(instance_filter, TypeInstanceFilter)
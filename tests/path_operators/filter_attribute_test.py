@@ -1,9 +1,12 @@
 """Filter Attribute Unit Test Suite"""
 from ifc_data_checker.path_operators import AttributeFilterPathOperator
 from ifc_data_checker import config
+from ifc_data_checker import indexes
+from ifc_data_checker.indexes import ModelIndex
 
 from tests.path_operators.path_operator_test import TestPathOperator
 from tests.helpers import IfcInstanceMock
+from tests.helpers import IfcModelMock
 from tests.helpers import MicroMock
 
 
@@ -227,3 +230,38 @@ class TestFilterAttribute(TestPathOperator.TestParameterValidation):
         path_operator = {"attribute": "IsDefinedBy", "value": "MockWindow"}
         operator = config.get_path_operator(path_operator, [ifc_instance])
         self.assertIsInstance(operator, AttributeFilterPathOperator)
+
+    def test_filter_attribute_active_model_index(self):
+        """Tests ``AttributeFilterPathOperator`` on filtering with the active model index.
+
+        Test-Purpose:
+            Tests that the instances get filtered by the attribute index of the active
+            model index, and values without an id get compared directly.
+
+        Under Test:
+            * ``AttributeFilterPathOperator.apply``
+            * implicit: ``ModelIndex.filter_by_attribute``
+
+        Given:
+            * ifc_model: Mock model with two property sets of different names
+            * instances: The property sets and a value without an id in the model
+            * path_operator: the path operator filtering by `Name`
+
+        Expected:
+            The property set and the value with the filtered name
+
+        Comment:
+            * Usage of ``IfcModelMock`` to represent an ifc model
+            * Usage of ``MicroMock`` to represent a value without an id"""
+        property_set = IfcInstanceMock(ifc_id=1, ifc_type="IfcPropertySet", Name="Pset_Wall")
+        other_property_set = IfcInstanceMock(ifc_id=2, ifc_type="IfcPropertySet", Name="Other")
+        value = MicroMock(Name="Pset_Wall")
+        model_index = ModelIndex(IfcModelMock(property_set, other_property_set))
+        path_operator = {"attribute": "Name", "value": "Pset_Wall"}
+        operator = AttributeFilterPathOperator(
+            [property_set, other_property_set, value], path_operator)
+        indexes.activate(model_index)
+        try:
+            self.assertEqual([property_set, value], operator.apply())
+        finally:
+            indexes.activate(None)
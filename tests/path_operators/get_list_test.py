@@ -1,12 +1,27 @@
 """Get List Unit Test Suite"""
+from ifc_data_checker.backends import IfcOpenShellBackend
+from ifc_data_checker.indexes import ModelIndex
 from ifc_data_checker.path_operators import ListPathOperator
+from ifc_data_checker import backends
 from ifc_data_checker import config
+from ifc_data_checker import indexes
 
 from tests.path_operators.path_operator_test import TestPathOperator
 from tests.helpers import IfcInstanceMock
+from tests.helpers import IfcModelMock
 from tests.helpers import MicroMock
 
 
+class InverseBackend(IfcOpenShellBackend):
+    """Model backend with the inverse attribute `IsDefinedBy` of `IfcRelDefines.RelatedObjects`"""
+
+    def inverse_reference(self, ifc_model, ifc_class, attribute_name):
+        """Gets the references of `IsDefinedBy`"""
+        if attribute_name == "IsDefinedBy":
+            return ("IfcRelDefines", "RelatedObjects")
+        return None
+
+
 class TestGetList(TestPathOperator.TestParameterValidation):
     """Test Get List Path Operator"""
 
@@ -40,6 +55,42 @@ class TestGetList(TestPathOperator.TestParameterValidation):
         operator = ListPathOperator(instances, path_operator)
         self.assertEqual(expected_result, operator.apply())
 
+    def test_list_inverse_index(self):
+        """Tests ``ListPathOperator`` on inverse attributes with an active model index.
+
+        Test-Purpose:
+            Tests that the lists of inverse attributes are taken from the inverse index
+            built with one scan over the referencing instances.
+
+        Under Test:
+            * ``ListPathOperator.apply``
+            * implicit: ``ModelIndex.get_inverse``
+            * implicit: ``ModelIndex.inverse_index``
+
+        Given:
+            * ifc_model: Mock model with two relations, both relating the first wall
+            * instances: two walls without the attribute `IsDefinedBy`
+            * path_operator: The path operator defining the list `IsDefinedBy`
+
+        Expected:
+            The relations of the first wall in the order of the model,
+            none for the second wall
+
+        Comment:
+            The walls have no attribute `IsDefinedBy`, so it is resolved
+            by the inverse index only"""
+        walls = [IfcInstanceMock(ifc_id=i, ifc_type="IfcWall") for i in (1, 2)]
+        relations = [IfcInstanceMock(ifc_id=i, ifc_type="IfcRelDefines",
+                                     RelatedObjects=walls[:1]) for i in (10, 11)]
+        backends.activate(InverseBackend())
+        indexes.activate(ModelIndex(IfcModelMock(*walls, *relations)))
+        try:
+            path_result = ListPathOperator(walls, {"list": "IsDefinedBy"}).apply()
+        finally:
+            indexes.activate(None)
+            backends.activate(None)
+        self.assertEqual(relations, path_result)
+
     def test_list_not_found(self):
         """Tests ``ListPathOperator`` on handling errors correctly.
 
@@ -0,0 +1,134 @@
+"""Validation Plan Unit Test Suite"""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from ifc_data_checker.backends import LazyStepBackend
+from ifc_data_checker.backends import ModelBackend
+from ifc_data_checker.definitions import intern_definition
+from ifc_data_checker.planner import ValidationPlan
+from ifc_data_checker.rules import iter_validate
+from ifc_data_checker.validation import ValidationOptions
+from ifc_data_checker.validation import ValidationResult
+from tests.step.lazy_step_model_test import STEP_FILE
+
+PROPERTY_SET = [{"list": "IsDefinedBy"}, {"attribute": "RelatingPropertyDefinition"}]
+
+
+class TestValidationPlan(unittest.TestCase):
+    """Test Validation Plan"""
+
+    rules_definition = [
+        {"rule": {"classes": ["IfcWall"], "constraints": [
+            {"path": PROPERTY_SET + [{"attribute": "Name"}],
+             "check": {"equals": "Pset_WallCommon"}}]}},
+        {"rule": {"classes": ["IfcDoor"], "constraints": [
+            {"path": [{"attribute": "Name"}], "check": {"equals": "Door"}}]}},
+        {"rule": {"classes": ["IfcWall"], "constraints": [
+            {"or": [
+                {"path": PROPERTY_SET + [{"list": "HasProperties"},
+                                         {"attribute": "Name", "value": "IsExternal"},
+                                         {"attribute": "NominalValue"},
+                                         {"attribute": "wrappedValue"}],
+                 "check": {"equals": True}},
+                {"path": [{"attribute": "Name"}], "check": {"equals": "Wall"}}]}]}},
+        {"rule": {"classes": ["IfcWall"], "where": [{"attribute": "Name", "equals": "Wall B"}],
+                  "constraints": [
+                      {"path": PROPERTY_SET + [{"attribute": "Name"}],
+                       "check": {"equals": "Pset_WallCommon"}}]}}
+    ]
+
+    def test_group_rules(self):
+        """Tests ``ValidationPlan`` on grouping the rules.
+
+        Test-Purpose:
+            Tests that the rules with the same ifc classes and where clause
+            are one group, in the order of the rules file.
+
+        Under Test:
+            * ``ValidationPlan.__init__``
+            * ``ValidationPlan.group``
+            * ``ValidationPlan.is_last``
+
+        Given:
+            * rules_definition: two rules on walls, a rule on doors
+              and a rule on walls with a where clause
+
+        Expected:
+            Three groups, the rules on walls without where clause are one group"""
+        plan = ValidationPlan(intern_definition(self.rules_definition))
+        self.assertEqual([[0, 2], [1], [3]], [group.positions for group in plan.groups])
+        self.assertIs(plan.group(0), plan.group(2))
+        self.assertEqual(["IfcWall"], plan.group(3).ifc_classes)
+        self.assertEqual([False, True, True, True], [plan.is_last(i) for i in range(4)])
+
+    def test_shared_prefixes(self):
+        """Tests ``ValidationPlan`` on the shared path prefixes.
+
+        Test-Purpose:
+            Tests that the longest path prefix used by more than one constraint
+            of a group is shared, including the constraints of constraint groups.
+
+        Under Test:
+            * ``ValidationPlan.__init__``
+
+        Given:
+            * rules_definition: two rules on walls with paths of the same property set,
+              one of them in an or group
+
+        Expected:
+            Both paths share the path prefix to the property set,
+            the path of one path operator and the paths of other groups share nothing"""
+        rules_definition = intern_definition(self.rules_definition)
+        plan = ValidationPlan(rules_definition)
+        group = plan.group(0)
+        first_path = rules_definition[0]["rule"]["constraints"][0]["path"]
+        second_path = rules_definition[2]["rule"]["constraints"][0]["or"][0]["path"]
+        self.assertEqual({id(first_path), id(second_path)}, set(group.shared_prefixes))
+        self.assertEqual(PROPERTY_SET, group.shared_prefixes[id(first_path)][1])
+        self.assertIs(group.shared_prefixes[id(first_path)][1],
+                      group.shared_prefixes[id(second_path)][1])
+        self.assertEqual({}, plan.group(1).shared_prefixes)
+        self.assertEqual({}, plan.group(3).shared_prefixes)
+
+    def test_validate_with_plan(self):
+        """Tests ``iter_validate`` on sharing the ifc instances and the path prefixes.
+
+        Test-Purpose:
+            Tests that the ifc instances of a group are selected once and the shared
+            path prefix is applied once per ifc instance for all the rules of the group.
+
+        Under Test:
+            * ``iter_validate``
+
+        Given:
+            * ifc file: a wall and a wall standard case of one property set
+            * rules_definition: two rules on walls sharing the path to the property set
+
+        Expected:
+            The rules are validated in the order of the rules file,
+            the walls are selected once and their property sets are traversed once"""
+        with tempfile.TemporaryDirectory() as directory:
+            ifc_file = os.path.join(directory, "test.ifc")
+            with open(ifc_file, "w", encoding="latin-1") as step_file:
+                step_file.write(STEP_FILE)
+            with mock.patch.object(LazyStepBackend, "by_type", autospec=True,
+                                   side_effect=ModelBackend.by_type) as by_type, \
+                    mock.patch.object(LazyStepBackend, "get_attribute", autospec=True,
+                                      side_effect=ModelBackend.get_attribute) as get_attribute:
+                rules = list(iter_validate(self.rules_definition[:3], ifc_file,
+                                           ValidationOptions(model_backend="lazy")))
+                ifc_classes = [call.args[2] for call in by_type.call_args_list]
+                inverse_attributes = [call.args[2] for call in get_attribute.call_args_list
+                                      if call.args[2] == "IsDefinedBy"]
+        self.assertEqual([["IfcWall"], ["IfcDoor"], ["IfcWall"]],
+                         [rule.get_classes() for rule in rules])
+        self.assertEqual([ValidationResult.VALID, ValidationResult.VALID, ValidationResult.VALID],
+                         [rule.validation_information.validation_result for rule in rules])
+        self.assertEqual(1, ifc_classes.count("IfcWall"))
+        self.assertEqual(len(rules[0].ifc_instances), len(inverse_attributes))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+"""JSON Report Unit Test Suite"""
+import json
+import unittest
+
+from ifc_data_checker import report
+from ifc_data_checker.rules import Rule
+from ifc_data_checker.validation import ReportLevel
+from ifc_data_checker.validation import ValidationOptions
+from tests.helpers import IfcInstanceMock
+
+
+class TestJsonReport(unittest.TestCase):
+    """Test JSON Report"""
+
+    rule_definition = {
+        "classes": ["IfcWall"],
+        "constraints": [
+            {"path": [{"attribute": "Name"}], "check": {"equals": "Wall"}},
+            {"and": [
+                {"path": [{"attribute": "Tag"}], "check": {"equals": "T"}},
+                {"path": [{"attribute": "Name"}], "check": {"equals": "Wall"}}]}
+        ]
+    }
+
+    ifc_instances = (
+        IfcInstanceMock(ifc_type="IfcWall", Name="Wall", GlobalId="1", Tag="T"),
+        IfcInstanceMock(ifc_type="IfcWall", Name="Door", GlobalId="2", Tag="T"),
+        IfcInstanceMock(ifc_type="IfcWall", Name="Door", GlobalId="3", Tag="X"))
+
+    def create_records(self, validation_options: ValidationOptions = None) -> list:
+        """Validates the rule twice and reads the records of the JSON lines report"""
+        validated_rules = []
+        for _ in range(2):
+            rule = Rule(self.rule_definition, self.ifc_instances, validation_options)
+            rule.validate()
+            validated_rules.append(rule)
+        chunks = list(report.create_json_report_chunks(
+            validated_rules, "rulesfiles/rules.yml", "ifcfiles/model.ifc"))
+        self.assertEqual(3, len(chunks))
+        return [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+
+    def test_records(self):
+        """Tests ``create_json_report_chunks`` with the full report level.
+
+        Test-Purpose:
+            Tests that the report record is followed by the records of each rule,
+            its instances and their constraints with the paths into the rules file.
+
+        Under Test:
+            * ``create_json_report_chunks``
+            * ``_create_records``
+            * ``_create_constraint_records``
+
+        Given:
+            * validated_rules: two rules on a valid and two failing walls,
+              with a constraint and an and group of two constraints
+
+        Expected:
+            A chunk of the report record and a chunk per rule,
+            the records of all instances and constraints"""
+        records = self.create_records()
+        self.assertEqual({"record": "report", "rules_file": "rules.yml",
+                          "ifc_file": "model.ifc"}, records[0])
+        self.assertEqual({
+            "record": "rule", "rule": 1, "path": "rules[1].rule", "classes": ["IfcWall"],
+            "result": "FAILED",
+            "message": "Rule: 1 of 3 instances of types ['IfcWall'] successfully validated."
+        }, records[17])
+        self.assertEqual(
+            [("rule", 0), ("instance", 0)] + [("constraint", 0)] * 4 + [("instance", 0)] +
+            [("constraint", 0)] * 4 + [("instance", 0)] + [("constraint", 0)] * 4,
+            [(record["record"], record["rule"]) for record in records[1:17]])
+        self.assertEqual({
+            "record": "instance", "rule": 0, "global_id": "2", "type": "IfcWall",
+            "name": "Door", "result": "FAILED",
+            "message": "IfcWall Door Global Id: 2: 0 of 2 constraints are valid."
+        }, records[7])
+        self.assertEqual(["rules[0].rule.constraints[0]", "rules[0].rule.constraints[1]",
+                          "rules[0].rule.constraints[1].and[0]",
+                          "rules[0].rule.constraints[1].and[1]"],
+                         [record["path"] for record in records[8:12]])
+        self.assertEqual({
+            "record": "constraint", "rule": 0, "global_id": "2", "type": "IfcWall",
+            "path": "rules[0].rule.constraints[1].and[0]", "result": "VALID",
+            "message": "T as expected"
+        }, records[10])
+
+    def test_truncated_records(self):
+        """Tests ``create_json_report_chunks`` with failures and a maximum count of failures.
+
+        Test-Purpose:
+            Tests that only the failing instances until the validation stopped are reported
+            and the rule record tells the not validated instances.
+
+        Under Test:
+            * ``create_json_report_chunks``
+
+        Given:
+            * validated_rules: two rules on a valid and two failing walls
+            * validation options: report failures, at most 1 failure per rule
+
+        Expected:
+            Per rule the rule record and the first failing wall with its constraints"""
+        records = self.create_records(ValidationOptions(
+            report_level=ReportLevel.FAILURES, max_failures_per_rule=1))
+        self.assertEqual(
+            [("rule", None), ("instance", "2")] + [("constraint", "2")] * 4,
+            [(record["record"], record.get("global_id")) for record in records[1:7]])
+        self.assertEqual(13, len(records))
+        self.assertEqual([1] * 6, [record["rule"] for record in records[7:13]])
+        self.assertEqual("rules[1].rule.constraints[1].and[1]", records[12]["path"])
+        self.assertTrue(records[1]["message"].endswith(
+            "Validation stopped after 1 failed instances, 1 instances not validated."))
+        self.assertEqual("FAILED", records[2]["result"])
+
+    def test_failures_records_paths(self):
+        """Tests ``create_json_report_chunks`` with the failures report level.
+
+        Test-Purpose:
+            Tests that a failing constraint is reported with its path into the rules file,
+            although the passing constraints before it are dropped.
+
+        Under Test:
+            * ``create_json_report_chunks``
+            * ``Rule.validate``
+
+        Given:
+            * validated_rules: a rule on a wall passing the first constraint and
+              failing the and group of the second constraint
+            * validation options: report failures
+
+        Expected:
+            The records of the second constraint and its failing constraint"""
+        rule = Rule(self.rule_definition,
+                    (IfcInstanceMock(ifc_type="IfcWall", Name="Wall", GlobalId="4", Tag="X"),),
+                    ValidationOptions(report_level=ReportLevel.FAILURES))
+        rule.validate()
+        records = [json.loads(line) for chunk in report.create_json_report_chunks(
+            [rule], "rules.yml", "model.ifc") for line in chunk.splitlines()]
+        self.assertEqual(["rules[0].rule.constraints[1]",
+                          "rules[0].rule.constraints[1].and[0]",
+                          "rules[0].rule.constraints[1].and[1]"],
+                         [record["path"] for record in records
+                          if record["record"] == "constraint"])
+        self.assertEqual("FAILED", records[3]["result"])
+
+    def test_summary_records(self):
+        """Tests ``create_json_report_chunks`` with the summary report level.
+
+        Test-Purpose:
+            Tests that only the rule records are reported.
+
+        Under Test:
+            * ``create_json_report_chunks``
+
+        Given:
+            * validated_rules: two rules on a valid and two failing walls
+            * validation options: report the summary
+
+        Expected:
+            The report record and the two rule records"""
+        records = self.create_records(ValidationOptions(report_level=ReportLevel.SUMMARY))
+        self.assertEqual(["report", "rule", "rule"], [record["record"] for record in records])
+        self.assertEqual(["rules[0].rule", "rules[1].rule"],
+                         [record["path"] for record in records[1:]])
+
+
+if __name__ == '__main__':
+    unittest.main()
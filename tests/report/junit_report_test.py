@@ -0,0 +1,103 @@
+"""JUnit Report Unit Test Suite"""
+import io
+import unittest
+from unittest import mock
+
+from ifc_data_checker import report
+from ifc_data_checker.rules import Rule
+from ifc_data_checker.validation import ValidationInformation
+from tests.helpers import IfcInstanceMock
+
+
+class TestJUnitReport(unittest.TestCase):
+    """Test JUnit Report"""
+
+    @staticmethod
+    def create_validated_rule() -> Rule:
+        """Creates a validated rule with one valid and one failing ifc instance"""
+        rule_definition = {
+            "classes": ["IfcWall"],
+            "constraints": [{"path": [{"attribute": "Name"}], "check": {"equals": "Wall"}}]
+        }
+        ifc_instances = (
+            IfcInstanceMock(ifc_type="IfcWall", Name="Wall", GlobalId="1"),
+            IfcInstanceMock(ifc_type="IfcWall", Name="<Door>", GlobalId="2"))
+        rule = Rule(rule_definition, ifc_instances)
+        rule.validate()
+        return rule
+
+    def write_report(self, failing_instances: bool) -> str:
+        """Writes the JUnit report of the validated rule"""
+        junit_report = io.StringIO()
+        with mock.patch("sys.stdout", junit_report):
+            report.create_validation_report_junit_console(
+                [self.create_validated_rule()], "rules.yml", "model.ifc",
+                failing_instances=failing_instances)
+        return junit_report.getvalue()
+
+    def test_rule_testcase(self):
+        """Tests ``create_validation_report_junit_console`` with a testcase per rule.
+
+        Test-Purpose:
+            Tests that each rule is a testsuite with one testcase for the rule.
+
+        Under Test:
+            * ``create_validation_report_junit_console``
+
+        Given:
+            * validated_rules: a rule with one valid and one failing ifc instance
+            * failing_instances: False
+
+        Expected:
+            A testsuite with one failing testcase for the rule"""
+        junit_report = self.write_report(failing_instances=False)
+        self.assertTrue(junit_report.startswith('<?xml version="1.0" encoding="UTF-8"?>'))
+        self.assertIn('<testsuites name="validation report rules.yml model.ifc">', junit_report)
+        self.assertIn('<testsuite name="rules[0].rule" tests="1" failures="1" errors="0" '
+                      'skipped="0">', junit_report)
+        self.assertIn('<testcase name="IfcWall" classname="rules[0].rule">', junit_report)
+        self.assertEqual(1, junit_report.count("<failure "))
+        self.assertTrue(junit_report.endswith("</testsuites>\n"))
+
+    def test_failing_instance_testcases(self):
+        """Tests ``create_validation_report_junit_console`` with testcases per failing instance.
+
+        Test-Purpose:
+            Tests that each failing ifc instance is an additional testcase
+            with escaped texts.
+
+        Under Test:
+            * ``create_validation_report_junit_console``
+
+        Given:
+            * validated_rules: a rule with one valid and one failing ifc instance
+            * failing_instances: True
+
+        Expected:
+            A testsuite with the failing testcases for the rule and the failing instance"""
+        junit_report = self.write_report(failing_instances=True)
+        self.assertIn('<testsuite name="rules[0].rule" tests="2" failures="2" errors="0" '
+                      'skipped="0">', junit_report)
+        self.assertIn('<testcase name="IfcWall &lt;Door&gt; 2" classname="rules[0].rule">',
+                      junit_report)
+        self.assertNotIn("<Door>", junit_report)
+        self.assertEqual(2, junit_report.count("<failure "))
+
+    def test_not_evaluated_testcase(self):
+        """Tests ``_create_junit_testcase`` on a not evaluated validation without message.
+
+        Test-Purpose:
+            Tests that a not evaluated testcase is skipped, also without a message.
+
+        Under Test:
+            * ``_create_junit_testcase``
+
+        Given:
+            * validation_information: the default validation information,
+              not evaluated without message
+
+        Expected:
+            A testcase with an empty skipped element"""
+        testcase = report._create_junit_testcase(  # pylint: disable=protected-access
+            "rules[0].rule", "rules[0].rule", ValidationInformation(), [])
+        self.assertIn('<skipped message=""></skipped>', testcase)
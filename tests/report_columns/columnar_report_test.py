@@ -0,0 +1,158 @@
+"""Columnar Report Unit Test Suite"""
+import io
+import os
+import tempfile
+import unittest
+
+from ifc_data_checker.report_columns import ColumnarReportWriter
+from ifc_data_checker.report_columns import iter_row_groups
+from ifc_data_checker.report_columns import read_columnar_report
+
+
+class TestColumnarReport(unittest.TestCase):
+    """Test Columnar Report"""
+
+    records = [
+        {"record": "rule", "rule": 0, "path": "rules[0].rule", "classes": ["IfcWall"],
+         "result": "FAILED", "message": "1 of 2 instances are valid"},
+        {"record": "instance", "rule": 0, "global_id": "1", "type": "IfcWall",
+         "name": "Wall", "result": "VALID", "message": "validation passed"},
+        {"record": "instance", "rule": 0, "global_id": "2", "type": "IfcWall",
+         "name": None, "result": "FAILED", "message": "validation failed"},
+    ]
+
+    def setUp(self):
+        """Creates a temporary directory for the report files"""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.report_file_name = os.path.join(self.directory.name, "report.idcr")
+
+    def tearDown(self):
+        """Removes the temporary directory"""
+        self.directory.cleanup()
+
+    def write_report(self, records, row_group_size=65536):
+        """Writes the records into the columnar report file"""
+        with open(self.report_file_name, "wb") as report_file:
+            writer = ColumnarReportWriter(report_file, "rules.yml", "model.ifc",
+                                          row_group_size)
+            for record in records:
+                writer.write(record)
+            writer.flush()
+
+    def test_round_trip(self):
+        """Tests ``ColumnarReportWriter`` and ``read_columnar_report`` on a round trip.
+
+        Test-Purpose:
+            Tests that the written records are read back column by column.
+
+        Under Test:
+            * ``ColumnarReportWriter.write``
+            * ``read_columnar_report``
+
+        Given:
+            * records: a rule record and two instance records
+
+        Expected:
+            The values of the records per column, missing values as None
+
+        Comment:
+            Columns without a value in a record, like the global id of a rule record,
+            are read as None."""
+        self.write_report(self.records)
+        columns = read_columnar_report(self.report_file_name)
+        self.assertEqual("rules.yml", columns["rules_file"])
+        self.assertEqual("model.ifc", columns["ifc_file"])
+        self.assertEqual(["rule", "instance", "instance"], columns["record"])
+        self.assertEqual([0, 0, 0], columns["rule"])
+        self.assertEqual([None, "1", "2"], columns["global_id"])
+        self.assertEqual([None, "IfcWall", "IfcWall"], columns["type"])
+        self.assertEqual(["FAILED", "VALID", "FAILED"], columns["result"])
+        self.assertEqual(["rules[0].rule", None, None], columns["path"])
+
+    def test_row_groups(self):
+        """Tests ``ColumnarReportWriter`` on writing multiple row groups.
+
+        Test-Purpose:
+            Tests that the records are split into row groups of at most `row_group_size` rows.
+
+        Under Test:
+            * ``ColumnarReportWriter.flush``
+            * ``iter_row_groups``
+
+        Given:
+            * records: seven instance records
+            * row_group_size: 3
+
+        Expected:
+            Three row groups with 3, 3 and 1 rows"""
+        records = [dict(self.records[1], global_id=str(number)) for number in range(7)]
+        self.write_report(records, row_group_size=3)
+        row_groups = list(iter_row_groups(self.report_file_name))
+        self.assertEqual([3, 3, 1], [len(row_group["record"]) for row_group in row_groups])
+        columns = read_columnar_report(self.report_file_name)
+        self.assertEqual([str(number) for number in range(7)], columns["global_id"])
+
+    def test_truncated_report(self):
+        """Tests ``iter_row_groups`` on a truncated columnar report.
+
+        Test-Purpose:
+            Tests that the row groups are read one by one from the file,
+            so the complete row groups are read before the truncated one is refused.
+
+        Under Test:
+            * ``iter_row_groups``
+
+        Given:
+            * file: two row groups, the second one cut off
+
+        Expected:
+            The first row group, then ValueError is raised"""
+        records = [dict(self.records[1], global_id=str(number)) for number in range(4)]
+        self.write_report(records, row_group_size=2)
+        with open(self.report_file_name, "rb+") as report_file:
+            report_file.truncate(os.path.getsize(self.report_file_name) - 3)
+        row_groups = iter_row_groups(self.report_file_name)
+        self.assertEqual(["0", "1"], next(row_groups)["global_id"])
+        with self.assertRaises(ValueError):
+            next(row_groups)
+
+    def test_no_columnar_report(self):
+        """Tests ``read_columnar_report`` on a file which is not a columnar report.
+
+        Test-Purpose:
+            Tests that reading another file is refused.
+
+        Under Test:
+            * ``read_columnar_report``
+
+        Given:
+            * file: a text file
+
+        Expected:
+            ValueError is raised"""
+        with open(self.report_file_name, "wb") as report_file:
+            report_file.write(b"validation report rules.yml model.ifc\n")
+        with self.assertRaises(ValueError):
+            read_columnar_report(self.report_file_name)
+
+    def test_empty_report(self):
+        """Tests ``ColumnarReportWriter`` without records.
+
+        Test-Purpose:
+            Tests that a report without records has no row groups.
+
+        Under Test:
+            * ``ColumnarReportWriter.flush``
+            * ``iter_row_groups``
+
+        Given:
+            * records: none
+
+        Expected:
+            No row groups and empty columns"""
+        report_file = io.BytesIO()
+        ColumnarReportWriter(report_file, "rules.yml", "model.ifc").flush()
+        with open(self.report_file_name, "wb") as file:
+            file.write(report_file.getvalue())
+        self.assertEqual([], list(iter_row_groups(self.report_file_name)))
+        self.assertEqual([], read_columnar_report(self.report_file_name)["record"])
@@ -0,0 +1,118 @@
+"""Early Termination Unit Test Suite"""
+import unittest
+
+from ifc_data_checker.rules import Rule
+from ifc_data_checker.validation import ValidationOptions
+from ifc_data_checker.validation import ValidationResult
+from tests.helpers import IfcInstanceMock
+
+
+class TestEarlyTermination(unittest.TestCase):
+    """Test Early Termination"""
+
+    rule_definition = {
+        "classes": ["IfcWall"],
+        "constraints": [
+            {"path": [{"attribute": "Name"}], "check": {"equals": "Wall"}},
+            {"path": [{"list": "Parts"}, {"attribute": "Name"}], "check": {"equals": "Part"}}
+        ]
+    }
+
+    @classmethod
+    def validate_rule(cls, validation_options: ValidationOptions) -> Rule:
+        """Validates the rule on a valid ifc instance followed by four failing ifc instances"""
+        ifc_instances = tuple(
+            IfcInstanceMock(ifc_type="IfcWall", Name=name, GlobalId=str(number),
+                            Parts=[IfcInstanceMock(ifc_type="IfcPart", Name="Part")])
+            for number, name in enumerate(["Wall", "Door", "Door", "Door", "Door"]))
+        rule = Rule(cls.rule_definition, ifc_instances, validation_options)
+        rule.validate()
+        return rule
+
+    def test_max_failures_per_rule(self):
+        """Tests ``Rule.validate`` with a maximum count of failures per rule.
+
+        Test-Purpose:
+            Tests that the validation of the rule stops after the maximum count
+            of failed ifc instances.
+
+        Under Test:
+            * ``Rule.validate``
+
+        Given:
+            * max_failures_per_rule: 2
+            * ifc_instances: one valid ifc instance followed by four failing ifc instances
+
+        Expected:
+            The rule is truncated after three validated ifc instances"""
+        rule = self.validate_rule(ValidationOptions(max_failures_per_rule=2))
+        self.assertTrue(rule.truncated)
+        self.assertEqual(3, len(rule.validation))
+        self.assertEqual(3, len(rule.results))
+        self.assertEqual([3, 3], [len(constraint_results)
+                                  for constraint_results in rule.constraint_results])
+        self.assertEqual(ValidationResult.FAILED, rule.validation_information.validation_result)
+        self.assertEqual(
+            "Rule: 1 of 3 instances of types ['IfcWall'] successfully validated. "
+            "Validation stopped after 2 failed instances, 2 instances not validated.",
+            rule.validation_information.message)
+
+    def test_max_failures_not_reached(self):
+        """Tests ``Rule.validate`` with a maximum count of failures per rule not reached.
+
+        Test-Purpose:
+            Tests that the rule is not truncated, if the maximum count of failures
+            is reached on the last ifc instance.
+
+        Under Test:
+            * ``Rule.validate``
+
+        Given:
+            * max_failures_per_rule: 4
+            * ifc_instances: one valid ifc instance followed by four failing ifc instances
+
+        Expected:
+            All ifc instances are validated"""
+        rule = self.validate_rule(ValidationOptions(max_failures_per_rule=4))
+        self.assertFalse(rule.truncated)
+        self.assertEqual(5, len(rule.results))
+        self.assertEqual(
+            "Rule: 1 of 5 instances of types ['IfcWall'] successfully validated.",
+            rule.validation_information.message)
+
+    def test_fail_fast(self):
+        """Tests ``Rule.validate`` with fail fast.
+
+        Test-Purpose:
+            Tests that the validation of the rule stops after the first failed ifc instance.
+
+        Under Test:
+            * ``Rule.validate``
+
+        Given:
+            * fail_fast: True
+            * ifc_instances: one valid ifc instance followed by four failing ifc instances
+
+        Expected:
+            The rule is truncated after two validated ifc instances"""
+        rule = self.validate_rule(ValidationOptions(fail_fast=True))
+        self.assertTrue(rule.truncated)
+        self.assertEqual(2, len(rule.results))
+        self.assertEqual(1, rule.results.valid_count())
+
+    def test_invalid_max_failures_per_rule(self):
+        """Tests ``ValidationOptions`` with an invalid maximum count of failures per rule.
+
+        Test-Purpose:
+            Tests that a maximum count of failures less than 1 is refused.
+
+        Under Test:
+            * ``ValidationOptions.__init__``
+
+        Given:
+            * max_failures_per_rule: 0
+
+        Expected:
+            ValueError is raised"""
+        with self.assertRaises(ValueError):
+            ValidationOptions(max_failures_per_rule=0)
@@ -0,0 +1,103 @@
+"""Report Level Unit Test Suite"""
+import unittest
+
+from ifc_data_checker.rules import Rule
+from ifc_data_checker.validation import ReportLevel
+from ifc_data_checker.validation import ValidationOptions
+from ifc_data_checker.validation import ValidationResult
+from tests.helpers import IfcInstanceMock
+
+
+class TestReportLevel(unittest.TestCase):
+    """Test Report Level"""
+
+    rule_definition = {
+        "classes": ["IfcWall"],
+        "constraints": [
+            {"path": [{"attribute": "Name"}], "check": {"equals": "Wall"}},
+            {"path": [{"attribute": "Description"}], "check": {"equals": "Wall"}},
+            {"path": [{"list": "Parts"}, {"attribute": "Name"}], "check": {"equals": "Part"}}
+        ]
+    }
+
+    @classmethod
+    def validate_rule(cls, report_level: ReportLevel) -> Rule:
+        """Validates the rule on a valid and a failing ifc instance with the report level"""
+        ifc_instances = (
+            IfcInstanceMock(ifc_type="IfcWall", Name="Wall", Description="Wall", GlobalId="1",
+                            Parts=[IfcInstanceMock(ifc_type="IfcPart", Name="Part")]),
+            IfcInstanceMock(ifc_type="IfcWall", Name="Door", Description="Wall", GlobalId="2",
+                            Parts=[IfcInstanceMock(ifc_type="IfcPart", Name="Part")]))
+        rule = Rule(cls.rule_definition, ifc_instances, ValidationOptions(report_level))
+        rule.validate()
+        return rule
+
+    def test_full(self):
+        """Tests ``Rule.validate`` with the report level full.
+
+        Test-Purpose:
+            Tests that all ifc instances and constraints are kept.
+
+        Under Test:
+            * ``Rule.validate``
+
+        Given:
+            * report_level: ReportLevel.FULL
+            * ifc_instances: one valid and one failing ifc instance
+
+        Expected:
+            Both ifc instances with all their constraints"""
+        rule = self.validate_rule(ReportLevel.FULL)
+        self.assertEqual(ValidationResult.FAILED, rule.validation_information.validation_result)
+        self.assertEqual(2, len(rule.validation))
+        self.assertEqual([3, 3], [len(instance_validation['validated_constraints'])
+                                  for instance_validation in rule.validation])
+
+    def test_failures(self):
+        """Tests ``Rule.validate`` with the report level failures.
+
+        Test-Purpose:
+            Tests that only the failing ifc instances with their failing constraints are kept.
+
+        Under Test:
+            * ``Rule.validate``
+
+        Given:
+            * report_level: ReportLevel.FAILURES
+            * ifc_instances: one valid and one failing ifc instance
+
+        Expected:
+            The failing ifc instance with its failing constraint only,
+            the same messages of the rule and the ifc instance as with the report level full"""
+        rule = self.validate_rule(ReportLevel.FAILURES)
+        full_rule = self.validate_rule(ReportLevel.FULL)
+        self.assertEqual(full_rule.validation_information, rule.validation_information)
+        self.assertEqual(1, len(rule.validation))
+        instance_validation = rule.validation[0]
+        self.assertEqual("2", instance_validation['ifc_instance'].GlobalId)
+        self.assertEqual(full_rule.validation[1]['validation_information'],
+                         instance_validation['validation_information'])
+        self.assertEqual(1, len(instance_validation['validated_constraints']))
+        self.assertFalse(instance_validation['validated_constraints'][0].is_valid())
+
+    def test_summary(self):
+        """Tests ``Rule.validate`` with the report level summary.
+
+        Test-Purpose:
+            Tests that no ifc instances are kept.
+
+        Under Test:
+            * ``Rule.validate``
+            * ``Rule.report``
+
+        Given:
+            * report_level: ReportLevel.SUMMARY
+            * ifc_instances: one valid and one failing ifc instance
+
+        Expected:
+            The rule result only"""
+        rule = self.validate_rule(ReportLevel.SUMMARY)
+        self.assertEqual(self.validate_rule(ReportLevel.FULL).validation_information,
+                         rule.validation_information)
+        self.assertEqual([], rule.validation)
+        self.assertEqual([str(rule.validation_information)], rule.report())
@@ -0,0 +1,112 @@
+"""Threaded Validation Unit Test Suite"""
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from ifc_data_checker import scheduling
+from ifc_data_checker.rules import Rule
+from ifc_data_checker.validation import ReportLevel
+from ifc_data_checker.validation import ValidationOptions
+from tests.helpers import IfcInstanceMock
+
+
+class TestThreadedValidation(unittest.TestCase):
+    """Test Threaded Validation"""
+
+    rule_definition = {
+        "classes": ["IfcWall"],
+        "constraints": [
+            {"path": [{"attribute": "Name"}], "check": {"equals": "Wall"}},
+            {"path": [{"list": "Parts"}, {"attribute": "Name"}], "check": {"equals": "Part"}}
+        ]
+    }
+
+    ifc_instances = tuple(
+        IfcInstanceMock(ifc_type="IfcWall", Name="Wall" if number % 3 else "Door",
+                        GlobalId=str(number),
+                        Parts=[IfcInstanceMock(ifc_type="IfcPart", Name="Part")])
+        for number in range(20))
+
+    @classmethod
+    def validate_rule(cls, validation_options: ValidationOptions, executor=None) -> Rule:
+        """Validates the rule on walls, every third one is failing"""
+        rule = Rule(cls.rule_definition, cls.ifc_instances, validation_options)
+        rule.validate(executor)
+        return rule
+
+    def assert_same_validation(self, expected: Rule, actual: Rule):
+        """Asserts that both rules have the same validation results and reports"""
+        self.assertEqual(expected.report(), actual.report())
+        self.assertEqual([results.results for results in expected.constraint_results],
+                         [results.results for results in actual.constraint_results])
+        self.assertEqual(expected.truncated, actual.truncated)
+
+    def test_validate_with_threads(self):
+        """Tests ``Rule.validate`` on threads.
+
+        Test-Purpose:
+            Tests that the ifc instances validated in shards on threads
+            are validated and reported like one by one.
+
+        Under Test:
+            * ``Rule.validate``
+
+        Given:
+            * ifc instances: 20 walls, every third one is failing
+            * executor: a thread pool of 3 threads, shards of 2 ifc instances
+
+        Expected:
+            The same validation results and report as without the thread pool"""
+        expected = self.validate_rule(ValidationOptions())
+        validation_options = ValidationOptions(threads=3)
+        with ThreadPoolExecutor(max_workers=3) as executor, \
+                mock.patch.object(scheduling, "INSTANCE_SHARD_SIZE", 2):
+            actual = self.validate_rule(validation_options, executor)
+        self.assert_same_validation(expected, actual)
+
+    def test_validate_with_threads_truncated(self):
+        """Tests ``Rule.validate`` on threads with a maximum count of failures per rule.
+
+        Test-Purpose:
+            Tests that the validation on threads stops after the same ifc instance
+            as the validation one by one.
+
+        Under Test:
+            * ``Rule.validate``
+
+        Given:
+            * ifc instances: 20 walls, every third one is failing
+            * validation options: at most 3 failures per rule, report failures
+            * executor: a thread pool of 2 threads
+
+        Expected:
+            The same truncated validation results and report as without the thread pool"""
+        expected = self.validate_rule(ValidationOptions(
+            report_level=ReportLevel.FAILURES, max_failures_per_rule=3))
+        validation_options = ValidationOptions(report_level=ReportLevel.FAILURES,
+                                               max_failures_per_rule=3, threads=2)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            actual = self.validate_rule(validation_options, executor)
+        self.assertTrue(actual.truncated)
+        self.assert_same_validation(expected, actual)
+
+    def test_invalid_threads(self):
+        """Tests ``ValidationOptions`` with less than one thread.
+
+        Test-Purpose:
+            Tests that a count of threads less than 1 is refused.
+
+        Under Test:
+            * ``ValidationOptions.__init__``
+
+        Given:
+            * threads: 0
+
+        Expected:
+            ValueError is raised"""
+        with self.assertRaises(ValueError):
+            ValidationOptions(threads=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""Validate Rules Files Unit Test Suite"""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from ifc_data_checker.backends import LazyStepBackend
+from ifc_data_checker.rules import iter_validate_files
+from ifc_data_checker.rules import validate_files
+from ifc_data_checker.validation import ValidationOptions
+from ifc_data_checker.validation import ValidationResult
+from tests.step.lazy_step_model_test import STEP_FILE
+
+
+class TestValidateFiles(unittest.TestCase):
+    """Test Validate Rules Files"""
+
+    rules_definitions = [
+        [{"rule": {"classes": ["IfcWall"], "constraints": [
+            {"path": [{"attribute": "Name"}], "check": {"equals": "Wall B"}}]}},
+         {"rule": {"classes": ["IfcPropertySet"], "constraints": [
+             {"path": [{"attribute": "Name"}], "check": {"equals": "Pset_WallCommon"}}]}}],
+        [],
+        [{"rule": {"classes": ["IfcWallStandardCase"], "constraints": [
+            {"path": [{"attribute": "Name"}], "check": {"equals": "Wall B"}}]}}]
+    ]
+
+    def setUp(self):
+        """Writes the STEP file into a temporary directory"""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.ifc_file = os.path.join(self.directory.name, "test.ifc")
+        with open(self.ifc_file, "w", encoding="latin-1") as step_file:
+            step_file.write(STEP_FILE)
+
+    def tearDown(self):
+        """Removes the temporary directory"""
+        self.directory.cleanup()
+
+    def test_validate_files(self):
+        """Tests ``validate_files`` on several rules files.
+
+        Test-Purpose:
+            Tests that the rules of several rules files are validated on one opened ifc model
+            and returned per rules file.
+
+        Under Test:
+            * ``validate_files``
+
+        Given:
+            * ifc file: a wall and a wall standard case of one property set
+            * rules_definitions: three rules files, the second one without rules
+
+        Expected:
+            The ifc file is opened once, the validated rules are grouped by their rules file"""
+        with mock.patch.object(LazyStepBackend, "open", autospec=True,
+                               side_effect=LazyStepBackend.open) as model_open:
+            validated_rules = validate_files(self.rules_definitions, self.ifc_file,
+                                             ValidationOptions(model_backend="lazy"))
+        self.assertEqual(1, model_open.call_count)
+        self.assertEqual([[["IfcWall"], ["IfcPropertySet"]], [], [["IfcWallStandardCase"]]],
+                         [[rule.get_classes() for rule in rules] for rules in validated_rules])
+        self.assertEqual(
+            [[ValidationResult.FAILED, ValidationResult.VALID], [], [ValidationResult.VALID]],
+            [[rule.validation_information.validation_result for rule in rules]
+             for rules in validated_rules])
+
+    def test_iter_validate_files_fail_fast(self):
+        """Tests ``iter_validate_files`` with the fail fast validation option.
+
+        Test-Purpose:
+            Tests that no rules of any rules file are validated after the first not valid rule.
+
+        Under Test:
+            * ``iter_validate_files``
+
+        Given:
+            * ifc file: a wall and a wall standard case of one property set
+            * rules_definitions: three rules files, the first rule is not valid
+            * validation options: fail fast
+
+        Expected:
+            Only the first rule of the first rules file is validated"""
+        validated_rules = [list(rules) for rules in iter_validate_files(
+            self.rules_definitions, self.ifc_file,
+            ValidationOptions(fail_fast=True, model_backend="lazy"))]
+        self.assertEqual([1, 0, 0], [len(rules) for rules in validated_rules])
+
+
+if __name__ == '__main__':
+    unittest.main()
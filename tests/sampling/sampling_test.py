@@ -0,0 +1,126 @@
+"""Sampling Unit Test Suite"""
+import unittest
+
+from ifc_data_checker.indexes import ModelIndex
+from ifc_data_checker.sampling import Sampling
+from ifc_data_checker.sampling import wilson_interval
+from tests.helpers import IfcInstanceMock
+from tests.helpers import IfcModelMock
+
+
+class TestSampling(unittest.TestCase):
+    """Test Sampling"""
+
+    walls = tuple(IfcInstanceMock(ifc_id=i, ifc_type="IfcWall") for i in range(1, 101))
+
+    def test_sample_size(self):
+        """Tests ``Sampling`` on the size of the sample.
+
+        Test-Purpose:
+            Tests that the sample is either a count or a percentage of the ifc instances.
+
+        Under Test:
+            * ``Sampling.sample_size``
+
+        Given:
+            * sample: a count and percentages of the ifc instances
+
+        Expected:
+            The count of the sampled ifc instances, at most all ifc instances"""
+        self.assertEqual(10, Sampling("10").sample_size(100))
+        self.assertEqual(100, Sampling("1000").sample_size(100))
+        self.assertEqual(5, Sampling("5%").sample_size(100))
+        self.assertEqual(1, Sampling("0.5%").sample_size(100))
+
+    def test_invalid_sample(self):
+        """Tests ``Sampling`` on invalid samples.
+
+        Test-Purpose:
+            Tests that samples neither a positive count nor a percentage are refused.
+
+        Under Test:
+            * ``Sampling.__init__``
+
+        Given:
+            * sample: invalid samples
+
+        Expected:
+            ValueError is raised"""
+        for sample in ("0", "-1", "ten", "0%", "101%", "%"):
+            with self.subTest(sample=sample), self.assertRaises(ValueError):
+                Sampling(sample)
+
+    def test_deterministic_sample(self):
+        """Tests ``Sampling.sample`` on drawing a deterministic sample.
+
+        Test-Purpose:
+            Tests that the same seed draws the same sample in the order of the ifc instances
+            and another seed draws another sample.
+
+        Under Test:
+            * ``Sampling.sample``
+
+        Given:
+            * ifc_instances: 100 walls
+            * sample: 10 ifc instances with the seeds 0 and 1
+
+        Expected:
+            The same ordered sample for the same seed"""
+        sample = Sampling("10").sample(self.walls, ["IfcWall"])
+        self.assertEqual(10, len(sample))
+        self.assertEqual(sample, Sampling("10").sample(self.walls, ["IfcWall"]))
+        self.assertEqual(sorted(sample, key=lambda wall: wall.id()), list(sample))
+        self.assertNotEqual(sample, Sampling("10", seed=1).sample(self.walls, ["IfcWall"]))
+
+    def test_cover_type_objects(self):
+        """Tests ``Sampling.sample`` on covering the type objects.
+
+        Test-Purpose:
+            Tests that each type object is covered by at least one sampled ifc instance.
+
+        Under Test:
+            * ``Sampling.sample``
+            * implicit: ``ModelIndex.type_index``
+
+        Given:
+            * ifc_model: Mock model with a type object typing one wall
+              and a type object typing the other walls
+            * sample: 1 ifc instance covering the type objects
+
+        Expected:
+            A sample of the typed wall plus one of the other walls
+
+        Comment:
+            Usage of ``IfcModelMock`` to represent an ifc model"""
+        basic_wall = IfcInstanceMock(ifc_id=1001, ifc_type="IfcWallType", Name="Basic Wall")
+        curtain_wall = IfcInstanceMock(ifc_id=1002, ifc_type="IfcWallType", Name="Curtain Wall")
+        ifc_model = IfcModelMock(
+            IfcInstanceMock(ifc_id=2001, ifc_type="IfcRelDefinesByType",
+                            RelatingType=basic_wall, RelatedObjects=self.walls[1:]),
+            IfcInstanceMock(ifc_id=2002, ifc_type="IfcRelDefinesByType",
+                            RelatingType=curtain_wall, RelatedObjects=self.walls[:1]))
+        sample = Sampling("1", cover_type_objects=True).sample(
+            self.walls, ["IfcWall"], ModelIndex(ifc_model))
+        self.assertEqual(2, len(sample))
+        self.assertIn(self.walls[0], sample)
+
+    def test_wilson_interval(self):
+        """Tests ``wilson_interval`` on the confidence interval of the pass rate.
+
+        Test-Purpose:
+            Tests the 95% confidence interval of known pass rates.
+
+        Under Test:
+            * ``wilson_interval``
+
+        Given:
+            * samples: 5 of 10, 0 of 10 and 10 of 10 valid ifc instances, an empty sample
+
+        Expected:
+            The Wilson score intervals"""
+        lower_bound, upper_bound = wilson_interval(5, 10)
+        self.assertAlmostEqual(0.2366, lower_bound, places=4)
+        self.assertAlmostEqual(0.7634, upper_bound, places=4)
+        self.assertAlmostEqual(0.0, wilson_interval(0, 10)[0])
+        self.assertAlmostEqual(1.0, wilson_interval(10, 10)[1])
+        self.assertEqual((0.0, 1.0), wilson_interval(0, 0))
@@ -0,0 +1,129 @@
+"""Schedule Unit Test Suite"""
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from ifc_data_checker import scheduling
+from ifc_data_checker.rules import Rule
+from ifc_data_checker.scheduling import ValidationProfile
+from ifc_data_checker.scheduling import schedule
+from ifc_data_checker.validation import ValidationOptions
+from tests.helpers import IfcInstanceMock
+
+
+class TestSchedule(unittest.TestCase):
+    """Test Schedule"""
+
+    rule_definition = {
+        "classes": ["IfcWall"],
+        "constraints": [
+            {"path": [{"attribute": "Name"}], "check": {"equals": "Wall"}}
+        ]
+    }
+
+    def test_schedule_without_costs(self):
+        """Tests ``schedule`` without known costs.
+
+        Test-Purpose:
+            Tests that the ifc instances are split into chunks of the same size
+            in the order of the ifc instances.
+
+        Under Test:
+            * ``schedule``
+
+        Given:
+            * costs: 16 unknown costs
+            * workers: 2
+
+        Expected:
+            8 chunks of 2 ifc instances in their order"""
+        chunks = schedule([None] * 16, 2)
+        self.assertEqual([[index, index + 1] for index in range(0, 16, 2)], chunks)
+
+    def test_schedule_with_costs(self):
+        """Tests ``schedule`` with the costs of a former run.
+
+        Test-Purpose:
+            Tests that the most expensive ifc instances are dispatched first,
+            each on its own, and the cheap ifc instances are chunked together.
+
+        Under Test:
+            * ``schedule``
+
+        Given:
+            * costs: two expensive, six cheap and two unknown costs
+            * workers: 1
+
+        Expected:
+            The expensive ifc instances first in chunks of their own,
+            every ifc instance in one chunk"""
+        costs = [0.01, 1.0, 0.01, None, 0.01, 2.0, 0.01, None, 0.01, 0.01]
+        chunks = schedule(costs, 1)
+        self.assertEqual([[5], [1]], chunks[:2])
+        self.assertEqual(list(range(10)), sorted(index for chunk in chunks for index in chunk))
+        self.assertLess(len(chunks), len(costs))
+
+    def test_profile_file(self):
+        """Tests ``ValidationProfile`` on writing and reading the profile file.
+
+        Test-Purpose:
+            Tests that the recorded validation times are read again,
+            a missing profile file is an empty profile and other files are refused.
+
+        Under Test:
+            * ``ValidationProfile.save``
+            * ``ValidationProfile.load``
+
+        Given:
+            * profile: a validation time of an ifc instance
+
+        Expected:
+            The validation time is read again, ValueError for a file not being a profile"""
+        with tempfile.TemporaryDirectory() as directory:
+            profile_file = os.path.join(directory, "profile.json")
+            self.assertEqual({}, ValidationProfile.load(profile_file).timings)
+            profile = ValidationProfile()
+            profile.record("rule", "instance", 0.5)
+            profile.save(profile_file)
+            self.assertEqual({"instance": 0.5}, ValidationProfile.load(profile_file).costs("rule"))
+            with open(profile_file, "w", encoding="utf-8") as invalid_file:
+                invalid_file.write("[]")
+            with self.assertRaises(ValueError):
+                ValidationProfile.load(profile_file)
+
+    def test_validate_with_profile(self):
+        """Tests ``Rule.validate`` with a profile on threads.
+
+        Test-Purpose:
+            Tests that the ifc instances scheduled by the profile are reported
+            in their order and their validation times are recorded.
+
+        Under Test:
+            * ``Rule.validate``
+
+        Given:
+            * ifc instances: 12 walls, every fourth one is failing
+            * profile: the last wall is the most expensive one
+            * executor: a thread pool of 2 threads
+
+        Expected:
+            The same report as without the thread pool, a validation time per wall"""
+        ifc_instances = tuple(
+            IfcInstanceMock(ifc_type="IfcWall", Name="Wall" if number % 4 else "Door",
+                            GlobalId=f"wall{number}")
+            for number in range(12))
+        profile = ValidationProfile()
+        profile.record(scheduling.rule_key(self.rule_definition), "wall11", 1.0)
+        expected = Rule(self.rule_definition, ifc_instances)
+        expected.validate()
+        actual = Rule(self.rule_definition, ifc_instances, ValidationOptions(threads=2))
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            actual.validate(executor, profile)
+        self.assertEqual(expected.report(), actual.report())
+        self.assertEqual({f"wall{number}" for number in range(12)},
+                         set(profile.costs(scheduling.rule_key(self.rule_definition))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,255 @@
+"""Validation Service Unit Test Suite"""
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+
+from ifc_data_checker import report
+from ifc_data_checker.rules import iter_validate
+from ifc_data_checker.service import ValidationService
+from ifc_data_checker.validation import ValidationOptions
+from tests.step.lazy_step_model_test import STEP_FILE
+
+EOF_TIMEOUT = 30
+"""The seconds to wait for the service to close the connection after the response"""
+
+
+class TestValidationService(unittest.TestCase):
+    """Test Validation Service"""
+
+    rules_definition = [
+        {"rule": {"classes": ["IfcWall"], "constraints": [
+            {"path": [{"attribute": "Name"}], "check": {"equals": "Wall B"}}]}},
+        {"rule": {"classes": ["IfcPropertySet"], "constraints": [
+            {"path": [{"attribute": "Name"}], "check": {"equals": "Pset_WallCommon"}}]}}
+    ]
+
+    def setUp(self):
+        """Writes the rules file and the STEP file into a temporary directory"""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.rules_file = os.path.join(self.directory.name, "rules.yml")
+        with open(self.rules_file, "w", encoding="utf-8") as rules_file:
+            json.dump({"rules": self.rules_definition}, rules_file)
+        self.ifc_file = os.path.join(self.directory.name, "model.ifc")
+        with open(self.ifc_file, "w", encoding="latin-1") as step_file:
+            step_file.write(STEP_FILE)
+        self.upload_directory = os.path.join(self.directory.name, "uploads")
+        os.mkdir(self.upload_directory)
+        self.validation_options = ValidationOptions(model_backend="lazy")
+
+    def tearDown(self):
+        """Removes the temporary directory"""
+        self.directory.cleanup()
+
+    @staticmethod
+    async def post(port: int, target: str, body: bytes) -> tuple:
+        """Posts the body to the service and reads the response
+
+            Returns:
+                Tuple[int, bytes]:
+                    The status and the body of the response, decoded from the chunks.
+
+            Raises:
+                asyncio.TimeoutError:
+                    If the connection is not closed after the response.
+        """
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"POST {target} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n"
+                     .encode("latin-1") + body)
+        await writer.drain()
+        status = int((await reader.readline()).split()[1])
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.lower()] = value.strip()
+        if headers.get("transfer-encoding") != "chunked":
+            content = await reader.readexactly(int(headers["content-length"]))
+        else:
+            content = b""
+            while True:
+                size = int(await reader.readline(), 16)
+                content += (await reader.readexactly(size + 2))[:-2]
+                if not size:
+                    break
+        content += await asyncio.wait_for(reader.read(), EOF_TIMEOUT)
+        writer.close()
+        return status, content
+
+    def run_service(self, client, jobs: int = 2):
+        """Starts the service of the rules file and runs the client on it
+
+            Args:
+                client (Callable[[ValidationService, int], Awaitable]):
+                    Gets the service and its port, sends the requests.
+
+            Returns:
+                The result of the client.
+        """
+        async def serve_requests():
+            service = ValidationService([self.rules_file], jobs, self.validation_options,
+                                        self.upload_directory)
+            server = await service.start(port=0)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                return await client(service, port)
+            finally:
+                server.close()
+                await server.wait_closed()
+                await service.close()
+        return asyncio.run(serve_requests())
+
+    def serve(self, *requests: tuple) -> list:
+        """Starts the service of the rules file with two jobs and posts the requests
+            at the same time
+
+            Returns:
+                List[Tuple[int, bytes]]:
+                    The status and the body of the response of each request.
+        """
+        async def post_requests(_, port):
+            return await asyncio.gather(*(self.post(port, target, body)
+                                          for target, body in requests))
+        return self.run_service(post_requests)
+
+    def expected_report(self) -> bytes:
+        """Gets the JSON lines validation report of the STEP file"""
+        return "".join(report.create_json_report_chunks(
+            iter_validate(self.rules_definition, self.ifc_file, self.validation_options),
+            self.rules_file, self.ifc_file)).encode("utf-8")
+
+    def test_validate_uploads(self):
+        """Tests ``ValidationService`` on uploads at the same time.
+
+        Test-Purpose:
+            Tests that the uploaded ifc files are validated on the worker processes
+            and the reports are streamed back like the JSON lines validation report.
+
+        Under Test:
+            * ``ValidationService.handle``
+            * ``validate_job``
+
+        Given:
+            * rules file: a rule on walls and a rule on property sets
+            * requests: the STEP file uploaded twice at the same time
+
+        Expected:
+            The JSON lines validation report of the STEP file twice,
+            the uploaded files are removed"""
+        with open(self.ifc_file, "rb") as step_file:
+            body = step_file.read()
+        responses = self.serve(("/validate/rules.yml?ifc=model.ifc", body),
+                               ("/validate/rules.yml?ifc=model.ifc", body))
+        expected = self.expected_report()
+        self.assertEqual([(200, expected), (200, expected)], responses)
+        self.assertEqual([], os.listdir(self.upload_directory))
+
+    def test_connections_closed(self):
+        """Tests ``ValidationService`` on uploads one after the other.
+
+        Test-Purpose:
+            Tests that the connection of each request is closed after its response,
+            as the worker processes do not inherit the sockets of the service.
+
+        Under Test:
+            * ``ValidationService.start``
+            * ``ValidationService.handle``
+
+        Given:
+            * service: one job
+            * requests: the STEP file uploaded three times, one after the other
+
+        Expected:
+            The JSON lines validation report of the STEP file three times,
+            each followed by the end of the connection"""
+        with open(self.ifc_file, "rb") as step_file:
+            body = step_file.read()
+
+        async def post_requests(_, port):
+            return [await self.post(port, "/validate/rules.yml?ifc=model.ifc", body)
+                    for _ in range(3)]
+        expected = self.expected_report()
+        self.assertEqual([(200, expected)] * 3, self.run_service(post_requests, 1))
+
+    def test_broken_process_pool(self):
+        """Tests ``ValidationService`` after a worker process died.
+
+        Test-Purpose:
+            Tests that the process pool broken by a dead worker process is replaced,
+            so the following requests are validated.
+
+        Under Test:
+            * ``ValidationService.handle``
+            * ``ValidationService._replace_process_pool``
+
+        Given:
+            * service: one job, its worker process exits
+            * requests: the STEP file uploaded twice, one after the other
+
+        Expected:
+            The JSON lines validation report of the STEP file twice"""
+        with open(self.ifc_file, "rb") as step_file:
+            body = step_file.read()
+
+        async def post_requests(service, port):
+            # pylint: disable=protected-access
+            broken_pool = service._process_pool
+            with self.assertRaises(BrokenProcessPool):
+                await asyncio.wrap_future(broken_pool.submit(os._exit, 1))
+            responses = [await self.post(port, "/validate/rules.yml?ifc=model.ifc", body)
+                         for _ in range(2)]
+            self.assertIsNot(broken_pool, service._process_pool)
+            return responses
+        expected = self.expected_report()
+        self.assertEqual([(200, expected)] * 2, self.run_service(post_requests, 1))
+
+    def test_invalid_requests(self):
+        """Tests ``ValidationService`` on invalid requests.
+
+        Test-Purpose:
+            Tests that requests of unknown rules files or invalid ifc files
+            are answered with an error.
+
+        Under Test:
+            * ``ValidationService.handle``
+            * ``validate_job``
+
+        Given:
+            * requests: an unknown rules file and an invalid ifc file
+
+        Expected:
+            Not found for the unknown rules file,
+            the report record and an error record for the invalid ifc file"""
+        (status, _), (invalid_status, invalid_content) = self.serve(
+            ("/validate/unknown.yml", b""), ("/validate/rules.yml", b"no ifc file"))
+        self.assertEqual(404, status)
+        self.assertEqual(200, invalid_status)
+        records = [json.loads(line) for line in invalid_content.decode("utf-8").splitlines()]
+        self.assertEqual(["report", "error"], [record["record"] for record in records])
+        self.assertEqual("upload.ifc", records[0]["ifc_file"])
+
+    def test_processes_in_service(self):
+        """Tests ``ValidationService`` with worker processes in the validation options.
+
+        Test-Purpose:
+            Tests that the jobs of the service can not start worker processes.
+
+        Under Test:
+            * ``ValidationService.__init__``
+
+        Given:
+            * validation options: two worker processes
+
+        Expected:
+            ValueError is raised"""
+        with self.assertRaises(ValueError):
+            ValidationService([self.rules_file], 2,
+                              ValidationOptions(model_backend="lazy", processes=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
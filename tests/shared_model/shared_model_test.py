@@ -0,0 +1,146 @@
+"""Shared Model Unit Test Suite"""
+import os
+import pickle  # nosec
+import tempfile
+import unittest
+
+from ifc_data_checker.rules import validate
+from ifc_data_checker.shared_model import SharedInverseTable
+from ifc_data_checker.shared_model import SharedStepModel
+from ifc_data_checker.shared_model import SharedTables
+from ifc_data_checker.shared_model import inverse_attribute_names
+from ifc_data_checker.step import LazyStepModel
+from ifc_data_checker.validation import ValidationOptions
+from tests.step.lazy_step_model_test import STEP_FILE
+
+
+class TestSharedModel(unittest.TestCase):
+    """Test Shared Model"""
+
+    rules_definition = [
+        {"rule": {"classes": ["IfcWall"], "constraints": [
+            {"path": [{"list": "IsDefinedBy"}, {"attribute": "RelatingPropertyDefinition"},
+                      {"attribute": "Name"}],
+             "check": {"equals": "Pset_WallCommon"}},
+            {"path": [{"attribute": "Name"}], "check": {"equals": "Wall B"}}]}}
+    ]
+
+    def setUp(self):
+        """Writes the STEP file into a temporary directory and opens it"""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.ifc_file = os.path.join(self.directory.name, "test.ifc")
+        with open(self.ifc_file, "w", encoding="latin-1") as step_file:
+            step_file.write(STEP_FILE)
+        self.model = LazyStepModel(self.ifc_file)
+
+    def tearDown(self):
+        """Closes the model and removes the temporary directory"""
+        self.model.close()
+        self.directory.cleanup()
+
+    def test_shared_step_model(self):
+        """Tests ``SharedStepModel`` on the tables of ``SharedTables``.
+
+        Test-Purpose:
+            Tests that a model attached to the shared tables has the same entity instances,
+            attributes and inverse attributes as the scanned model.
+
+        Under Test:
+            * ``SharedTables.__init__``
+            * ``SharedStepModel.__init__``
+            * ``inverse_attribute_names``
+
+        Given:
+            * ifc file: a wall and a wall standard case of one property set
+            * rules_definition: a rule with the inverse attribute `IsDefinedBy`
+
+        Expected:
+            The same ids, types and attribute values,
+            the inverse table of `IsDefinedBy` is shared"""
+        attribute_names = inverse_attribute_names(self.rules_definition)
+        self.assertEqual({"IsDefinedBy", "RelatingPropertyDefinition", "Name"}, attribute_names)
+        shared_tables = SharedTables(self.model, attribute_names)
+        try:
+            shared_model = SharedStepModel(shared_tables.descriptor)
+            self.assertEqual(dict(self.model.types), dict(shared_model.types))
+            self.assertEqual(dict(self.model.offsets), dict(shared_model.offsets))
+            self.assertNotIn(99, shared_model.offsets)
+            self.assertEqual([entity.id() for entity in self.model.by_type("IfcWall")],
+                             [entity.id() for entity in shared_model.by_type("IfcWall")])
+            self.assertIsInstance(shared_model.inverse_tables[
+                ("IfcRelDefinesByProperties", "RelatedObjects")], SharedInverseTable)
+            wall = shared_model.by_id(10)
+            self.assertEqual("Wall B", wall.Name)
+            self.assertEqual([40], [relation.id() for relation in wall.IsDefinedBy])
+            self.assertEqual("Pset_WallCommon",
+                             wall.IsDefinedBy[0].RelatingPropertyDefinition.Name)
+            shared_model.close()
+        finally:
+            shared_tables.close()
+        self.assertFalse(os.path.exists(shared_tables.file_name))
+
+    def test_pickle_entity(self):
+        """Tests pickling a ``LazyEntity``.
+
+        Test-Purpose:
+            Tests that a pickled entity instance is restored into the model
+            opened on the same STEP file, as the worker processes pass on their results.
+
+        Under Test:
+            * ``LazyEntity.__reduce__``
+            * ``entity_by_key``
+
+        Given:
+            * ifc file: a wall standard case
+
+        Expected:
+            The restored entity instance equals the entity instance of the opened model"""
+        wall = self.model.by_id(10)
+        restored_wall = pickle.loads(pickle.dumps(wall))  # nosec
+        self.assertEqual(wall, restored_wall)
+        self.assertEqual("Wall B", restored_wall.Name)
+
+    def test_validate_with_processes(self):
+        """Tests ``validate`` on worker processes.
+
+        Test-Purpose:
+            Tests that the ifc instances validated on worker processes
+            are validated and reported like in the process itself.
+
+        Under Test:
+            * ``validate``
+
+        Given:
+            * ifc file: a wall and a wall standard case of one property set
+            * validation options: the lazy model backend and two worker processes
+
+        Expected:
+            The same reports as without worker processes"""
+        expected = validate(self.rules_definition, self.ifc_file,
+                            ValidationOptions(model_backend="lazy"))
+        actual = validate(self.rules_definition, self.ifc_file,
+                          ValidationOptions(model_backend="lazy", processes=2))
+        self.assertEqual([rule.report() for rule in expected],
+                         [rule.report() for rule in actual])
+
+    def test_processes_without_lazy_backend(self):
+        """Tests ``ValidationOptions`` with worker processes on the ifcopenshell model backend.
+
+        Test-Purpose:
+            Tests that worker processes require the lazy model backend.
+
+        Under Test:
+            * ``ValidationOptions.__init__``
+
+        Given:
+            * processes: 2
+            * model backend: ifcopenshell
+
+        Expected:
+            ValueError is raised"""
+        with self.assertRaises(ValueError):
+            ValidationOptions(processes=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Snapshot Unit Test Suite"""
+import os
+import tempfile
+import unittest
+
+from ifc_data_checker.snapshot import SnapshotStepModel
+from ifc_data_checker.snapshot import read_snapshot
+from tests.step.lazy_step_model_test import STEP_FILE
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test Snapshot"""
+
+    def setUp(self):
+        """Writes the STEP file into a temporary directory"""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.ifc_file = os.path.join(self.directory.name, "test.ifc")
+        self.write_step_file(STEP_FILE)
+        self.snapshot_directory = os.path.join(self.directory.name, "snapshots")
+
+    def tearDown(self):
+        """Removes the temporary directory"""
+        self.directory.cleanup()
+
+    def write_step_file(self, step_text: str):
+        """Writes the STEP file"""
+        with open(self.ifc_file, "w", encoding="latin-1") as step_file:
+            step_file.write(step_text)
+
+    def open_model(self) -> SnapshotStepModel:
+        """Opens the STEP file with the snapshots of the snapshot directory"""
+        return SnapshotStepModel(self.ifc_file, self.snapshot_directory)
+
+    def test_snapshot(self):
+        """Tests ``SnapshotStepModel`` on opening the STEP file from its snapshot.
+
+        Test-Purpose:
+            Tests that the snapshot keeps the scanned entity instances
+            and the inverse tables built before saving.
+
+        Under Test:
+            * ``SnapshotStepModel.save``
+            * ``read_snapshot``
+
+        Given:
+            * STEP file: walls with an inverse attribute `IsDefinedBy`
+
+        Expected:
+            The model opened from the snapshot equals the scanned model"""
+        model = self.open_model()
+        is_defined_by = model.by_id(30).IsDefinedBy
+        model.save()
+        model.close()
+        entities, inverse_tables = read_snapshot(model.snapshot_file)
+        self.assertEqual((model.offsets, model.types), entities)
+        self.assertEqual(model.inverse_tables, inverse_tables)
+
+        snapshot_model = self.open_model()
+        self.assertEqual(model.offsets, snapshot_model.offsets)
+        self.assertEqual(model.inverse_tables, snapshot_model.inverse_tables)
+        self.assertEqual([10, 30], sorted(wall.id() for wall in snapshot_model.by_type("IfcWall")))
+        self.assertEqual([40], [relation.id() for relation in is_defined_by])
+        self.assertEqual([40], [relation.id()
+                                for relation in snapshot_model.by_id(30).IsDefinedBy])
+        self.assertEqual("Wall B", snapshot_model.by_id(10).Name)
+        snapshot_model.close()
+
+    def test_changed_file(self):
+        """Tests ``SnapshotStepModel`` on a changed STEP file.
+
+        Test-Purpose:
+            Tests that the snapshot of a former STEP file is not used for a changed STEP file.
+
+        Under Test:
+            * ``SnapshotStepModel.__init__``
+
+        Given:
+            * STEP file: changed after the snapshot was written
+
+        Expected:
+            The changed STEP file is scanned into a new snapshot"""
+        model = self.open_model()
+        model.save()
+        model.close()
+        self.write_step_file(STEP_FILE.replace("'Wall B'", "'Wall C'"))
+        changed_model = self.open_model()
+        self.assertNotEqual(model.snapshot_file, changed_model.snapshot_file)
+        self.assertFalse(os.path.exists(changed_model.snapshot_file))
+        self.assertEqual("Wall C", changed_model.by_id(10).Name)
+        changed_model.save()
+        changed_model.close()
+        self.assertEqual(2, len(os.listdir(self.snapshot_directory)))
+
+    def test_invalid_snapshot(self):
+        """Tests ``read_snapshot`` on a file not being a snapshot.
+
+        Test-Purpose:
+            Tests that invalid snapshots are refused.
+
+        Under Test:
+            * ``read_snapshot``
+
+        Given:
+            * snapshot file: the STEP file
+
+        Expected:
+            ValueError is raised"""
+        with self.assertRaises(ValueError):
+            read_snapshot(self.ifc_file)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+"""Lazy Step Model Unit Test Suite"""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import ifcopenshell
+
+from ifc_data_checker import step
+from ifc_data_checker.step import LazyStepModel
+from ifc_data_checker.step import TypedValue
+from ifc_data_checker.step import decode_string
+
+STEP_FILE = """ISO-10303-21;
+HEADER;
+FILE_DESCRIPTION(('ViewDefinition [CoordinationView]'),'2;1');
+FILE_NAME('test.ifc','2021-01-01T00:00:00',(''),(''),'','','');
+FILE_SCHEMA(('IFC4'));
+ENDSEC;
+DATA;
+#30=IFCWALL('2O2Fr$t4X7Zf8NOew3FNr2',$,'Wall ''A''; #99=IFCDOOR(',$,$,$,$,$,.SOLIDWALL.);
+#10=IFCWALLSTANDARDCASE('1O2Fr$t4X7Zf8NOew3FNr2',$,'Wall B',$,$,$,$,$,$);
+/* #98=IFCDOOR('comment'); */
+#20=IFCPROPERTYSET('3O2Fr$t4X7Zf8NOew3FNr2',$,'Pset_WallCommon',$,(#21,#22));
+#21=IFCPROPERTYSINGLEVALUE('IsExternal',$,IFCBOOLEAN(.T.),$);
+#22=IFCPROPERTYSINGLEVALUE('ThermalTransmittance',$,IFCTHERMALTRANSMITTANCEMEASURE(0.5E0),$);
+#40=IFCRELDEFINESBYPROPERTIES('4O2Fr$t4X7Zf8NOew3FNr2',$,$,$,(#30,#10),#20);
+ENDSEC;
+END-ISO-10303-21;
+"""
+
+
+class TestLazyStepModel(unittest.TestCase):
+    """Test Lazy Step Model"""
+
+    def setUp(self):
+        """Writes the STEP file into a temporary directory and opens it"""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        ifc_file = os.path.join(self.directory.name, "test.ifc")
+        with open(ifc_file, "w", encoding="latin-1") as step_file:
+            step_file.write(STEP_FILE)
+        self.model = LazyStepModel(ifc_file)
+
+    def tearDown(self):
+        """Closes the model and removes the temporary directory"""
+        self.model.close()
+        self.directory.cleanup()
+
+    def test_scan(self):
+        """Tests ``LazyStepModel`` on scanning the entity instances.
+
+        Test-Purpose:
+            Tests that the entity instances are found by one scan,
+            without the ones in strings and comments.
+
+        Under Test:
+            * ``LazyStepModel.__init__``
+
+        Given:
+            * STEP file: entity instances, a string and a comment looking like
+              entity instances
+
+        Expected:
+            The ids and types of the entity instances only"""
+        self.assertEqual("IFC4", self.model.schema_name)
+        self.assertEqual({10, 20, 21, 22, 30, 40}, set(self.model.offsets))
+        self.assertEqual("IFCWALL", self.model.entity_type(30))
+
+    def test_by_type(self):
+        """Tests ``LazyStepModel.by_type`` on selecting the entity instances.
+
+        Test-Purpose:
+            Tests that the entity instances of a type and its subtypes are selected
+            in the order of ifcopenshell.
+
+        Under Test:
+            * ``LazyStepModel.by_type``
+            * ``LazyEntity.is_a``
+
+        Given:
+            * STEP file: an IfcWallStandardCase before an IfcWall
+
+        Expected:
+            The IfcWall followed by its subtype IfcWallStandardCase"""
+        walls = self.model.by_type("IfcWall")
+        self.assertEqual([30, 10], [wall.id() for wall in walls])
+        self.assertEqual(["IfcWall", "IfcWallStandardCase"], [wall.is_a() for wall in walls])
+        self.assertTrue(walls[1].is_a("IfcWall"))
+        self.assertTrue(walls[1].is_a("ifcbuildingelement"))
+        self.assertFalse(walls[0].is_a("IfcWallStandardCase"))
+        self.assertEqual([], self.model.by_type("IfcDoor"))
+
+    def test_attributes(self):
+        """Tests ``LazyEntity`` on decoding the attributes.
+
+        Test-Purpose:
+            Tests that the attributes are decoded like by ifcopenshell.
+
+        Under Test:
+            * ``LazyEntity.__getattr__``
+            * ``LazyStepModel.attribute``
+
+        Given:
+            * STEP file: a wall with a string with escaped quotes and an enumeration,
+              a property set with typed values
+
+        Expected:
+            The decoded attribute values"""
+        wall = self.model.by_id(30)
+        self.assertEqual("Wall 'A'; #99=IFCDOOR(", wall.Name)
+        self.assertIsNone(wall.Description)
+        self.assertEqual("SOLIDWALL", wall.PredefinedType)
+        property_set = self.model.by_id(20)
+        properties = property_set.HasProperties
+        self.assertEqual((21, 22), tuple(ifc_property.id() for ifc_property in properties))
+        self.assertEqual(TypedValue("IfcBoolean", True, ".T."), properties[0].NominalValue)
+        self.assertTrue(properties[0].NominalValue.wrappedValue)
+        self.assertEqual(0.5, properties[1].NominalValue.wrappedValue)
+        self.assertEqual("IfcThermalTransmittanceMeasure", properties[1].NominalValue.is_a())
+        self.assertEqual(0, properties[1].NominalValue.id())
+        with self.assertRaises(AttributeError):
+            getattr(wall, "LayerSetName")
+        self.assertFalse(hasattr(wall, "LayerSetName"))
+
+    def test_decoded_values(self):
+        """Tests ``LazyStepModel`` on keeping the decoded entity instances.
+
+        Test-Purpose:
+            Tests that only the most recently decoded entity instances are kept
+            and the entity instances are decoded again after the model is closed.
+
+        Under Test:
+            * ``LazyStepModel.close``
+            * implicit: ``LazyStepModel._decode``
+
+        Given:
+            * decoded values size: 2
+            * STEP file: a wall and a property set with two properties
+
+        Expected:
+            The two most recently decoded entity instances,
+            the attributes are decoded again after closing the model,
+            the STEP file is not mapped after decoding them"""
+        with mock.patch.object(step, "DECODED_VALUES_SIZE", 2):
+            wall = self.model.by_id(30)
+            self.assertEqual("SOLIDWALL", wall.PredefinedType)
+            for ifc_property in self.model.by_id(20).HasProperties:
+                self.assertIsNotNone(ifc_property.NominalValue)
+            self.assertEqual([21, 22], list(self.model._values))  # pylint: disable=protected-access
+            self.model.close()
+            self.assertEqual({}, self.model._values)  # pylint: disable=protected-access
+            self.assertEqual("Wall 'A'; #99=IFCDOOR(", wall.Name)
+            self.assertTrue(repr(wall).startswith("#30=IfcWall('2O2Fr$t4X7Zf8NOew3FNr2'"))
+            self.assertTrue(self.model.data.closed)
+
+    def test_text_like_ifcopenshell(self):
+        """Tests ``LazyStepModel.text`` against the entity instances of ifcopenshell.
+
+        Test-Purpose:
+            Tests that the entity instances are written like by ifcopenshell,
+            so the messages of both model backends are the same.
+
+        Under Test:
+            * ``LazyStepModel.text``
+            * ``format_real``
+
+        Given:
+            * STEP file: points and a typed value of reals not written
+              in their shortest digits, in exponent notation and without fraction,
+              an integer with a sign, a string with escapes
+
+        Expected:
+            The same text of each entity instance as of ifcopenshell"""
+        entities = (
+            "#50=IFCCARTESIANPOINT((0.7499999999999985,2.199999999999996,-0.0));\n"
+            "#51=IFCCARTESIANPOINT((1.5E20,1.0E15,100.,0.00001,1.E-7));\n"
+            "#52=IFCCARTESIANPOINT((123456789012345678.,12345678901234567890.,0.5E0));\n"
+            "#53=IFCPROPERTYSINGLEVALUE('H\\X2\\00F6\\X0\\he ''A''',$,IFCINTEGER(+7),"
+            "IFCREAL(3.14159E+00));\n")
+        ifc_file = os.path.join(self.directory.name, "reals.ifc")
+        with open(ifc_file, "w", encoding="latin-1") as step_file:
+            step_file.write(STEP_FILE.replace("DATA;\n", "DATA;\n" + entities))
+        model = LazyStepModel(ifc_file)
+        try:
+            ifcopenshell_model = ifcopenshell.open(ifc_file)
+            for entity_id in (22, 50, 51, 52, 53):
+                self.assertEqual(str(ifcopenshell_model.by_id(entity_id)),
+                                 repr(model.by_id(entity_id)))
+        finally:
+            model.close()
+
+    def test_inverse_attributes(self):
+        """Tests ``LazyEntity`` on the inverse attributes.
+
+        Test-Purpose:
+            Tests that the inverse attributes are resolved by the inverse tables.
+
+        Under Test:
+            * ``LazyStepModel.inverse``
+
+        Given:
+            * STEP file: a relation defining both walls by a property set
+
+        Expected:
+            The relation in the inverse attribute `IsDefinedBy` of both walls"""
+        for wall in self.model.by_type("IfcWall"):
+            self.assertEqual((self.model.by_id(40),), wall.IsDefinedBy)
+        self.assertEqual((), self.model.by_id(30).IsTypedBy)
+        self.assertEqual(
+            "#21=IfcPropertySingleValue('IsExternal',$,IfcBoolean(.T.),$)",
+            repr(self.model.by_id(21)))
+
+    def test_decode_string(self):
+        """Tests ``decode_string`` on the escape sequences of STEP strings.
+
+        Test-Purpose:
+            Tests that the escape sequences of STEP strings get decoded.
+
+        Under Test:
+            * ``decode_string``
+
+        Given:
+            * strings: escaped quotes, backslashes and unicode characters
+
+        Expected:
+            The decoded strings"""
+        self.assertEqual("it's", decode_string(b"it''s"))
+        self.assertEqual("a\\b", decode_string(b"a\\\\b"))
+        self.assertEqual("Wärme", decode_string(b"W\\X2\\00E4\\X0\\rme"))
+        self.assertEqual("Wärme", decode_string(b"W\\X\\E4rme"))
+        self.assertEqual("Wärme", decode_string(b"W\\S\\drme"))
@@ -5,6 +5,7 @@ from HtmlTestRunner import HTMLTestRunner
 from tests.constraint_checks.equals_test import TestEqualsCheck
 from tests.constraint_checks.exists_test import TestExistsCheck
 from tests.constraint_checks.in_test import TestInCheck
+from tests.constraint_checks.in_file_test import TestInFileCheck
 from tests.constraint_checks.not_test import TestNotCheck
 from tests.constraint_checks.type_test import TestTypeCheck
 
@@ -18,6 +19,31 @@ from tests.path_operators.filter_type_test import TestFilterType
 from tests.path_operators.get_attribute_test import TestGetAttribute
 from tests.path_operators.get_list_test import TestGetList
 
+from tests.backends.model_backend_test import TestModelBackend
+from tests.bitmaps.result_bitmap_test import TestResultBitmap
+from tests.definitions.intern_definition_test import TestInternDefinition
+from tests.planner.validation_plan_test import TestValidationPlan
+from tests.columns.constraint_column_test import TestConstraintColumn
+from tests.report_columns.columnar_report_test import TestColumnarReport
+from tests.report.junit_report_test import TestJUnitReport
+from tests.rules.report_level_test import TestReportLevel
+from tests.rules.early_termination_test import TestEarlyTermination
+from tests.rules.validate_files_test import TestValidateFiles
+from tests.rules.threaded_validation_test import TestThreadedValidation
+from tests.sampling.sampling_test import TestSampling
+from tests.step.lazy_step_model_test import TestLazyStepModel
+from tests.snapshot.snapshot_test import TestSnapshot
+from tests.shared_model.shared_model_test import TestSharedModel
+from tests.scheduling.schedule_test import TestSchedule
+from tests.service.service_test import TestValidationService
+from tests.batch.batch_test import TestBatch
+from tests.command_line.command_line_test import TestCommandLine
+from tests.report.json_report_test import TestJsonReport
+
+from tests.instance_filters.attribute_test import TestAttributeInstanceFilter
+from tests.instance_filters.containment_test import TestContainmentInstanceFilter
+from tests.instance_filters.typed_by_test import TestTypeInstanceFilter
+
 
 constraint_tests = TestLoader().loadTestsFromTestCase(
     TestConstraint)
@@ -31,6 +57,8 @@ exist_tests = TestLoader().loadTestsFromTestCase(
     TestExistsCheck)
 in_tests = TestLoader().loadTestsFromTestCase(
     TestInCheck)
+in_file_tests = TestLoader().loadTestsFromTestCase(
+    TestInFileCheck)
 not_tests = TestLoader().loadTestsFromTestCase(
     TestNotCheck)
 type_tests = TestLoader().loadTestsFromTestCase(
@@ -49,9 +77,88 @@ get_list_tests = TestLoader().loadTestsFromTestCase(
     TestGetList
 )
 
+result_bitmap_tests = TestLoader().loadTestsFromTestCase(
+    TestResultBitmap
+)
+constraint_column_tests = TestLoader().loadTestsFromTestCase(
+    TestConstraintColumn
+)
+columnar_report_tests = TestLoader().loadTestsFromTestCase(
+    TestColumnarReport
+)
+junit_report_tests = TestLoader().loadTestsFromTestCase(
+    TestJUnitReport
+)
+report_level_tests = TestLoader().loadTestsFromTestCase(
+    TestReportLevel
+)
+early_termination_tests = TestLoader().loadTestsFromTestCase(
+    TestEarlyTermination
+)
+sampling_tests = TestLoader().loadTestsFromTestCase(
+    TestSampling
+)
+lazy_step_model_tests = TestLoader().loadTestsFromTestCase(
+    TestLazyStepModel
+)
+model_backend_tests = TestLoader().loadTestsFromTestCase(
+    TestModelBackend
+)
+snapshot_tests = TestLoader().loadTestsFromTestCase(
+    TestSnapshot
+)
+intern_definition_tests = TestLoader().loadTestsFromTestCase(
+    TestInternDefinition
+)
+validation_plan_tests = TestLoader().loadTestsFromTestCase(
+    TestValidationPlan
+)
+validate_files_tests = TestLoader().loadTestsFromTestCase(
+    TestValidateFiles
+)
+threaded_validation_tests = TestLoader().loadTestsFromTestCase(
+    TestThreadedValidation
+)
+shared_model_tests = TestLoader().loadTestsFromTestCase(
+    TestSharedModel
+)
+schedule_tests = TestLoader().loadTestsFromTestCase(
+    TestSchedule
+)
+validation_service_tests = TestLoader().loadTestsFromTestCase(
+    TestValidationService
+)
+batch_tests = TestLoader().loadTestsFromTestCase(
+    TestBatch
+)
+command_line_tests = TestLoader().loadTestsFromTestCase(
+    TestCommandLine
+)
+json_report_tests = TestLoader().loadTestsFromTestCase(
+    TestJsonReport
+)
+
+attribute_instance_filter_tests = TestLoader().loadTestsFromTestCase(
+    TestAttributeInstanceFilter
+)
+containment_instance_filter_tests = TestLoader().loadTestsFromTestCase(
+    TestContainmentInstanceFilter
+)
+type_instance_filter_tests = TestLoader().loadTestsFromTestCase(
+    TestTypeInstanceFilter
+)
+
 suite = TestSuite([constraint_tests, and_tests, or_tests, set_tests,
-                   equals_tests, exist_tests, in_tests, not_tests, type_tests,
-                   filter_attribute_tests, filter_type_tests, get_attribute_tests, get_list_tests])
+                   equals_tests, exist_tests, in_tests, in_file_tests, not_tests, type_tests,
+                   filter_attribute_tests, filter_type_tests, get_attribute_tests, get_list_tests,
+                   attribute_instance_filter_tests, containment_instance_filter_tests,
+                   type_instance_filter_tests, result_bitmap_tests, constraint_column_tests,
+                   columnar_report_tests, junit_report_tests, report_level_tests,
+                   early_termination_tests, sampling_tests, lazy_step_model_tests,
+                   model_backend_tests, snapshot_tests, intern_definition_tests,
+                   validation_plan_tests, validate_files_tests, threaded_validation_tests,
+                   shared_model_tests, schedule_tests, validation_service_tests,
+                   batch_tests, command_line_tests, json_report_tests])
 
 runner = HTMLTestRunner(
     report_title="IFC Data Checker Unit Testing",